@@ -1,4 +1,9 @@
+import argparse
+import asyncio
 import os
+import time
+import httpx
+import litellm
 from dotenv import load_dotenv
 from agents import Agent, Runner
 from agents.extensions.models.litellm_model import LitellmModel
@@ -6,31 +11,149 @@ from agents.extensions.models.litellm_model import LitellmModel
 load_dotenv()
 mistral_api_key = os.getenv("MISTRAL_API_KEY")
 
+# Conversation items carried into each debater call besides the opening message.
+# Older items are dropped so a call's input stays the same size however many rounds are run.
+MAX_CARRIED_ITEMS = int(os.getenv("AGENTS_MAX_CARRIED_ITEMS", "4"))
+
+# One model (and so one LiteLLM client) for all agents
+model = LitellmModel(model='mistral/mistral-large-latest', api_key=mistral_api_key)
+
 agent1 = Agent(
     name="Debater 1",
     instructions="You are a debate agent. Respond in a very concise manner. The shorter the better.",
-    model=LitellmModel(model='mistral/mistral-large-latest', api_key=mistral_api_key),
+    model=model,
 )
 
 agent2 = Agent(
-    name="Debater 2", 
+    name="Debater 2",
     instructions="You are a debate agent. Respond in a very concise manner. The shorter the better.",
-    model=LitellmModel(model='mistral/mistral-large-latest', api_key=mistral_api_key),
+    model=model,
 )
 
 judge = Agent(
-    name="Judge", 
+    name="Judge",
     instructions="You are a debate judge. Respond in a very concise manner. The shorter the better.",
-    model=LitellmModel(model='mistral/mistral-large-latest', api_key=mistral_api_key),
+    model=model,
 )
 
-response1 = Runner.run_sync(agent1, input="You are debating 'Cats vs. Dogs'. Provide a single argument why Cats are better.")
-print(f"{agent1.name}: {response1.final_output}")
+def trim_input(conversation, keep=MAX_CARRIED_ITEMS):
+    """The opening message plus the last ``keep`` items"""
+    if len(conversation) <= keep + 1:
+        return conversation
+    return conversation[:1] + conversation[-keep:]
+
+def debater_input(conversation, point):
+    return trim_input(conversation) + [{"content": f"Provide a single argument why {point}.", "role": "user"}]
+
+def judge_input(topic, arguments):
+    """The judge gets every argument's text, not the carried input list"""
+    transcript = "\n".join(f"{speaker}: {text}" for speaker, text in arguments)
+    return [{"content": f"You are judging the debate '{topic}'.\n{transcript}\n"
+                        f"What side provided the better argument? Respond with 'side_a' or 'side_b'.", "role": "user"}]
+
+def debate_turns(topic="Cats vs. Dogs", side_a_point="Cats are better", side_b_point="Dogs are better", rounds=1):
+    """Run the debate, yielding (speaker, text) for each argument and the verdict.
+
+    Each debater sees the opening message and the most recent conversation items.
+    """
+    conversation = [{"content": f"You are debating '{topic}'.", "role": "user"}]
+    arguments = []
+    for _ in range(rounds):
+        for speaker, agent, point in (("side_a", agent1, side_a_point), ("side_b", agent2, side_b_point)):
+            response = Runner.run_sync(agent, input=debater_input(conversation, point))
+            conversation = response.to_input_list()
+            arguments.append((speaker, response.final_output))
+            yield speaker, response.final_output
+
+    response = Runner.run_sync(judge, input=judge_input(topic, arguments))
+    yield "judge", response.final_output
+
+def add_usage(totals, result):
+    usage = result.context_wrapper.usage
+    totals["requests"] += usage.requests
+    totals["input_tokens"] += usage.input_tokens
+    totals["output_tokens"] += usage.output_tokens
+
+async def arun_debate(topic, side_a_point, side_b_point, rounds=1, semaphore=None):
+    """One debate on the running event loop; returns its turns, verdict, token usage and latency.
+
+    ``semaphore`` bounds how many model calls are in flight across all debates.
+    """
+    semaphore = semaphore or asyncio.Semaphore(1)
+    start = time.perf_counter()
+    usage = {"requests": 0, "input_tokens": 0, "output_tokens": 0}
+    turn_latencies = []
+
+    async def run(agent, agent_input):
+        async with semaphore:
+            turn_start = time.perf_counter()
+            result = await Runner.run(agent, input=agent_input)
+            turn_latencies.append(time.perf_counter() - turn_start)
+        add_usage(usage, result)
+        return result
+
+    conversation = [{"content": f"You are debating '{topic}'.", "role": "user"}]
+    arguments = []
+    for _ in range(rounds):
+        for speaker, agent, point in (("side_a", agent1, side_a_point), ("side_b", agent2, side_b_point)):
+            result = await run(agent, debater_input(conversation, point))
+            conversation = result.to_input_list()
+            arguments.append((speaker, result.final_output))
+
+    result = await run(judge, judge_input(topic, arguments))
+    return {
+        "topic": topic,
+        "turns": arguments,
+        "verdict": result.final_output,
+        "usage": usage,
+        "latency": time.perf_counter() - start,
+        "turn_latencies": turn_latencies,
+    }
+
+async def run_debates(matchups, rounds=1, concurrency=8, max_connections=20):
+    """Run many debates concurrently, printing each one's usage and latency as it finishes"""
+    # Shared connection pool for every LiteLLM request made on this loop
+    litellm.aclient_session = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(arun_debate(topic, a, b, rounds, semaphore)) for topic, a, b in matchups]
+    results = []
+    try:
+        for finished in asyncio.as_completed(tasks):
+            try:
+                result = await finished
+            except Exception as e:
+                print(f"❌ Debate failed: {e}")
+                continue
+            results.append(result)
+            usage = result["usage"]
+            average_turn = sum(result["turn_latencies"]) / len(result["turn_latencies"])
+            print(f"🏁 {result['topic']}: {result['latency']:.1f}s total, {average_turn:.2f}s per call, "
+                  f"{usage['requests']} requests, {usage['input_tokens']} in / {usage['output_tokens']} out tokens")
+            print(f"   ⚖️ {result['verdict']}")
+    finally:
+        await litellm.aclient_session.aclose()
+        litellm.aclient_session = None
 
-response2 = Runner.run_sync(agent2, input=response1.to_input_list()+[{"content":"Provide a single argument why Dogs are better.", "role": "user"}])
-print(f"{agent2.name}: {response2.final_output}")
+    wall = time.perf_counter() - start
+    tokens = sum(r["usage"]["input_tokens"] + r["usage"]["output_tokens"] for r in results)
+    print(f"\n📊 {len(results)}/{len(matchups)} debates in {wall:.1f}s "
+          f"({len(results) / wall if wall else 0:.2f} debates/s), {tokens} tokens")
+    return results
 
-response3 = Runner.run_sync(judge, input=response2.to_input_list()+[{"content":"What side provided the better argument? Respond with 'Cats' or 'Dogs'.", "role": "user"}])
-print(f"{judge.name}: {response3.final_output}")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Agents SDK debate")
+    parser.add_argument("--concurrent", type=int, metavar="N", help="Run N debates concurrently with the async runner")
+    parser.add_argument("--rounds", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum model calls in flight")
+    args = parser.parse_args()
 
-print(response3.final_output)
+    if args.concurrent:
+        matchups = [("Cats vs. Dogs", "Cats are better", "Dogs are better")] * args.concurrent
+        asyncio.run(run_debates(matchups, args.rounds, args.concurrency))
+    else:
+        names = {"side_a": agent1.name, "side_b": agent2.name, "judge": judge.name}
+        for speaker, text in debate_turns(rounds=args.rounds):
+            print(f"{names[speaker]}: {text}")
@@ -1,4 +1,8 @@
+import argparse
 import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from agno.agent import Agent, RunResponse
 from agno.models.mistral import MistralChat
@@ -6,59 +10,153 @@ from agno.storage.sqlite import SqliteStorage
 from agno.memory.v2.db.sqlite import SqliteMemoryDb
 from agno.memory.v2.memory import Memory
 from dotenv import load_dotenv
+from sqlalchemy import create_engine, event
 
 load_dotenv()
 mistral_api_key = os.getenv("MISTRAL_API_KEY")
 
+STORAGE_FILE = "tmp/agent_storage.db"
+
+# "deferred": session summaries are made in the background once the debate is over (default)
+# "inline": Agno makes one after every response, on the critical path
+# "off": no summaries
+SUMMARY_MODE = os.getenv("AGNO_SUMMARY_MODE", "deferred")
+SUMMARY_MODES = ["deferred", "inline", "off"]
+
+def create_storage_engine(db_file=STORAGE_FILE):
+    """SQLite engine in WAL mode, so concurrent debates don't serialize on one lock.
+
+    Readers no longer block the writer, and a writer that finds the
+    database busy waits instead of failing with "database is locked".
+    """
+    os.makedirs(os.path.dirname(db_file), exist_ok=True)
+    engine = create_engine(f"sqlite:///{db_file}", connect_args={"timeout": 30, "check_same_thread": False})
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")  # fsync at checkpoints, not on every commit
+        cursor.execute("PRAGMA busy_timeout=30000")
+        cursor.close()
+
+    return engine
+
 # Create agent storage
 agent_storage = SqliteStorage(
     table_name="agent_sessions",
-    db_file="tmp/agent_storage.db"
+    db_engine=create_storage_engine()
 )
 
-agent1 = Agent(
-    model=MistralChat(
-        id="mistral-large-latest",
-        api_key=mistral_api_key,
-    ),
-    storage=agent_storage,
-    enable_session_summaries=True,
-    session_id="debate_1",
-    agent_id="agent1",
-    context="You are a debate agent. Respond in a very concise manner. The shorter the better.",
-    add_history_to_messages=True,
-    num_history_responses=3,
-)
+# Background session summaries; a small pool batches them across debates
+summary_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="agno-summary")
+pending_summaries = []
 
-agent2 = Agent(
-    model=MistralChat(
-        id="mistral-large-latest",
-        api_key=mistral_api_key,
-    ),
-    storage=agent_storage,
-    enable_session_summaries=True,
-    session_id="debate_1",
-    agent_id="agent2",
-    context="You are a debate agent. Respond in a very concise manner. The shorter the better.",
-    add_history_to_messages=True,
-    num_history_responses=3,
-)
+def create_agent(agent_id, context, session_id="debate_1", summary_mode=SUMMARY_MODE):
+    return Agent(
+        model=MistralChat(
+            id="mistral-large-latest",
+            api_key=mistral_api_key,
+        ),
+        storage=agent_storage,
+        enable_session_summaries=summary_mode == "inline",
+        # Storage keys sessions by id, so each agent needs its own
+        session_id=f"{session_id}_{agent_id}",
+        agent_id=agent_id,
+        context=context,
+        add_history_to_messages=True,
+        num_history_responses=3,
+    )
 
-judge = Agent(
-    model=MistralChat(
-        id="mistral-large-latest",
-        api_key=mistral_api_key,
-    ),
-    storage=agent_storage,
-    enable_session_summaries=True,
-    session_id="debate_1",
-    agent_id="judge",
-    context="You are a debate judge. Respond in a very concise manner. The shorter the better.",
-    add_history_to_messages=True,
-    num_history_responses=3,
-)
+def summarize_session(agent):
+    """Create an agent's session summary and store it with the session"""
+    agent.memory.create_session_summary(session_id=agent.session_id, user_id=agent.user_id)
+    agent.write_to_storage(session_id=agent.session_id, user_id=agent.user_id)
+    return agent.agent_id
+
+def schedule_summaries(agents):
+    futures = [summary_executor.submit(summarize_session, agent) for agent in agents]
+    pending_summaries.extend(futures)
+    return futures
+
+def wait_for_summaries():
+    """Block until all background summaries are stored. Returns the number that failed"""
+    done, _ = wait(pending_summaries)
+    pending_summaries.clear()
+    failed = 0
+    for future in done:
+        if future.exception() is not None:
+            failed += 1
+            print(f"⚠️ Session summary failed: {future.exception()}")
+    return failed
+
+def debate_turns(topic="Cats vs. Dogs", side_a_point="Cats are better", side_b_point="Dogs are better", rounds=1, session_id="debate_1", summary_mode=SUMMARY_MODE):
+    """Run the debate, yielding (speaker, text) for each argument and the verdict"""
+    agent1 = create_agent("agent1", "You are a debate agent. Respond in a very concise manner. The shorter the better.", session_id, summary_mode)
+    agent2 = create_agent("agent2", "You are a debate agent. Respond in a very concise manner. The shorter the better.", session_id, summary_mode)
+    judge = create_agent("judge", "You are a debate judge. Respond in a very concise manner. The shorter the better.", session_id, summary_mode)
+
+    transcript = []
+    for _ in range(rounds):
+        for speaker, agent, point in (("side_a", agent1, side_a_point), ("side_b", agent2, side_b_point)):
+            prompt = f"You are debating '{topic}'. Provide a single argument why {point}."
+            if transcript:
+                prompt += f"\nYour opponent just said: {transcript[-1][1]}"
+            response: RunResponse = agent.run(prompt)
+            transcript.append((speaker, response.content))
+            yield speaker, response.content
+
+    arguments = "\n".join(f"{speaker}: {text}" for speaker, text in transcript)
+    response = judge.run(
+        f"Debate on '{topic}' (side_a: {side_a_point}; side_b: {side_b_point}).\n{arguments}\n"
+        f"What side provided the better argument? Respond with 'side_a' or 'side_b'."
+    )
+    if summary_mode == "deferred":
+        schedule_summaries([agent1, agent2, judge])
+    yield "judge", response.content
+
+def benchmark(modes=("inline", "deferred", "off"), debates=3, rounds=1, concurrency=1):
+    """Per-turn latency for each summary mode, optionally with debates running concurrently"""
+
+    def run_one(mode, index):
+        session_id = f"bench_{mode}_{index}_{time.time_ns()}"
+        latencies = []
+        last = time.perf_counter()
+        for _ in debate_turns(rounds=rounds, session_id=session_id, summary_mode=mode):
+            now = time.perf_counter()
+            latencies.append(now - last)
+            last = now
+        return latencies
+
+    print(f"\n⏱️ AGNO TURN LATENCY ({debates} debates, {rounds} rounds, {concurrency} concurrent):")
+    print(f"{'='*72}")
+    for mode in modes:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(lambda index: run_one(mode, index), range(debates)))
+        wall = time.perf_counter() - start
+        summary_start = time.perf_counter()
+        failed = wait_for_summaries()
+        summary_wait = time.perf_counter() - summary_start
+
+        latencies = sorted(latency * 1000 for debate in results for latency in debate)
+        p90 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.9))]
+        print(f"{mode:<9} {len(latencies):>3} turns  p50 {statistics.median(latencies):7.0f} ms  "
+              f"p90 {p90:7.0f} ms  max {latencies[-1]:7.0f} ms  wall {wall:6.1f}s  "
+              f"background summaries +{summary_wait:.1f}s" + (f" ({failed} failed)" if failed else ""))
 
-agent1.print_response(f"You are debating 'Cats vs. Dogs'. Provide a single argument why Cats are better.")
-agent2.print_response(f"You are debating 'Cats vs. Dogs'. Provide a single argument why Dogs are better.")
-judge.print_response(f"What side provided the better argument? Respond with 'Cats' or 'Dogs'.")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Agno debate")
+    parser.add_argument("--summaries", choices=SUMMARY_MODES, default=SUMMARY_MODE)
+    parser.add_argument("--benchmark", action="store_true", help="Compare per-turn latency with summaries inline, deferred and off")
+    parser.add_argument("--debates", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=1)
+    args = parser.parse_args()
 
+    if args.benchmark:
+        benchmark(debates=args.debates, rounds=args.rounds, concurrency=args.concurrency)
+    else:
+        for speaker, text in debate_turns(rounds=args.rounds, summary_mode=args.summaries):
+            print(f"{speaker}: {text}\n")
+        wait_for_summaries()
@@ -1,13 +1,25 @@
 import argparse
+import asyncio
+import json
+import logging
+import os
+import socket
+import statistics
 import sys
+import threading
+import time
 from functools import partial
 from typing import Optional
 
 from dotenv import load_dotenv
 
+from livekit import rtc
 from livekit.agents import (
     AutoSubscribe,
     JobContext,
+    JobExecutorType,
+    JobProcess,
+    JobRequest,
     RoomOutputOptions,
     WorkerOptions,
     WorkerType,
@@ -16,12 +28,128 @@ from livekit.agents import (
 from livekit.agents.voice import Agent, AgentSession
 from livekit.plugins import bey, openai
 
+logger = logging.getLogger("bey-avatar-agent")
+
+# Rooms one worker process serves at once; the load reported to the dispatcher is the fraction in use.
+# The avatar video is rendered by Beyond Presence, so a room costs this process mostly network I/O.
+MAX_ROOMS = int(os.getenv("AVATAR_MAX_ROOMS", "4"))
+
+UPSTREAM_HOSTS = ["api.openai.com", "api.bey.dev"]
+
+# One JSON line per job with its startup timings (seconds after the job was accepted)
+LATENCY_LOG = os.getenv("AVATAR_LATENCY_LOG", "avatar_latency.jsonl")
+FIRST_FRAME_TIMEOUT = 60
+
+_accepted_at = {}
+_prewarm_lock = threading.Lock()
+_prewarmed = {}
+_log_lock = threading.Lock()
+# Strong references to fire-and-forget tasks; the event loop only keeps weak ones
+_background_tasks = set()
+
+
+def prewarm(proc: JobProcess) -> None:
+    """Runs before any job is assigned, so none of this is on a caller's critical path.
+
+    Checks the upstream credentials, resolves the upstream hosts and
+    builds the realtime model that every job's agent session then reuses
+    (each session opens its own realtime connection from it). With the
+    thread executor all rooms of a process share this work.
+    """
+    with _prewarm_lock:
+        if not _prewarmed:
+            start = time.perf_counter()
+            for key in ("OPENAI_API_KEY", "BEY_API_KEY", "LIVEKIT_URL"):
+                if not os.getenv(key):
+                    logger.warning(f"{key} is not set")
+            for host in UPSTREAM_HOSTS:
+                try:
+                    socket.getaddrinfo(host, 443, proto=socket.IPPROTO_TCP)
+                except OSError as e:
+                    logger.warning(f"could not resolve {host}: {e}")
+            _prewarmed["realtime_model"] = openai.realtime.RealtimeModel(voice="ash")
+            _prewarmed["seconds"] = time.perf_counter() - start
+            logger.info(f"prewarmed in {_prewarmed['seconds'] * 1000:.0f} ms")
+    proc.userdata["realtime_model"] = _prewarmed["realtime_model"]
+    proc.userdata["prewarm_seconds"] = _prewarmed["seconds"]
+
+
+async def request_fnc(req: JobRequest) -> None:
+    _accepted_at[req.id] = time.time()
+    await req.accept()
+
+
+def room_load(worker) -> float:
+    """Fraction of this process's room slots in use"""
+    return min(len(worker.active_jobs) / MAX_ROOMS, 1.0)
+
+
+def watch_first_frame(room: rtc.Room, marks: dict, mark) -> asyncio.Future:
+    """Resolve once the first avatar video frame arrives.
+
+    The agent only subscribes to audio, so the avatar's video track is
+    subscribed just long enough to receive one frame.
+    """
+    first_frame = asyncio.get_running_loop().create_future()
+
+    async def read_first_frame(track, publication):
+        stream = rtc.VideoStream(track)
+        try:
+            async for _ in stream:
+                mark("first_avatar_frame")
+                break
+        finally:
+            await stream.aclose()
+            publication.set_subscribed(False)
+            if not first_frame.done():
+                first_frame.set_result(None)
+
+    @room.on("track_published")
+    def on_track_published(publication, participant):
+        if publication.kind == rtc.TrackKind.KIND_VIDEO and not first_frame.done():
+            mark("avatar_track_published")
+            publication.set_subscribed(True)
+
+    @room.on("track_subscribed")
+    def on_track_subscribed(track, publication, participant):
+        if track.kind == rtc.TrackKind.KIND_VIDEO and "first_avatar_frame" not in marks:
+            task = asyncio.create_task(read_first_frame(track, publication))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+
+    return first_frame
+
+
+async def report_latency(job_id: str, marks: dict, first_frame: asyncio.Future) -> None:
+    try:
+        await asyncio.wait_for(first_frame, FIRST_FRAME_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning(f"no avatar frame within {FIRST_FRAME_TIMEOUT}s", extra={"job_id": job_id})
+    record = {"job_id": job_id, "timestamp": time.time(), **marks}
+    with _log_lock:
+        with open(LATENCY_LOG, "a") as f:
+            f.write(json.dumps(record) + "\n")
+    if "first_avatar_frame" in marks:
+        logger.info(f"accept -> first avatar frame: {marks['first_avatar_frame'] * 1000:.0f} ms", extra={"job_id": job_id})
+
 
 async def entrypoint(ctx: JobContext, avatar_id: Optional[str]) -> None:
+    accepted_at = _accepted_at.pop(ctx.job.id, time.time())
+    marks = {}
+
+    def mark(name):
+        marks.setdefault(name, round(time.time() - accepted_at, 4))
+
+    mark("entrypoint")
+    first_frame = watch_first_frame(ctx.room, marks, mark)
+
     await ctx.connect(auto_subscribe=AutoSubscribe.AUDIO_ONLY)
+    mark("room_connected")
 
+    # The model built in prewarm; only built here if the worker skipped prewarming
+    realtime_model = ctx.proc.userdata.get("realtime_model") or openai.realtime.RealtimeModel(voice="ash")
     local_agent_session = AgentSession(
-        llm=openai.realtime.RealtimeModel(voice="ash")
+        llm=realtime_model
     )
 
     if avatar_id is not None:
@@ -29,6 +157,7 @@ async def entrypoint(ctx: JobContext, avatar_id: Optional[str]) -> None:
     else:
         bey_avatar_session = bey.AvatarSession()
     await bey_avatar_session.start(local_agent_session, room=ctx.room)
+    mark("avatar_session_started")
 
     await local_agent_session.start(
         agent=Agent(instructions="Talk to me!"),
@@ -36,6 +165,27 @@ async def entrypoint(ctx: JobContext, avatar_id: Optional[str]) -> None:
         # audio is forwarded to the avatar, so we disable room audio output
         room_output_options=RoomOutputOptions(audio_enabled=False),
     )
+    mark("agent_session_started")
+
+    task = asyncio.create_task(report_latency(ctx.job.id, marks, first_frame))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def print_latency_report(path: str = LATENCY_LOG) -> None:
+    """Percentiles of each startup step over all logged jobs"""
+    with open(path, "r") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    steps = ["entrypoint", "room_connected", "avatar_session_started", "agent_session_started",
+             "avatar_track_published", "first_avatar_frame"]
+    print(f"\n⏱️ JOB ACCEPT -> STEP LATENCY ({len(records)} jobs, ms):")
+    print(f"{'='*60}")
+    for step in steps:
+        values = sorted(record[step] * 1000 for record in records if step in record)
+        if not values:
+            continue
+        p90 = values[min(len(values) - 1, int(len(values) * 0.9))]
+        print(f"{step:<24} n={len(values):<4} p50 {statistics.median(values):7.0f}  p90 {p90:7.0f}  max {values[-1]:7.0f}")
 
 
 if __name__ == "__main__":
@@ -43,12 +193,27 @@ if __name__ == "__main__":
 
     parser = argparse.ArgumentParser(description="Run a LiveKit agent with Bey avatar.")
     parser.add_argument("--avatar-id", type=str, help="Avatar ID to use.")
-    args = parser.parse_args()
+    parser.add_argument("--mode", choices=["dev", "start"], default="dev",
+                        help="dev: development worker with reload; start: production worker")
+    parser.add_argument("--agent-name", type=str, help="Only take explicitly dispatched jobs for this agent name.")
+    parser.add_argument("--report", action="store_true", help="Print startup latency percentiles from the latency log.")
+    args, livekit_args = parser.parse_known_args()
+
+    if args.report:
+        print_latency_report()
+        sys.exit(0)
 
-    sys.argv = [sys.argv[0], "dev"]  # overwrite args for the LiveKit CLI
+    sys.argv = [sys.argv[0], args.mode] + livekit_args  # remaining args go to the LiveKit CLI
     cli.run_app(
         WorkerOptions(
             entrypoint_fnc=partial(entrypoint, avatar_id=args.avatar_id),
+            request_fnc=request_fnc,
+            prewarm_fnc=prewarm,
             worker_type=WorkerType.ROOM,
+            # Rooms run as threads of one process, sharing the prewarmed state
+            job_executor_type=JobExecutorType.THREAD,
+            load_fnc=room_load,
+            load_threshold=1.0,
+            agent_name=args.agent_name or "",
         )
-    )
\ No newline at end of file
+    )
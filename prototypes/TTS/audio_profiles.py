@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Audio Output Profiles
+Named ElevenLabs output formats per use, plus per-profile transfer statistics; shared by every prototype that speaks
+"""
+
+import os
+import threading
+import time
+
+# kbps is used to pace playback and estimate bandwidth; mimetypes come from the TTS backend (tts.mimetype)
+AUDIO_PROFILES = {
+    "archive": {"output_format": "mp3_44100_192", "kbps": 192},
+    "standard": {"output_format": "mp3_44100_128", "kbps": 128},
+    "stream": {"output_format": "mp3_22050_32", "kbps": 32},
+    "opus": {"output_format": "opus_48000_32", "kbps": 32},
+}
+
+def get_profile(name=None, env_var=None, default="standard"):
+    """Resolve a profile by name, else from ``env_var``, else ``default``"""
+    name = (name or (os.getenv(env_var) if env_var else None) or default).lower()
+    if name not in AUDIO_PROFILES:
+        raise ValueError(f"Unknown audio profile: {name} (choose from {', '.join(AUDIO_PROFILES)})")
+    return dict(AUDIO_PROFILES[name], name=name)
+
+def bytes_per_second(profile):
+    return profile["kbps"] * 1000 // 8
+
+class TransferStats:
+    """Bytes received and time-to-first-byte per profile (thread-safe)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.profiles = {}
+
+    def record(self, profile_name, nbytes, ttfb=None, cached=False):
+        with self.lock:
+            stats = self.profiles.setdefault(profile_name, {"requests": 0, "cached": 0, "bytes": 0, "ttfb": []})
+            stats["requests"] += 1
+            stats["bytes"] += nbytes
+            if cached:
+                stats["cached"] += 1
+            elif ttfb is not None:
+                stats["ttfb"].append(ttfb)
+
+    def measure(self, chunks, profile_name, start=None):
+        """Pass audio chunks through, recording bytes and time to the first one.
+
+        ``start`` should be taken just before the TTS request was made.
+        """
+        start = start if start is not None else time.perf_counter()
+        first_byte = None
+        total = 0
+        try:
+            for chunk in chunks:
+                if not isinstance(chunk, bytes):
+                    continue
+                if first_byte is None:
+                    first_byte = time.perf_counter() - start
+                total += len(chunk)
+                yield chunk
+        finally:
+            self.record(profile_name, total, first_byte)
+
+    def summary(self):
+        with self.lock:
+            result = {}
+            for name, stats in self.profiles.items():
+                ttfb = sorted(stats["ttfb"])
+                result[name] = {
+                    "requests": stats["requests"],
+                    "cached": stats["cached"],
+                    "bytes": stats["bytes"],
+                    "ttfb_ms_avg": round(sum(ttfb) / len(ttfb) * 1000, 1) if ttfb else None,
+                    "ttfb_ms_p50": round(ttfb[len(ttfb) // 2] * 1000, 1) if ttfb else None,
+                    "ttfb_ms_max": round(ttfb[-1] * 1000, 1) if ttfb else None,
+                }
+            return result
+
+    def print_report(self):
+        summary = self.summary()
+        if not summary:
+            return
+        print(f"\n📶 AUDIO TRANSFER BY PROFILE:")
+        print(f"{'='*40}")
+        for name, stats in summary.items():
+            ttfb = f"TTFB avg {stats['ttfb_ms_avg']} ms, max {stats['ttfb_ms_max']} ms" if stats["ttfb_ms_avg"] is not None else "no network requests"
+            print(f"{name:<9} {stats['requests']:>3} requests ({stats['cached']} from store), "
+                  f"{stats['bytes'] / 1024:8.1f} KB, {ttfb}")
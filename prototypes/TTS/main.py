@@ -1,32 +1,49 @@
 from dotenv import load_dotenv
-from elevenlabs.client import ElevenLabs
-from elevenlabs import play, stream
-import os
+from audio_profiles import get_profile
+from tts_backends import get_backend, play_clip, play_stream
+import sys
+import time
 
 load_dotenv()
 
-client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+# TTS_BACKEND picks the engine: elevenlabs, local (espeak-ng, offline) or auto (default)
+tts = get_backend()
 
-audio = client.text_to_speech.convert(
+# Output-format profile (audio_profiles.py); pick one with TTS_PROFILE (default: standard)
+try:
+    profile = get_profile(None, "TTS_PROFILE")
+except ValueError as e:
+    sys.exit(f"❌ TTS_PROFILE: {e}")
+output_format = tts.output_format(profile["output_format"])
+
+start = time.perf_counter()
+audio_stream = tts.stream(
     text="The first move is what sets everything in motion. What you do next is what determines the outcome.",
-    voice_id="JBFqnCBsd6RMkjVDRZzb",
-    model_id="eleven_multilingual_v2",
-    output_format="mp3_44100_128",
+    voice="george",
+    output_format=output_format,
 )
 
-play(audio)
+chunks = []
+ttfb = None
+for chunk in audio_stream:
+    if ttfb is None:
+        ttfb = time.perf_counter() - start
+    chunks.append(chunk)
+audio = b"".join(chunks)
+print(f"{tts.name} profile {profile['name']} ({output_format}): {len(audio)} bytes, TTFB {(ttfb or 0) * 1000:.0f} ms")
+
+play_clip(audio, output_format)
 
 # Uncomment the below code inorder to stream audio instead of converting the whole audio at once. 
-# audio_stream = client.text_to_speech.stream(
+# audio_stream = tts.stream(
 #     text="This is a test",
-#     voice_id="JBFqnCBsd6RMkjVDRZzb",
-#     model_id="eleven_multilingual_v2"
+#     voice="george",
+#     output_format=tts.output_format(get_profile("stream")["output_format"]),
 # )
 
 # # option 1: play the streamed audio locally
-# stream(audio_stream)
+# play_stream(audio_stream, tts.output_format(get_profile("stream")["output_format"]))
 
 # # option 2: process the audio bytes manually
 # for chunk in audio_stream:
-#     if isinstance(chunk, bytes):
-#         print(chunk)
\ No newline at end of file
+#     print(chunk)
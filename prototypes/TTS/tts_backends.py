@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+TTS Backends
+One speech synthesis interface over ElevenLabs and a local CPU engine, with a shared voice registry
+"""
+
+import io
+import os
+import shutil
+import subprocess
+import threading
+import wave
+
+# Every voice the prototypes use, with its ElevenLabs voice and the closest local (espeak-ng) voice
+VOICES = {
+    "rachel": {"label": "Rachel", "elevenlabs": "21m00Tcm4TlvDq8ikWAM", "local": "en-us+f3"},
+    "domi": {"label": "Domi", "elevenlabs": "AZnzlk1XvdvUeBnXmlld", "local": "en-us+m3"},
+    "bella": {"label": "Bella", "elevenlabs": "EXAVITQu4vr4xnSDxMaL", "local": "en-gb+f2"},
+    "antoni": {"label": "Antoni", "elevenlabs": "ErXwobaYiN019PkySvjV", "local": "en-gb+m2"},
+    "george": {"label": "George", "elevenlabs": "JBFqnCBsd6RMkjVDRZzb", "local": "en-gb+m1"},
+}
+
+# Debate roles (and the names each prototype uses for them) -> voice
+ROLES = {
+    "pro_debater": "rachel",
+    "con_debater": "domi",
+    "judge": "bella",
+    "narrator": "antoni",
+    "researcher": "antoni",
+    # langgraph API speakers
+    "side_a": "rachel",
+    "side_b": "domi",
+    # crewAI conversational debate agent roles
+    "Pro Debater": "rachel",
+    "Con Debater": "domi",
+    "Debate Judge": "bella",
+}
+
+FORMAT_MIMETYPES = {"mp3": "audio/mpeg", "opus": "audio/ogg", "wav": "audio/wav", "pcm": "audio/L16"}
+
+# Long-lived players that keep decoding one continuous (mp3) stream from stdin across clips
+STREAM_PLAYERS = {
+    "ffplay": ["ffplay", "-nodisp", "-loglevel", "quiet", "-i", "pipe:0"],
+    "mpv": ["mpv", "--no-video", "--really-quiet", "-"],
+    "mpg123": ["mpg123", "-q", "-"],
+}
+
+# Players for one complete clip or one stream, in order of preference, with the containers each
+# can play (None: any); aplay would play mp3 as noise
+CLIP_PLAYERS = {
+    "ffplay": (["ffplay", "-autoexit", "-nodisp", "-loglevel", "quiet", "-i", "pipe:0"], None),
+    "mpv": (["mpv", "--no-video", "--really-quiet", "-"], None),
+    "aplay": (["aplay", "-q", "-"], {"wav"}),
+}
+
+def resolve_voice(voice):
+    """Registry entry for a role or voice name, or None for a backend-native voice id"""
+    if voice in ROLES:
+        voice = ROLES[voice]
+    return VOICES.get(voice)
+
+def format_container(output_format):
+    """Container/codec part of an output format such as mp3_44100_128"""
+    return (output_format or "mp3").split("_")[0]
+
+def concatenable(output_format):
+    """Whether clips in this format can be appended into one playable stream (WAV clips can't)"""
+    return format_container(output_format) != "wav"
+
+class TTSBackend:
+    """Speech synthesis backend.
+
+    ``voice`` is a role (``judge``, ``side_a``...), a registry voice name, or
+    a voice id native to the backend. ``output_format`` uses ElevenLabs
+    names; ``output_format()`` maps a requested one to what the backend
+    will actually produce, which is what store keys and mimetypes should use.
+    """
+
+    name = None
+    model_id = None
+
+    def available(self):
+        return True
+
+    def voice_id(self, voice):
+        entry = resolve_voice(voice)
+        return entry[self.name] if entry else voice
+
+    def with_model(self, model_id):
+        """This backend using ``model_id``, where the backend has a choice of models"""
+        return self
+
+    def output_format(self, requested=None):
+        return requested or "mp3_44100_128"
+
+    def bytes_per_second(self, kbps):
+        """Playback rate of the audio produced when ``kbps`` was requested"""
+        return kbps * 1000 // 8
+
+    def mimetype(self, output_format=None):
+        return FORMAT_MIMETYPES.get(format_container(self.output_format(output_format)), "application/octet-stream")
+
+    def stream(self, text, voice, output_format=None):
+        """Yield audio chunks as they are produced"""
+        raise NotImplementedError
+
+    def synthesize(self, text, voice, output_format=None):
+        """The whole clip as bytes"""
+        return b"".join(self.stream(text, voice, output_format))
+
+    def synthesize_dialogue(self, inputs, output_format=None):
+        """Yield the audio of several ``{"text", "voice_id"}`` lines spoken in turn"""
+        for item in inputs:
+            yield self.synthesize(item["text"], item["voice_id"], output_format)
+
+class ElevenLabsBackend(TTSBackend):
+    name = "elevenlabs"
+
+    def __init__(self, api_key=None, model_id="eleven_multilingual_v2"):
+        self.api_key = api_key or os.getenv("ELEVENLABS_API_KEY")
+        self.model_id = model_id
+        self._client = None
+
+    def available(self):
+        try:
+            import elevenlabs  # noqa: F401
+        except ImportError:
+            return False
+        return bool(self.api_key)
+
+    @property
+    def client(self):
+        if self._client is None:
+            from elevenlabs.client import ElevenLabs
+            self._client = ElevenLabs(api_key=self.api_key)
+        return self._client
+
+    def with_model(self, model_id):
+        """Same client, different model (e.g. a faster one for live turns)"""
+        backend = ElevenLabsBackend(self.api_key, model_id)
+        backend._client = self._client
+        return backend
+
+    def stream(self, text, voice, output_format=None):
+        audio_stream = self.client.text_to_speech.stream(
+            text=text,
+            voice_id=self.voice_id(voice),
+            model_id=self.model_id,
+            output_format=self.output_format(output_format)
+        )
+        for chunk in audio_stream:
+            if isinstance(chunk, bytes):
+                yield chunk
+
+    def synthesize(self, text, voice, output_format=None):
+        audio = self.client.text_to_speech.convert(
+            text=text,
+            voice_id=self.voice_id(voice),
+            model_id=self.model_id,
+            output_format=self.output_format(output_format)
+        )
+        if isinstance(audio, (bytes, bytearray)):
+            return bytes(audio)
+        return b"".join(chunk for chunk in audio if isinstance(chunk, bytes))
+
+    def synthesize_dialogue(self, inputs, output_format=None):
+        audio_stream = self.client.text_to_dialogue.convert(
+            inputs=[{"text": item["text"], "voice_id": self.voice_id(item["voice_id"])} for item in inputs],
+            output_format=self.output_format(output_format)
+        )
+        for chunk in audio_stream:
+            if isinstance(chunk, bytes):
+                yield chunk
+
+class LocalBackend(TTSBackend):
+    """espeak-ng on the local CPU: no network, no API key, latency set by text length.
+
+    Always produces 22.05 kHz mono 16-bit WAV, whatever format is requested.
+    """
+
+    name = "local"
+    model_id = "espeak-ng"
+    SAMPLE_RATE = 22050
+
+    def __init__(self, command=None, words_per_minute=None):
+        self.command = command or shutil.which("espeak-ng") or shutil.which("espeak")
+        self.words_per_minute = words_per_minute or int(os.getenv("LOCAL_TTS_WPM", "175"))
+
+    def available(self):
+        return self.command is not None
+
+    def output_format(self, requested=None):
+        return f"wav_{self.SAMPLE_RATE}"
+
+    def bytes_per_second(self, kbps):
+        return self.SAMPLE_RATE * 2
+
+    def _process(self, text, voice):
+        if not self.command:
+            raise RuntimeError("No local TTS engine found; install espeak-ng")
+        process = subprocess.Popen(
+            [self.command, "-v", self.voice_id(voice), "-s", str(self.words_per_minute), "--stdout", "--stdin"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        # Feed the text from a thread so a long text can't deadlock against a full stdout pipe
+        def feed():
+            try:
+                process.stdin.write(text.encode("utf-8"))
+            finally:
+                process.stdin.close()
+        threading.Thread(target=feed, daemon=True).start()
+        return process
+
+    def stream(self, text, voice, output_format=None):
+        """WAV as it is generated; the header gives no length, as usual for streamed WAV"""
+        process = self._process(text, voice)
+        try:
+            for chunk in iter(lambda: process.stdout.read1(8192), b""):
+                yield chunk
+        finally:
+            process.stdout.close()
+            if process.wait() != 0:
+                raise RuntimeError(f"{self.command} exited with status {process.returncode}")
+
+    def synthesize(self, text, voice, output_format=None):
+        return join_wav([b"".join(self.stream(text, voice, output_format))])
+
+    def synthesize_dialogue(self, inputs, output_format=None):
+        # One WAV file for the whole dialogue rather than one per line
+        yield join_wav([b"".join(self.stream(item["text"], item["voice_id"], output_format)) for item in inputs])
+
+def join_wav(clips):
+    """Concatenate WAV clips of the same format into one WAV with a correct header"""
+    params, frames = None, []
+    for clip in clips:
+        with wave.open(io.BytesIO(clip), "rb") as reader:
+            params = params or reader.getparams()
+            # Streamed headers carry a placeholder length, so read until the data runs out
+            frames.append(reader.readframes(2 ** 31 - 1))
+    out = io.BytesIO()
+    with wave.open(out, "wb") as writer:
+        writer.setnchannels(params.nchannels)
+        writer.setsampwidth(params.sampwidth)
+        writer.setframerate(params.framerate)
+        writer.writeframes(b"".join(frames))
+    return out.getvalue()
+
+BACKENDS = {"elevenlabs": ElevenLabsBackend, "local": LocalBackend}
+_backends = {}
+_backends_lock = threading.Lock()
+
+def get_backend(name=None):
+    """Shared backend by name, else ``TTS_BACKEND``, else ``auto``.
+
+    ``auto`` uses ElevenLabs when its package and API key are present and
+    falls back to the local engine otherwise, so speech keeps working
+    offline. The returned backend may still be unavailable (check
+    ``available()``) when neither is installed.
+    """
+    name = (name or os.getenv("TTS_BACKEND") or "auto").lower()
+    if name == "auto":
+        name = "elevenlabs" if ElevenLabsBackend().available() else "local"
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown TTS backend: {name} (choose from auto, {', '.join(BACKENDS)})")
+    with _backends_lock:
+        if name not in _backends:
+            _backends[name] = BACKENDS[name]()
+        return _backends[name]
+
+def clip_players(output_format=None):
+    """Clip player commands, by name, that can play ``output_format`` (mp3 if not given)"""
+    container = format_container(output_format)
+    return {name: command for name, (command, containers) in CLIP_PLAYERS.items()
+            if containers is None or container in containers}
+
+def _player_command(output_format=None):
+    for command in clip_players(output_format).values():
+        if shutil.which(command[0]):
+            return command
+    raise RuntimeError(f"No audio player found for {format_container(output_format)}; install ffmpeg (ffplay) or mpv")
+
+def play_clip(audio, output_format=None):
+    """Play one complete clip in ``output_format`` (mp3 if not given) and return when it has finished"""
+    subprocess.run(_player_command(output_format), input=audio, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def play_stream(chunks, output_format=None):
+    """Play audio while it is still arriving; returns all the bytes played"""
+    process = subprocess.Popen(_player_command(output_format), stdin=subprocess.PIPE,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    played = []
+    try:
+        for chunk in chunks:
+            played.append(chunk)
+            process.stdin.write(chunk)
+            process.stdin.flush()
+    except BrokenPipeError:
+        pass
+    finally:
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        process.wait()
+    return b"".join(played)
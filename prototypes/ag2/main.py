@@ -1,11 +1,22 @@
 import os
-from autogen import ConversableAgent, LLMConfig
+from autogen import ConversableAgent, GroupChat, GroupChatManager, LLMConfig, gather_usage_summary
+from autogen.cache import Cache
+from autogen.agentchat.contrib.capabilities import transform_messages, transforms
+
+# LLM responses are cached on disk per seed, so a replayed debate makes no API calls.
+# Set AG2_CACHE_SEED to another value for fresh responses, or to "none" to disable caching.
+CACHE_DIR = os.getenv("AG2_CACHE_DIR", ".cache")
+CACHE_SEED = os.getenv("AG2_CACHE_SEED", "42")
+
+# Debaters see only the most recent messages, so each call's prompt stays the same size
+DEBATER_CONTEXT_MESSAGES = 4
 
 class DebateSystem:
-    def __init__(self, topic, side_a_point, side_b_point):
+    def __init__(self, topic, side_a_point, side_b_point, cache_seed=CACHE_SEED):
         self.topic = topic
         self.side_a_point = side_a_point
         self.side_b_point = side_b_point
+        self.cache_seed = None if str(cache_seed).lower() == "none" else cache_seed
         self.config_list = [
             {
                 "api_type": "mistral",
@@ -44,50 +55,71 @@ class DebateSystem:
                 REASON: [one clear sentence explanation]"""
             )
 
-    def run_debate(self, rounds=3):
-        # Opening statements
-        self.side_a.initiate_chat(
-            self.side_b,
-            message=f"Opening statement about {self.topic}:",
-            max_turns=2
+        # Opens the debate; never calls the LLM
+        self.moderator = ConversableAgent(
+            name="moderator",
+            llm_config=False,
+            human_input_mode="NEVER",
         )
 
-        # Debate rounds
-        for _ in range(rounds):
-            self.side_a.initiate_chat(
-                self.side_b,
-                message="Your turn. Present your counter-argument.",
-                max_turns=3
+        for debater in (self.side_a, self.side_b):
+            context_handling = transform_messages.TransformMessages(
+                transforms=[transforms.MessageHistoryLimiter(max_messages=DEBATER_CONTEXT_MESSAGES)]
             )
+            context_handling.add_to_agent(debater)
 
-        # Closing statements
-        self.side_a.initiate_chat(
-            self.side_b,
-            message="Let's make our closing statements. Here's mine:",
-            max_turns=2
-        )
-
-        # Collect debate history
-        side_a_history = [msg for msg in self.side_a.chat_messages[self.side_b]]
-        side_b_history = [msg for msg in self.side_b.chat_messages[self.side_a]]
-        debate_history = []
+    def run_debate(self, rounds=3):
+        # Opening statements, the debate rounds and closing statements, side_a first, then the verdict
+        debate_turns = 2 * (rounds + 2)
 
-        # Merge and sort messages by timestamp
-        for msg in side_a_history + side_b_history:
-            debate_history.append(f"{msg['role']}: {msg['content']}")
+        def select_speaker(last_speaker, groupchat):
+            spoken = len(groupchat.messages) - 1  # minus the moderator's opening message
+            if spoken < debate_turns:
+                return self.side_a if spoken % 2 == 0 else self.side_b
+            return self.judge
 
-        debate_summary = "\n".join(debate_history)
+        groupchat = GroupChat(
+            agents=[self.side_a, self.side_b, self.judge],
+            messages=[],
+            max_round=debate_turns + 2,  # moderator message + debate turns + verdict
+            speaker_selection_method=select_speaker,
+        )
+        with self.llm_config:
+            manager = GroupChatManager(groupchat=groupchat)
 
-        # Generate the judge's verdict
-        verdict = self.judge.generate_reply(
-            messages=[{
-                "role": "user",
-                "content": f"Based on the following debate transcript, provide your verdict:\n\n{debate_summary}"
-            }]
+        message = (
+            f"Debate topic: {self.topic}.\n"
+            f"side_a argues that {self.side_a_point}; side_b argues that {self.side_b_point}.\n"
+            f"side_a opens, then the sides alternate for {rounds} rounds of counter-arguments, "
+            f"then each gives a closing statement. The judge gives the verdict last."
         )
+        if self.cache_seed is None:
+            self.moderator.initiate_chat(manager, message=message)
+        else:
+            with Cache.disk(cache_seed=self.cache_seed, cache_path_root=CACHE_DIR) as cache:
+                self.moderator.initiate_chat(manager, message=message, cache=cache)
+
+        # One ordered conversation: every message appears once, in the order it was said
+        self.turns = [
+            (msg["name"], msg["content"])
+            for msg in groupchat.messages
+            if msg.get("name") in ("side_a", "side_b")
+        ]
+        verdicts = [msg["content"] for msg in groupchat.messages if msg.get("name") == "judge"]
+        self.verdict = verdicts[-1] if verdicts else ""
+        # Usage of the agents that call the LLM (cached responses count only in the "including" total)
+        self.usage = gather_usage_summary([self.side_a, self.side_b, self.judge])
 
         print("\nJUDGE'S VERDICT:")
-        print(verdict['content'])
+        print(self.verdict)
+        print(f"\n📊 {len(groupchat.messages)} messages, "
+              f"{prompt_tokens(self.usage.get('usage_excluding_cached_inference', {}))} prompt tokens sent "
+              f"({prompt_tokens(self.usage.get('usage_including_cached_inference', {}))} including cache hits)")
+        return {"turns": self.turns, "verdict": self.verdict, "messages": len(groupchat.messages), "usage": self.usage}
+
+def prompt_tokens(usage):
+    """Prompt tokens summed over the models in an ag2 usage summary"""
+    return sum(model.get("prompt_tokens", 0) for model in usage.values() if isinstance(model, dict))
 
 if __name__ == "__main__":
     # Example usage
@@ -1,7 +1,12 @@
 import os
-from mistralai import Mistral
+import sys
 import requests
 from dotenv import load_dotenv
+
+# Ensemble judge from the shared debate engine (prototypes/engine)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "engine"))
+from ensemble_judge import EnsembleJudge, label_parser
+
 load_dotenv()
 API_URL = "https://api.bey.dev/v1"
 
@@ -48,24 +53,18 @@ def fetch_transcript(api_key: str, agent_id: str) -> None:
 
 def llm_judge(topic, transcript):    
     mistral_api_key = os.getenv("MISTRAL_API_KEY")
-    model = os.getenv("MISTRAL_API_KEY_MODEL_NAME")
+    model = os.getenv("MISTRAL_API_KEY_MODEL_NAME", "mistral-tiny")
 
-    client = Mistral(api_key=mistral_api_key)
+    # JUDGE_ENSEMBLE_SIZE judges vote concurrently; returns once a majority is settled
+    judge = EnsembleJudge.mistral(label_parser("User", "AI"), default_model=model, api_key=mistral_api_key)
 
     prompt = f"""You are judging the debate on: {topic}.
             Debate transcript: \n{transcript}
             Format response EXACTLY as:\nWINNER: [User/AI]\nREASON: [one clear sentence explanation]"""
 
-    chat_response = client.chat.complete(
-        model = model,
-        messages = [
-            {
-                "role": "user",
-                "content": prompt,
-            },
-        ]
-    )
-    return chat_response.choices[0].message.content
+    verdict = judge.invoke(prompt)
+    print(f"Judge votes: {verdict.votes} ({verdict.cancelled} cancelled, {verdict.latency:.1f}s)")
+    return verdict.text
 
 
 topic = "dog vs cat"
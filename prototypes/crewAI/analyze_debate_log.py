@@ -4,87 +4,68 @@ Debate Log Analyzer
 Analyzes the JSON debate logs to show what data is being captured
 """
 
-import json
 import sys
 import os
 from datetime import datetime
 
+from log_catalog import LogCatalog
+from log_stream import summarize_debate_log
+
+SECTION_LABELS = [
+    ("research_pro", "🔬 Pro Research", "pro research"),
+    ("research_con", "🔬 Con Research", "con research"),
+    ("pro_debater_argument", "🗣️ Pro Debater", "pro argument"),
+    ("con_debater_argument", "🗣️ Con Debater", "con argument"),
+    ("judge_evaluation", "⚖️ Judge Evaluation", "judge evaluation"),
+]
+
 def analyze_debate_log(filename):
-    """Analyze a specific debate log file"""
+    """Analyze a specific debate log file (streamed; memory stays flat for huge logs)"""
     try:
-        with open(filename, 'r') as f:
-            data = json.load(f)
+        data = summarize_debate_log(filename)
         
         print(f"\n{'='*60}")
         print(f"📋 DEBATE LOG ANALYSIS: {filename}")
         print(f"{'='*60}")
         
         # Basic info
-        print(f"🎭 Topic: {data.get('topic', 'N/A')}")
-        print(f"⏰ Timestamp: {data.get('timestamp', 'N/A')}")
+        print(f"🎭 Topic: {data['topic'] or 'N/A'}")
+        print(f"⏰ Timestamp: {data['timestamp'] or 'N/A'}")
         
         # Shared memory analysis
-        shared_memory = data.get('shared_memory', {})
         print(f"\n🧠 SHARED MEMORY ANALYSIS:")
         print(f"{'='*40}")
         
-        # Research Pro
-        research_pro = shared_memory.get('research_pro', [])
-        print(f"🔬 Pro Research: {len(research_pro)} entries")
-        if research_pro:
-            for i, entry in enumerate(research_pro):
-                print(f"   Entry {i+1}: {entry.get('agent_role', 'Unknown')} at {entry.get('timestamp', 'Unknown')}")
-                output_preview = str(entry.get('output', ''))[:100] + "..." if len(str(entry.get('output', ''))) > 100 else str(entry.get('output', ''))
-                print(f"   Preview: {output_preview}")
-        else:
-            print("   ❌ No pro research captured")
-        
-        # Research Con
-        research_con = shared_memory.get('research_con', [])
-        print(f"\n🔬 Con Research: {len(research_con)} entries")
-        if research_con:
-            for i, entry in enumerate(research_con):
-                print(f"   Entry {i+1}: {entry.get('agent_role', 'Unknown')} at {entry.get('timestamp', 'Unknown')}")
-                output_preview = str(entry.get('output', ''))[:100] + "..." if len(str(entry.get('output', ''))) > 100 else str(entry.get('output', ''))
-                print(f"   Preview: {output_preview}")
-        else:
-            print("   ❌ No con research captured")
-        
-        # Pro Debater
-        pro_argument = shared_memory.get('pro_debater_argument', [])
-        print(f"\n🗣️ Pro Debater: {len(pro_argument)} entries")
-        if pro_argument:
-            for i, entry in enumerate(pro_argument):
-                print(f"   Entry {i+1}: {entry.get('agent_role', 'Unknown')} at {entry.get('timestamp', 'Unknown')}")
-                output_preview = str(entry.get('output', ''))[:100] + "..." if len(str(entry.get('output', ''))) > 100 else str(entry.get('output', ''))
-                print(f"   Preview: {output_preview}")
-        else:
-            print("   ❌ No pro argument captured")
-        
-        # Con Debater
-        con_argument = shared_memory.get('con_debater_argument', [])
-        print(f"\n🗣️ Con Debater: {len(con_argument)} entries")
-        if con_argument:
-            for i, entry in enumerate(con_argument):
-                print(f"   Entry {i+1}: {entry.get('agent_role', 'Unknown')} at {entry.get('timestamp', 'Unknown')}")
-                output_preview = str(entry.get('output', ''))[:100] + "..." if len(str(entry.get('output', ''))) > 100 else str(entry.get('output', ''))
-                print(f"   Preview: {output_preview}")
-        else:
-            print("   ❌ No con argument captured")
+        total_captured = 0
+        for i, (key, label, missing) in enumerate(SECTION_LABELS):
+            section = data["sections"][key]
+            total_captured += section["count"]
+            if i:
+                print()
+            print(f"{label}: {section['count']} entries")
+            if section["count"]:
+                for n, entry in enumerate(section["entries"]):
+                    print(f"   Entry {n+1}: {entry.get('agent_role', 'Unknown')} at {entry.get('timestamp', 'Unknown')}")
+                    print(f"   Preview: {entry.get('preview', '')}")
+                hidden = section["count"] - len(section["entries"])
+                if hidden:
+                    print(f"   ... {hidden} more entries")
+            else:
+                print(f"   ❌ No {missing} captured")
         
-        # Judge Evaluation
-        judge_eval = shared_memory.get('judge_evaluation', [])
-        print(f"\n⚖️ Judge Evaluation: {len(judge_eval)} entries")
-        if judge_eval:
-            for i, entry in enumerate(judge_eval):
-                print(f"   Entry {i+1}: {entry.get('agent_role', 'Unknown')} at {entry.get('timestamp', 'Unknown')}")
-                output_preview = str(entry.get('output', ''))[:100] + "..." if len(str(entry.get('output', ''))) > 100 else str(entry.get('output', ''))
-                print(f"   Preview: {output_preview}")
-        else:
-            print("   ❌ No judge evaluation captured")
+        # Conversation history (structured turn-based logs)
+        conversation = data["conversation"]
+        if conversation["count"]:
+            print(f"\n💬 Conversation History: {conversation['count']} exchanges")
+            for exchange in conversation["entries"]:
+                print(f"   Exchange {exchange.get('turn', '?')}:")
+                print(f"   Pro ({exchange.get('pro_length', 0)} chars): {exchange.get('pro', '')}")
+                print(f"   Con ({exchange.get('con_length', 0)} chars): {exchange.get('con', '')}")
+            hidden = conversation["count"] - len(conversation["entries"])
+            if hidden:
+                print(f"   ... {hidden} more exchanges")
         
         # Summary
-        total_captured = len(research_pro) + len(research_con) + len(pro_argument) + len(con_argument) + len(judge_eval)
         print(f"\n📊 CAPTURE SUMMARY:")
         print(f"{'='*40}")
         print(f"Total components captured: {total_captured}/5")
@@ -94,12 +75,11 @@ def analyze_debate_log(filename):
             print(f"⚠️ {5 - total_captured} components missing")
         
         # Final result preview
-        final_result = data.get('final_result', '')
+        final_result = data['final_result'] or data['final_judgment']
         print(f"\n🏆 FINAL RESULT:")
         print(f"{'='*40}")
         if final_result:
-            result_preview = final_result[:200] + "..." if len(final_result) > 200 else final_result
-            print(result_preview)
+            print(final_result)
         else:
             print("❌ No final result found")
         
@@ -107,15 +87,18 @@ def analyze_debate_log(filename):
         
     except FileNotFoundError:
         print(f"❌ File not found: {filename}")
-    except json.JSONDecodeError:
+    except ValueError:
         print(f"❌ Invalid JSON in file: {filename}")
     except Exception as e:
         print(f"❌ Error analyzing file: {e}")
 
 def list_debate_logs():
-    """List all available debate log files"""
-    log_files = [f for f in os.listdir('.') if f.startswith('debate_log_') and f.endswith('.json')]
-    log_files.sort(reverse=True)  # Most recent first
+    """List all available debate log files (served from the log catalog)"""
+    catalog = LogCatalog()
+    catalog.ingest()
+    rows = catalog.list_logs(kind="text")
+    catalog.close()
+    log_files = [row["path"] for row in rows]
     
     print(f"\n📁 AVAILABLE DEBATE LOGS:")
     print(f"{'='*40}")
@@ -124,22 +107,31 @@ def list_debate_logs():
         print("❌ No debate logs found")
         return []
     
-    for i, log_file in enumerate(log_files, 1):
-        # Get file modification time
-        try:
-            mtime = os.path.getmtime(log_file)
-            formatted_time = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
-            print(f"{i}. {log_file} (Modified: {formatted_time})")
-        except:
-            print(f"{i}. {log_file}")
+    for i, row in enumerate(rows, 1):
+        formatted_time = datetime.fromtimestamp(row["mtime"]).strftime("%Y-%m-%d %H:%M:%S")
+        print(f"{i}. {os.path.basename(row['path'])} (Modified: {formatted_time}, Winner: {row['winner'] or 'unknown'})")
     
     return log_files
 
+def show_fleet_stats(group_by="all"):
+    """Aggregate statistics across every cataloged log"""
+    # Imported here so the single-log views work without NumPy
+    from log_stats import load_columns, print_report
+
+    catalog = LogCatalog()
+    catalog.ingest()
+    debates, entries = load_columns(catalog)
+    catalog.close()
+    print_report(debates, entries, group_by)
+
 def main():
     """Main function"""
     print("🔍 DEBATE LOG ANALYZER")
     
-    if len(sys.argv) > 1:
+    if len(sys.argv) > 1 and sys.argv[1] == "--stats":
+        # Fleet-wide statistics, optionally grouped (topic, date, kind, framework)
+        show_fleet_stats(sys.argv[2] if len(sys.argv) > 2 else "all")
+    elif len(sys.argv) > 1:
         # Specific file provided
         filename = sys.argv[1]
         analyze_debate_log(filename)
@@ -155,6 +147,7 @@ def main():
                 print(f"\n💡 To analyze other logs, use:")
                 for log_file in log_files[1:3]:  # Show next 2
                     print(f"   python analyze_debate_log.py {log_file}")
+            print(f"\n💡 For statistics across all logs: python analyze_debate_log.py --stats [topic|date|kind]")
 
 if __name__ == "__main__":
     main()
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Audio-Enhanced AI Debate System
-Real-time conversational debates with ElevenLabs voice synthesis
+Real-time conversational debates with ElevenLabs (or offline local) voice synthesis
 """
 
 import os
@@ -9,23 +9,28 @@ import sys
 import json
 import argparse
 import asyncio
+import hashlib
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from dotenv import load_dotenv
 from crewai import Agent, Task, Crew
 from crewai.llm import LLM
+from audio_playback import PipeSink, PlaybackWorker, create_audio_sink
+from audio_store import AudioStore
+
+# Shared TTS backends and audio profiles (prototypes/TTS); TTS_BACKEND=local speaks offline with espeak-ng
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "TTS"))
+from audio_profiles import TransferStats, get_profile
+from tts_backends import concatenable, get_backend, join_wav, play_clip, play_stream
 
 # Load environment variables
 load_dotenv()
 
-# Check for ElevenLabs availability
-try:
-    from elevenlabs.client import ElevenLabs
-    from elevenlabs import play, stream
-    ELEVENLABS_AVAILABLE = True
-except ImportError:
-    ELEVENLABS_AVAILABLE = False
-    print("⚠️ ElevenLabs not installed. Run: pip install elevenlabs")
-
 # Initialize LLMs
 mistral_llm = LLM(
     model="mistral-large-2411",
@@ -33,44 +38,52 @@ mistral_llm = LLM(
     api_key=os.getenv("MISTRAL_API_KEY")
 )
 
-# ElevenLabs client
-if ELEVENLABS_AVAILABLE and os.getenv("ELEVENLABS_API_KEY"):
-    elevenlabs_client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
-else:
-    elevenlabs_client = None
-
-# Voice configuration for different agents
+# Speaking style per agent; the voices themselves come from the shared registry in tts_backends
 VOICE_CONFIG = {
     "pro_debater": {
-        "voice_id": "21m00Tcm4TlvDq8ikWAM",  # Rachel - Professional female
         "name": "Rachel (Pro Debater)",
         "style": "confident and persuasive"
     },
     "con_debater": {
-        "voice_id": "AZnzlk1XvdvUeBnXmlld",  # Domi - Analytical male  
         "name": "Domi (Con Debater)", 
         "style": "analytical and critical"
     },
     "judge": {
-        "voice_id": "EXAVITQu4vr4xnSDxMaL",  # Bella - Neutral professional
         "name": "Bella (Judge)",
         "style": "balanced and authoritative"
     },
     "researcher": {
-        "voice_id": "ErXwobaYiN019PkySvjV",  # Antoni - Information delivery
         "name": "Antoni (Researcher)",
         "style": "informative and clear"
     }
 }
 
+# Full-dialogue rendering: request size, parallel requests, in-memory spool size
+DIALOGUE_CHUNK_CHARS = 1500
+DIALOGUE_CONCURRENCY = 3
+DIALOGUE_SPOOL_BYTES = 1024 * 1024
+
+# Recorded-mode speech: parallel synthesis requests overall and per voice
+RECORDED_TTS_WORKERS = 4
+RECORDED_TTS_PER_VOICE = 2
+
 class AudioDebateSystem:
-    def __init__(self, mode="individual", streaming=True):
+    def __init__(self, mode="individual", streaming=True, tts=None):
         self.mode = mode  # "individual", "conversation", "mixed"
         self.streaming = streaming  # True for real-time streaming, False for file generation
         self.debate_topic = ""
-        self.audio_enabled = elevenlabs_client is not None
+        # Speech backend (TTS_BACKEND: elevenlabs, local or auto); its model and output format are part of the audio store key
+        self.tts = tts or get_backend()
+        self.audio_enabled = self.tts.available()
         self.save_audio = True
-        self.audio_dir = f"audio_debate_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.debate_id = f"audio_debate_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        self.audio_store = AudioStore()
+        
+        # Output format per use: low bandwidth live, standard clips, high quality dialogue archive
+        self.stream_profile = get_profile(None, "DEBATE_STREAM_PROFILE", default="stream")
+        self.record_profile = get_profile(None, "DEBATE_RECORD_PROFILE", default="standard")
+        self.archive_profile = get_profile(None, "DEBATE_ARCHIVE_PROFILE", default="archive")
+        self.transfer_stats = TransferStats()
         self.shared_memory = {
             "research_pro": [],
             "research_con": [],
@@ -83,8 +96,19 @@ class AudioDebateSystem:
             "timestamp": datetime.now().isoformat()
         }
         
-        if self.save_audio and not streaming:
-            os.makedirs(self.audio_dir, exist_ok=True)
+        # Speech pipeline fed by task callbacks while the crew keeps running
+        self.speech_pipeline = None
+        self.speech_jobs = []
+        self.task_handlers = {}
+        
+        # Recorded mode: clips synthesize concurrently, play back in debate order
+        self.tts_pool = None
+        self.recorded_playback = None
+        self.recorded_jobs = []
+        self.voice_slots = {
+            self.tts.voice_id(agent_type): threading.Semaphore(RECORDED_TTS_PER_VOICE)
+            for agent_type in VOICE_CONFIG
+        }
     
     def stream_text_realtime(self, text, agent_type):
         """Stream text to speech for real-time audio debate"""
@@ -99,79 +123,166 @@ class AudioDebateSystem:
             print(f"💬 \"{text[:100]}{'...' if len(text) > 100 else ''}\"")
             
             # Stream audio in real-time
-            audio_stream = elevenlabs_client.text_to_speech.stream(
-                text=text,
-                voice_id=voice_config["voice_id"],
-                model_id="eleven_multilingual_v2"
-            )
+            start = time.perf_counter()
+            audio_stream = self.tts.stream(text, agent_type, self.stream_profile["output_format"])
             
             print(f"🔊 Live streaming...")
-            stream(audio_stream)
+            play_stream(self.transfer_stats.measure(audio_stream, self.stream_profile["name"], start),
+                        self.tts.output_format(self.stream_profile["output_format"]))
             print(f"✅ Stream complete\n")
             
         except Exception as e:
             print(f"❌ Streaming error for {agent_type}: {e}")
 
-    def speak_text(self, text, agent_type, save_filename=None, play_audio=True):
-        """Convert text to speech using ElevenLabs streaming"""
+    def store_clip(self, text, agent_type, label, manifest_entry=None):
+        """Synthesize a clip into the audio store, reusing an identical stored line.
+
+        The clip is recorded in ``audio_files`` (the debate's manifest) by
+        its store key; pass ``manifest_entry`` to fill a reserved entry.
+        """
+        voice = agent_type if agent_type in VOICE_CONFIG else "judge"
+        voice_id = self.tts.voice_id(voice)
+        profile = self.record_profile
+        output_format = self.tts.output_format(profile["output_format"])
+        key = AudioStore.key(voice_id, self.tts.model_id, text, output_format)
+        
+        def synthesize():
+            with self.voice_slots[voice_id]:
+                # Measured while streaming, so the time to first byte is the backend's, not the whole synthesis
+                start = time.perf_counter()
+                audio = b"".join(self.transfer_stats.measure(
+                    self.tts.stream(text, voice, output_format), profile["name"], start
+                ))
+                # Streamed WAV has a placeholder length in its header
+                return audio if concatenable(output_format) else join_wav([audio])
+        
+        audio, cached = self.audio_store.get_or_create(key, synthesize, output_format)
+        if cached:
+            self.transfer_stats.record(profile["name"], len(audio), cached=True)
+        
+        if manifest_entry is None:
+            manifest_entry = {"agent_type": agent_type}
+            self.shared_memory["audio_files"].append(manifest_entry)
+        manifest_entry.update({
+            "label": label,
+            "key": key,
+            "voice_id": voice_id,
+            "model_id": self.tts.model_id,
+            "output_format": output_format,
+            "profile": profile["name"],
+            "filename": self.audio_store.blob_path(key, output_format),
+            "sha256": hashlib.sha256(audio).hexdigest(),
+            "bytes": len(audio),
+            "cached": cached,
+            "timestamp": datetime.now().isoformat(),
+            "status": "saved"
+        })
+        if cached:
+            print(f"♻️ Reused stored audio: {label}")
+        else:
+            print(f"💾 Audio saved: {manifest_entry['filename']}")
+        return audio
+    
+    def render_clip(self, text, agent_type, manifest_entry):
+        """Synthesize one recorded clip into the store (runs on the TTS pool)"""
+        return self.store_clip(text, agent_type, manifest_entry["label"], manifest_entry)
+    
+    def play_recorded_clip(self, clip_future, agent_type):
+        """Play a recorded clip once it is ready (runs on the playback worker)"""
+        audio = clip_future.result()
+        print(f"🔊 Playing {VOICE_CONFIG.get(agent_type, VOICE_CONFIG['judge'])['name']}...")
+        play_clip(audio, self.tts.output_format(self.record_profile["output_format"]))
+    
+    def queue_recorded_speech(self, text, agent_type, label):
+        """Start synthesizing a recorded clip without waiting for earlier clips.
+
+        The manifest entry is reserved now so ``audio_files`` stays in debate
+        order even though clips are stored in completion order. Playback
+        still follows debate order.
+        """
         if not self.audio_enabled:
             print(f"🔇 Audio disabled: {agent_type}")
             return None
-            
-        try:
-            voice_config = VOICE_CONFIG.get(agent_type, VOICE_CONFIG["judge"])
-            
-            print(f"🎙️ {voice_config['name']} speaking...")
-            
-            if play_audio and not save_filename:
-                # Option 1: Stream and play immediately (real-time)
-                audio_stream = elevenlabs_client.text_to_speech.stream(
-                    text=text,
-                    voice_id=voice_config["voice_id"],
-                    model_id="eleven_multilingual_v2"
-                )
-                
-                print(f"🔊 Streaming audio for {voice_config['name']}...")
-                stream(audio_stream)
-                print(f"✅ Audio stream complete")
-                return None
-                
-            else:
-                # Option 2: Generate and save audio (with optional playback)
-                audio_stream = elevenlabs_client.text_to_speech.convert(
-                    text=text,
-                    voice_id=voice_config["voice_id"],
-                    model_id="eleven_multilingual_v2",
-                    output_format="mp3_44100_128"
-                )
-                
-                # Convert generator to bytes
-                audio = b"".join(audio_stream)
-                
-                # Save audio file
-                if save_filename:
-                    filepath = os.path.join(self.audio_dir, f"{save_filename}.mp3")
-                    with open(filepath, "wb") as f:
-                        f.write(audio)
-                    self.shared_memory["audio_files"].append({
-                        "agent_type": agent_type,
-                        "filename": filepath,
-                        "timestamp": datetime.now().isoformat()
-                    })
-                    print(f"💾 Audio saved: {filepath}")
-                
-                # Play audio if requested
-                if play_audio:
-                    play(audio)
-                    
-                return audio
-            
-        except Exception as e:
-            print(f"❌ Audio error for {agent_type}: {e}")
-            return None
+        
+        if self.tts_pool is None:
+            self.tts_pool = ThreadPoolExecutor(max_workers=RECORDED_TTS_WORKERS, thread_name_prefix="recorded-tts")
+            self.recorded_playback = PlaybackWorker(max_pending=8, name="recorded-playback")
+            self.recorded_jobs = []
+        
+        manifest_entry = {
+            "agent_type": agent_type,
+            "label": label,
+            "filename": None,
+            "timestamp": None,
+            "status": "pending"
+        }
+        self.shared_memory["audio_files"].append(manifest_entry)
+        
+        print(f"🎙️ {VOICE_CONFIG.get(agent_type, VOICE_CONFIG['judge'])['name']} queued for synthesis...")
+        clip_future = self.tts_pool.submit(self.render_clip, text, agent_type, manifest_entry)
+        self.recorded_jobs.append(clip_future)
+        self.recorded_playback.submit(self.play_recorded_clip, clip_future, agent_type)
+        return clip_future
+    
+    def finish_recorded_speech(self):
+        """Wait for every recorded clip to be saved and played"""
+        if self.tts_pool is None:
+            return
+        self.tts_pool.shutdown(wait=True)
+        self.recorded_playback.close()
+        for job in self.recorded_jobs:
+            if job.exception() is not None:
+                print(f"❌ Audio error: {job.exception()}")
+        self.tts_pool = None
+        self.recorded_playback = None
+    
+    def split_dialogue_chunks(self, inputs, max_chars=DIALOGUE_CHUNK_CHARS):
+        """Group dialogue inputs into requests of at most max_chars of text.
+
+        An input longer than max_chars is split on sentence boundaries and
+        keeps its voice, so every chunk stays within the request size limit.
+        """
+        pieces = []
+        for item in inputs:
+            text = item["text"]
+            while len(text) > max_chars:
+                cut = max(text.rfind(". ", 0, max_chars), text.rfind("? ", 0, max_chars), text.rfind("! ", 0, max_chars))
+                cut = cut + 1 if cut > 0 else max_chars
+                pieces.append({"text": text[:cut].strip(), "voice_id": item["voice_id"]})
+                text = text[cut:].strip()
+            if text:
+                pieces.append({"text": text, "voice_id": item["voice_id"]})
+        
+        chunks, current, current_chars = [], [], 0
+        for piece in pieces:
+            if current and current_chars + len(piece["text"]) > max_chars:
+                chunks.append(current)
+                current, current_chars = [], 0
+            current.append(piece)
+            current_chars += len(piece["text"])
+        if current:
+            chunks.append(current)
+        return chunks
+    
+    def synthesize_dialogue_chunk(self, chunk_inputs):
+        """Stream one dialogue chunk into a spooled buffer (spills to disk when large)"""
+        spool = tempfile.SpooledTemporaryFile(max_size=DIALOGUE_SPOOL_BYTES)
+        start = time.perf_counter()
+        audio_stream = self.tts.synthesize_dialogue(chunk_inputs, self.archive_profile["output_format"])
+        for audio_bytes in self.transfer_stats.measure(audio_stream, self.archive_profile["name"], start):
+            spool.write(audio_bytes)
+        spool.seek(0)
+        return spool
     
     def create_dialogue_audio(self, dialogue_segments):
-        """Create conversational dialogue audio using ElevenLabs Text-to-Dialogue"""
+        """Create conversational dialogue audio with the backend's dialogue synthesis.
+
+        The dialogue is synthesized as size-limited chunks, a few at a time.
+        Chunks are appended to the dialogue's audio store blob in order as they
+        arrive and playback starts with the first one, so memory stays bounded
+        however long the debate is. An identical dialogue is replayed from the
+        store. Returns the dialogue file path.
+        """
         if not self.audio_enabled:
             return None
             
@@ -188,28 +299,80 @@ class AudioDebateSystem:
                 
                 inputs.append({
                     "text": styled_text,
-                    "voice_id": voice_config["voice_id"]
+                    "voice_id": self.tts.voice_id(agent_type if agent_type in VOICE_CONFIG else "judge")
                 })
             
-            print(f"🎭 Creating conversational dialogue with {len(inputs)} segments...")
-            
-            # Generate dialogue audio
-            audio_stream = elevenlabs_client.text_to_dialogue.convert(inputs=inputs)
-            
-            # Convert generator to bytes
-            audio = b"".join(audio_stream)
+            output_format = self.tts.output_format(self.archive_profile["output_format"])
+            # Clips that each carry a header (local WAV) can't be appended, so they are rendered as one chunk
+            chunks = self.split_dialogue_chunks(inputs) if concatenable(output_format) else [inputs]
+            print(f"🎭 Creating conversational dialogue with {len(inputs)} segments in {len(chunks)} chunks...")
             
-            # Save dialogue audio
-            dialogue_file = os.path.join(self.audio_dir, "full_dialogue.mp3")
-            with open(dialogue_file, "wb") as f:
-                f.write(audio)
+            key = AudioStore.key("dialogue", "text_to_dialogue", json.dumps(inputs, ensure_ascii=False), output_format)
+            dialogue_file = self.audio_store.blob_path(key, output_format)
+            cached = self.audio_store.touch(key, output_format)
+            digest = hashlib.sha256()
+            size = 0
+            sink = create_audio_sink(bytes_per_second=self.tts.bytes_per_second(self.archive_profile["kbps"]),
+                                     per_clip=not concatenable(output_format))
+            playback = PlaybackWorker(max_pending=2)
             
-            print(f"🎬 Dialogue audio saved: {dialogue_file}")
-            
-            # Play dialogue
-            play(audio)
-            
-            return audio
+            try:
+                if cached:
+                    print(f"♻️ Identical dialogue already stored, replaying: {dialogue_file}")
+                    with open(dialogue_file, "rb") as f:
+                        if isinstance(sink, PipeSink):
+                            # A streaming player takes the file in blocks, so memory stays bounded
+                            for block in iter(lambda: f.read(DIALOGUE_SPOOL_BYTES), b""):
+                                digest.update(block)
+                                size += len(block)
+                                playback.submit(sink.play, block)
+                        else:
+                            # Other sinks play what they get as a whole clip; a block past the header is noise
+                            audio_bytes = f.read()
+                            digest.update(audio_bytes)
+                            size += len(audio_bytes)
+                            playback.submit(sink.play, audio_bytes)
+                else:
+                    # Sliding window: at most DIALOGUE_CONCURRENCY chunks in flight
+                    with ThreadPoolExecutor(max_workers=DIALOGUE_CONCURRENCY) as pool, \
+                            self.audio_store.writer(key, output_format) as f:
+                        pending = deque()
+                        next_chunk = 0
+                        while next_chunk < len(chunks) or pending:
+                            while next_chunk < len(chunks) and len(pending) < DIALOGUE_CONCURRENCY:
+                                pending.append(pool.submit(self.synthesize_dialogue_chunk, chunks[next_chunk]))
+                                next_chunk += 1
+                            
+                            with pending.popleft().result() as spool:
+                                audio_bytes = spool.read()
+                            f.write(audio_bytes)
+                            digest.update(audio_bytes)
+                            size += len(audio_bytes)
+                            # Blocks while two chunks are already waiting to play
+                            playback.submit(sink.play, audio_bytes)
+                    
+                    print(f"🎬 Dialogue audio saved: {dialogue_file}")
+            finally:
+                # Let the chunks already queued finish playing
+                playback.close()
+                sink.close()
+            
+            if cached:
+                self.transfer_stats.record(self.archive_profile["name"], size, cached=True)
+            self.shared_memory["audio_files"].append({
+                "agent_type": "dialogue",
+                "label": "full_dialogue",
+                "key": key,
+                "output_format": output_format,
+                "profile": self.archive_profile["name"],
+                "filename": dialogue_file,
+                "sha256": digest.hexdigest(),
+                "bytes": size,
+                "cached": cached,
+                "timestamp": datetime.now().isoformat(),
+                "status": "saved"
+            })
+            return dialogue_file
             
         except Exception as e:
             print(f"❌ Dialogue audio error: {e}")
@@ -284,7 +447,8 @@ class AudioDebateSystem:
     def create_tasks(self):
         """Create tasks optimized for audio presentation"""
         
-        # Research tasks (background - may not be spoken)
+        # Research tasks (background - may not be spoken). Both are async, so
+        # they run concurrently and the first debater task waits for both.
         self.task_research_pro = Task(
             description=f"""Conduct thorough research to support the PRO position on: {self.debate_topic}
             
@@ -298,7 +462,9 @@ class AudioDebateSystem:
             Structure findings clearly for use in audio debate arguments.
             """,
             expected_output="Comprehensive research findings formatted for audio debate presentation",
-            agent=self.research_agent_pro
+            agent=self.research_agent_pro,
+            async_execution=True,  # runs alongside the con research
+            callback=partial(self.on_task_complete, "research_pro")
         )
         
         self.task_research_con = Task(
@@ -314,7 +480,9 @@ class AudioDebateSystem:
             Structure findings clearly for use in audio debate arguments.
             """,
             expected_output="Comprehensive research findings formatted for audio debate presentation",
-            agent=self.research_agent_con
+            agent=self.research_agent_con,
+            async_execution=True,  # runs alongside the pro research
+            callback=partial(self.on_task_complete, "research_con")
         )
 
         # Audio-optimized debate tasks
@@ -330,11 +498,13 @@ class AudioDebateSystem:
             - Aim for 250-350 words for optimal audio length
             - Write as if speaking directly to an audience
             
-            Research context: Use findings from the Pro Research Specialist
+            Research context: Use findings from the Pro Research Specialist, and
+            anticipate the opposing evidence gathered by the Con Research Specialist
             """,
             expected_output="A persuasive 2-3 minute audio argument with natural speech patterns",
             agent=self.agent_pro,
-            context=[self.task_research_pro]
+            context=[self.task_research_pro, self.task_research_con],
+            callback=partial(self.on_task_complete, "argument_pro")
         )
         
         self.task_con = Task(
@@ -349,11 +519,13 @@ class AudioDebateSystem:
             - Aim for 250-350 words for optimal audio length
             - Write as if speaking directly to an audience
             
-            Research context: Use findings from the Con Research Specialist
+            Research context: Use findings from the Con Research Specialist, and
+            anticipate the supporting evidence gathered by the Pro Research Specialist
             """,
             expected_output="A persuasive 2-3 minute audio argument with natural speech patterns",
             agent=self.agent_con,
-            context=[self.task_research_con]
+            context=[self.task_research_con, self.task_research_pro],
+            callback=partial(self.on_task_complete, "argument_con")
         )
         
         self.task_judge = Task(
@@ -372,9 +544,43 @@ class AudioDebateSystem:
             """,
             expected_output="A balanced audio evaluation with clear winner declaration",
             agent=self.judge_agent,
-            context=[self.task_research_pro, self.task_research_con, self.task_pro, self.task_con]
+            context=[self.task_research_pro, self.task_research_con, self.task_pro, self.task_con],
+            callback=partial(self.on_task_complete, "judge_evaluation")
         )
     
+    def start_speech_pipeline(self, task_handlers):
+        """Speak task outputs in order as soon as each task completes.
+
+        ``task_handlers`` maps a task name to a function taking the task
+        output. Handlers run one at a time on a background worker, so the pro
+        argument is voiced while the con and judge tasks are still generating.
+        """
+        self.task_handlers = task_handlers
+        self.speech_jobs = []
+        self.speech_pipeline = PlaybackWorker(max_pending=8, name="speech-pipeline")
+    
+    def queue_speech(self, fn, *args):
+        """Queue a speech job behind everything already queued"""
+        self.speech_jobs.append(self.speech_pipeline.submit(fn, *args))
+    
+    def on_task_complete(self, task_name, output):
+        """CrewAI task callback: hand the finished output to the speech pipeline"""
+        handler = self.task_handlers.get(task_name)
+        if handler is not None and self.speech_pipeline is not None:
+            self.queue_speech(handler, output)
+    
+    def finish_speech_pipeline(self):
+        """Wait for queued speech to finish and report any failed jobs"""
+        if self.speech_pipeline is None:
+            return
+        self.speech_pipeline.close()
+        for job in self.speech_jobs:
+            if job.exception() is not None:
+                print(f"⚠️ Error in audio generation: {job.exception()}")
+        self.speech_pipeline = None
+        self.task_handlers = {}
+        self.finish_recorded_speech()
+    
     def update_shared_memory(self, key, data):
         """Update shared memory with new information"""
         if key in self.shared_memory:
@@ -410,7 +616,7 @@ class AudioDebateSystem:
                     print("="*50)
                     self.stream_text_realtime(str(output), agent_type)
                 else:
-                    self.speak_text(str(output), agent_type, f"pro_argument_{datetime.now().strftime('%H%M%S')}")
+                    self.queue_recorded_speech(str(output), agent_type, "pro_argument")
                 task_data["audio_generated"] = True
         elif task_name == "argument_con":
             self.update_shared_memory("con_debater_argument", task_data)
@@ -421,7 +627,7 @@ class AudioDebateSystem:
                     print("="*50)
                     self.stream_text_realtime(str(output), agent_type)
                 else:
-                    self.speak_text(str(output), agent_type, f"con_argument_{datetime.now().strftime('%H%M%S')}")
+                    self.queue_recorded_speech(str(output), agent_type, "con_argument")
                 task_data["audio_generated"] = True
         elif task_name == "judge_evaluation":
             self.update_shared_memory("judge_evaluation", task_data)
@@ -432,7 +638,7 @@ class AudioDebateSystem:
                     print("="*50)
                     self.stream_text_realtime(str(output), agent_type)
                 else:
-                    self.speak_text(str(output), agent_type, f"judge_evaluation_{datetime.now().strftime('%H%M%S')}")
+                    self.queue_recorded_speech(str(output), agent_type, "judge_evaluation")
                 task_data["audio_generated"] = True
     
     def run_streaming_conversational_debate(self):
@@ -458,46 +664,51 @@ class AudioDebateSystem:
             verbose=True
         )
         
-        print("🚀 Generating debate content...")
-        result = debate_crew.kickoff()
-        
-        # Get the arguments
-        pro_arg = str(self.task_pro.output) if hasattr(self.task_pro, 'output') else "Pro argument not available"
-        con_arg = str(self.task_con.output) if hasattr(self.task_con, 'output') else "Con argument not available"
-        judge_eval = str(self.task_judge.output) if hasattr(self.task_judge, 'output') else "Judge evaluation not available"
+        def speak_pro(output):
+            print(f"🎯 PRO POSITION:")
+            pro_intro = "Thank you, moderator. Ladies and gentlemen, I'm here to argue in favor of this proposition."
+            self.stream_text_realtime(pro_intro, "pro_debater")
+            self.stream_text_realtime(str(output), "pro_debater")
+        
+        def speak_con(output):
+            # Transition
+            transition_text = "Thank you for that compelling argument. Now let's hear from our opposing debater."
+            self.stream_text_realtime(transition_text, "judge")
+            
+            print(f"🎯 CON POSITION:")
+            con_intro = "Thank you. I appreciate the previous speaker's points, but I must respectfully disagree."
+            self.stream_text_realtime(con_intro, "con_debater")
+            self.stream_text_realtime(str(output), "con_debater")
+        
+        def speak_judge(output):
+            # Closing and judgment
+            closing_text = "We've heard compelling arguments from both sides. Let me now provide my evaluation and final judgment."
+            self.stream_text_realtime(closing_text, "judge")
+            self.stream_text_realtime(str(output), "judge")
+            
+            # Final closing
+            final_text = "That concludes today's live debate. Thank you to both our debaters and to you for listening."
+            self.stream_text_realtime(final_text, "judge")
+        
+        # Each section is streamed as soon as its task completes
+        self.start_speech_pipeline({
+            "argument_pro": speak_pro,
+            "argument_con": speak_con,
+            "judge_evaluation": speak_judge
+        })
         
-        # Stream the debate live in conversational format
         print(f"\n🎬 STARTING LIVE DEBATE STREAM...")
         print(f"{'='*60}")
         
-        # Opening
+        # Opening plays while the research tasks run
         opening_text = f"Welcome to today's live debate on: {self.debate_topic}. I'm your moderator, and we have two expert debaters ready to present their cases. Let's begin with our first speaker."
-        self.stream_text_realtime(opening_text, "judge")
-        
-        # Pro argument
-        print(f"🎯 PRO POSITION:")
-        pro_intro = "Thank you, moderator. Ladies and gentlemen, I'm here to argue in favor of this proposition."
-        self.stream_text_realtime(pro_intro, "pro_debater")
-        self.stream_text_realtime(pro_arg, "pro_debater")
-        
-        # Transition
-        transition_text = "Thank you for that compelling argument. Now let's hear from our opposing debater."
-        self.stream_text_realtime(transition_text, "judge")
-        
-        # Con argument  
-        print(f"🎯 CON POSITION:")
-        con_intro = "Thank you. I appreciate the previous speaker's points, but I must respectfully disagree."
-        self.stream_text_realtime(con_intro, "con_debater")
-        self.stream_text_realtime(con_arg, "con_debater")
+        self.queue_speech(self.stream_text_realtime, opening_text, "judge")
         
-        # Closing and judgment
-        closing_text = "We've heard compelling arguments from both sides. Let me now provide my evaluation and final judgment."
-        self.stream_text_realtime(closing_text, "judge")
-        self.stream_text_realtime(judge_eval, "judge")
-        
-        # Final closing
-        final_text = "That concludes today's live debate. Thank you to both our debaters and to you for listening."
-        self.stream_text_realtime(final_text, "judge")
+        print("🚀 Generating debate content...")
+        try:
+            result = debate_crew.kickoff()
+        finally:
+            self.finish_speech_pipeline()
         
         print(f"\n{'='*60}")
         print("🏁 LIVE DEBATE STREAM COMPLETE!")
@@ -563,6 +774,16 @@ class AudioDebateSystem:
         
         return result
     
+    def write_audio_manifest(self):
+        """Record the store keys this debate used; returns the manifest path"""
+        clips = [entry for entry in self.shared_memory["audio_files"] if entry.get("key")]
+        if not clips:
+            return None
+        path = self.audio_store.write_manifest(self.debate_id, clips, topic=self.debate_topic, mode=self.mode)
+        reused = sum(1 for clip in clips if clip.get("cached"))
+        print(f"🗂️ Audio manifest saved: {path} ({len(clips)} clips, {reused} reused from the store)")
+        return path
+    
     def save_audio_debate_log(self, result):
         """Save complete debate session including audio information"""
         log_data = {
@@ -570,8 +791,10 @@ class AudioDebateSystem:
             "mode": self.mode,
             "timestamp": self.shared_memory["timestamp"],
             "shared_memory": self.shared_memory,
-            "audio_directory": self.audio_dir,
+            "debate_id": self.debate_id,
+            "audio_manifest": self.write_audio_manifest(),
             "audio_enabled": self.audio_enabled,
+            "audio_transfer": self.transfer_stats.summary(),
             "final_result": str(result)
         }
         
@@ -613,37 +836,31 @@ class AudioDebateSystem:
                 verbose=True
             )
             
+            # Capture outputs with audio generation as each task completes
             if self.streaming:
                 print("🔴 Starting live streaming audio debate...")
+                print("📡 Debate components stream live as soon as they finish")
             else:
                 print("🚀 Starting audio-enhanced debate...")
-            
-            result = debate_crew.kickoff()
-            
-            # Capture outputs with audio generation
-            if self.streaming:
-                print("\n📡 Live streaming debate components...")
-            else:
-                print("\n🎙️ Generating speech for debate components...")
+                print("🎙️ Speech is generated for each component as soon as it finishes")
+            
+            self.start_speech_pipeline({
+                "research_pro": lambda output: self.capture_task_output_with_audio(
+                    "research_pro", "Pro Research Specialist", output, "researcher"),
+                "research_con": lambda output: self.capture_task_output_with_audio(
+                    "research_con", "Con Research Specialist", output, "researcher"),
+                "argument_pro": lambda output: self.capture_task_output_with_audio(
+                    "argument_pro", "Pro Debater", output, "pro_debater"),
+                "argument_con": lambda output: self.capture_task_output_with_audio(
+                    "argument_con", "Con Debater", output, "con_debater"),
+                "judge_evaluation": lambda output: self.capture_task_output_with_audio(
+                    "judge_evaluation", "Debate Judge", output, "judge")
+            })
             
             try:
-                if hasattr(self.task_research_pro, 'output'):
-                    self.capture_task_output_with_audio("research_pro", "Pro Research Specialist", self.task_research_pro.output, "researcher")
-                
-                if hasattr(self.task_research_con, 'output'):
-                    self.capture_task_output_with_audio("research_con", "Con Research Specialist", self.task_research_con.output, "researcher")
-                
-                if hasattr(self.task_pro, 'output'):
-                    self.capture_task_output_with_audio("argument_pro", "Pro Debater", self.task_pro.output, "pro_debater")
-                
-                if hasattr(self.task_con, 'output'):
-                    self.capture_task_output_with_audio("argument_con", "Con Debater", self.task_con.output, "con_debater")
-                
-                if hasattr(self.task_judge, 'output'):
-                    self.capture_task_output_with_audio("judge_evaluation", "Debate Judge", self.task_judge.output, "judge")
-                    
-            except Exception as e:
-                print(f"⚠️ Error in audio generation: {e}")
+                result = debate_crew.kickoff()
+            finally:
+                self.finish_speech_pipeline()
         
         print(f"\n{'='*60}")
         if self.streaming:
@@ -651,10 +868,11 @@ class AudioDebateSystem:
             print("📡 Real-time streaming session finished")
         else:
             print("🏆 AUDIO DEBATE COMPLETE!")
-            print(f"🎵 Audio files saved in: {self.audio_dir}")
+            print(f"🎵 Audio clips saved in: {self.audio_store.root}")
         print(f"{'='*60}")
         
         # Save complete log
+        self.transfer_stats.print_report()
         self.save_audio_debate_log(result)
         
         return result
@@ -681,19 +899,20 @@ def main():
         return
     
     # Check audio requirements
-    if not ELEVENLABS_AVAILABLE:
-        print("❌ ElevenLabs library not installed!")
-        print("📦 Install with: pip install elevenlabs")
-        return
-    
-    if not os.getenv("ELEVENLABS_API_KEY"):
-        print("❌ ElevenLabs API key not found!")
-        print("🔑 Add ELEVENLABS_API_KEY to your .env file")
+    tts = get_backend()
+    if not tts.available():
+        if tts.name == "elevenlabs":
+            print("❌ ElevenLabs not available!")
+            print("📦 Install with: pip install elevenlabs, and add ELEVENLABS_API_KEY to your .env file")
+        else:
+            print("❌ No TTS engine available!")
+            print("📦 Add ELEVENLABS_API_KEY to your .env file, or install espeak-ng for offline speech (TTS_BACKEND=local)")
         return
+    print(f"🔊 TTS backend: {tts.name}")
     
     try:
         # Create audio debate system
-        audio_system = AudioDebateSystem(mode=args.mode)
+        audio_system = AudioDebateSystem(mode=args.mode, tts=tts)
         audio_system.save_audio = args.save_audio or True  # Default to saving
         
         if args.no_playback:
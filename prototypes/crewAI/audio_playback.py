@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Audio Playback Worker
+One long-lived thread that plays utterances strictly in the order they were queued,
+writing audio bytes straight into a long-lived player process or sink
+"""
+
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Player commands are shared with the TTS backends (prototypes/TTS)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "TTS"))
+from tts_backends import CLIP_PLAYERS, STREAM_PLAYERS, clip_players
+
+# mp3_44100_128 (the ElevenLabs default) is 128 kbit/s = 16000 bytes per second
+MP3_BYTES_PER_SECOND = 16000
+
+class PlaybackWorker:
+    """Single playback thread fed by a bounded queue.
+
+    Jobs run one at a time in submission order. When ``max_pending`` jobs are
+    already waiting, ``submit`` blocks, which applies backpressure to whatever
+    is producing audio. Each job gets a ``Future`` that completes when it has
+    finished playing.
+    """
+
+    def __init__(self, max_pending=2, name="audio-playback"):
+        self.jobs = queue.Queue(maxsize=max_pending)
+        self.closed = False
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+
+    def submit(self, fn, *args):
+        """Queue ``fn(*args)`` for playback and return its completion future"""
+        if self.closed:
+            raise RuntimeError("Playback worker is closed")
+        future = Future()
+        self.jobs.put((future, fn, args))
+        return future
+
+    def _run(self):
+        while True:
+            job = self.jobs.get()
+            try:
+                if job is None:
+                    return
+                future, fn, args = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(fn(*args))
+                except Exception as e:
+                    future.set_exception(e)
+            finally:
+                self.jobs.task_done()
+
+    def join(self):
+        """Block until every queued job has finished playing"""
+        self.jobs.join()
+
+    def close(self, wait=True):
+        """Stop the worker after the jobs already queued have played"""
+        if self.closed:
+            return
+        self.closed = True
+        self.jobs.put(None)
+        if wait:
+            self.thread.join()
+
+class SpeechScheduler:
+    """Synthesizes upcoming utterances while the current one is playing.
+
+    ``say`` queues an utterance behind everything already queued. Its
+    synthesis starts right away on a small pool, so up to ``lookahead``
+    utterances are ready by the time the one in front of them finishes
+    playing. ``say`` blocks once that many are waiting, which keeps memory
+    bounded and paces generation to playback.
+    """
+
+    def __init__(self, synthesize, play, lookahead=1, playback=None):
+        self.synthesize = synthesize  # (text, label) -> audio bytes or None
+        self.play = play  # (audio_bytes, label) -> None
+        self.lookahead = lookahead
+        self.slots = threading.Semaphore(lookahead + 1)
+        self.synth_pool = ThreadPoolExecutor(max_workers=lookahead + 1, thread_name_prefix="tts-prefetch")
+        self.playback = playback or PlaybackWorker(max_pending=lookahead + 1)
+
+    def say(self, text, label):
+        """Queue an utterance; returns a future completed once it has played"""
+        self.slots.acquire()
+        try:
+            synth_future = self.synth_pool.submit(self.synthesize, text, label)
+            return self.playback.submit(self._play_when_ready, synth_future, label)
+        except Exception:
+            self.slots.release()
+            raise
+
+    def _play_when_ready(self, synth_future, label):
+        try:
+            audio_bytes = synth_future.result()
+            if audio_bytes:
+                self.play(audio_bytes, label)
+            return audio_bytes
+        finally:
+            self.slots.release()
+
+    def join(self):
+        """Block until every queued utterance has been played"""
+        self.playback.join()
+
+    def close(self):
+        self.playback.close()
+        self.synth_pool.shutdown(wait=True)
+
+class NullSink:
+    """Discards audio instantly; for headless servers and tests"""
+
+    name = "null"
+
+    def __init__(self):
+        self.utterances = 0
+        self.bytes_played = 0
+
+    def play(self, audio_bytes):
+        self.utterances += 1
+        self.bytes_played += len(audio_bytes)
+
+    def close(self):
+        pass
+
+class PipeSink:
+    """Streams audio into one long-lived player process through its stdin.
+
+    The player is started on first use and kept running, so an utterance costs
+    a pipe write instead of a temp file plus a process spawn. ``play`` returns
+    once the clip should have finished, estimated from ``bytes_per_second``
+    (0 disables pacing).
+    """
+
+    def __init__(self, command, bytes_per_second=MP3_BYTES_PER_SECOND):
+        self.command = list(command)
+        self.name = os.path.basename(self.command[0])
+        self.bytes_per_second = bytes_per_second
+        self.process = None
+        self.playing_until = 0.0
+
+    def _ensure_process(self):
+        if self.process is None or self.process.poll() is not None:
+            self.process = subprocess.Popen(
+                self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            self.playing_until = 0.0
+        return self.process
+
+    def play(self, audio_bytes):
+        try:
+            process = self._ensure_process()
+            process.stdin.write(audio_bytes)
+            process.stdin.flush()
+        except BrokenPipeError:
+            # Player exited underneath us; restart it once and retry
+            self.process = None
+            process = self._ensure_process()
+            process.stdin.write(audio_bytes)
+            process.stdin.flush()
+
+        if self.bytes_per_second:
+            now = time.monotonic()
+            self.playing_until = max(now, self.playing_until) + len(audio_bytes) / self.bytes_per_second
+            time.sleep(max(0.0, self.playing_until - now))
+
+    def close(self):
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+        self.process = None
+
+class ClipSink:
+    """Plays each clip with its own player process and returns when it has finished.
+
+    For formats whose clips each carry a header, where one long-lived player
+    would stop at the end of the first clip.
+    """
+
+    def __init__(self, command):
+        self.command = list(command)
+        self.name = f"clip:{os.path.basename(self.command[0])}"
+
+    def play(self, audio_bytes):
+        subprocess.run(self.command, input=audio_bytes, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def close(self):
+        pass
+
+class ElevenLabsPlaySink:
+    """Fallback that hands bytes to ``elevenlabs.play`` without a temp file"""
+
+    name = "elevenlabs"
+
+    def play(self, audio_bytes):
+        from elevenlabs import play
+        play(audio_bytes)
+
+    def close(self):
+        pass
+
+def create_audio_sink(kind=None, bytes_per_second=MP3_BYTES_PER_SECOND, per_clip=False):
+    """Create the audio sink named by ``kind`` or ``DEBATE_AUDIO_SINK``.
+
+    ``auto`` (the default) picks the first streaming player on PATH, then the
+    ElevenLabs player, then the null sink. ``bytes_per_second`` should match
+    the bitrate of the audio being played. ``per_clip`` (or the ``clip``
+    kind) starts a player per clip instead, for audio that can't be streamed
+    into one player.
+    """
+    kind = (kind or os.getenv("DEBATE_AUDIO_SINK", "auto")).lower()
+
+    if kind == "null":
+        return NullSink()
+    if kind == "elevenlabs":
+        return ElevenLabsPlaySink()
+    if kind == "clip" or (per_clip and kind in CLIP_PLAYERS):
+        # per_clip audio is WAV; otherwise only players that handle any format
+        commands = clip_players("wav" if per_clip else None)
+        if kind != "clip":
+            commands = {kind: commands[kind]}
+        for name, command in commands.items():
+            if shutil.which(name):
+                return ClipSink(command)
+        return NullSink()
+    if kind in STREAM_PLAYERS:
+        return PipeSink(STREAM_PLAYERS[kind], bytes_per_second)
+    if kind != "auto":
+        raise ValueError(f"Unknown audio sink: {kind}")
+
+    if per_clip:
+        return create_audio_sink("clip", per_clip=True)
+    for name, command in STREAM_PLAYERS.items():
+        if shutil.which(name):
+            return PipeSink(command, bytes_per_second)
+    try:
+        import elevenlabs  # noqa: F401
+        return ElevenLabsPlaySink()
+    except ImportError:
+        return NullSink()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Audio Store
+Deduplicated speech clips keyed by (voice, model, text, format), referenced from per-debate manifests
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+STORE_DIR = "audio_store"
+
+# Unreferenced blobs younger than this are kept; their debate may still be running
+GC_GRACE_SECONDS = 3600
+
+def format_extension(output_format):
+    """File extension for an ElevenLabs output format such as mp3_44100_128"""
+    return (output_format or "mp3").split("_")[0]
+
+class AudioStore:
+    """Blobs live at ``blobs/<k[:2]>/<key>.<ext>`` and are written once.
+
+    The key is a hash of everything that determines the audio, so a line
+    spoken again by the same voice is served from disk instead of being
+    synthesized and stored a second time. Each debate records the keys it
+    used in ``manifests/<debate_id>.json``; a blob's reference count is the
+    number of manifest entries pointing at it.
+    """
+
+    def __init__(self, root=STORE_DIR):
+        self.root = root
+        self.blob_dir = os.path.join(root, "blobs")
+        self.manifest_dir = os.path.join(root, "manifests")
+        self.locks = {}
+        self.locks_guard = threading.Lock()
+
+    @staticmethod
+    def key(voice_id, model_id, text, output_format):
+        """Content address for one synthesis request"""
+        payload = json.dumps([voice_id, model_id, output_format, text], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def blob_path(self, key, output_format="mp3"):
+        return os.path.join(self.blob_dir, key[:2], f"{key}.{format_extension(output_format)}")
+
+    def _key_lock(self, key):
+        with self.locks_guard:
+            return self.locks.setdefault(key, threading.Lock())
+
+    def get(self, key, output_format="mp3"):
+        """Stored audio bytes, or None on a miss"""
+        try:
+            with open(self.blob_path(key, output_format), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    @contextmanager
+    def writer(self, key, output_format="mp3"):
+        """Write a blob incrementally; it only becomes visible once complete"""
+        path = self.blob_path(key, output_format)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                yield f
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def put(self, key, audio, output_format="mp3"):
+        """Store audio bytes under ``key`` (no-op if already present)"""
+        path = self.blob_path(key, output_format)
+        if not os.path.exists(path):
+            with self.writer(key, output_format) as f:
+                f.write(audio)
+        return path
+
+    def touch(self, key, output_format="mp3"):
+        """Mark a blob as just used so ``gc`` spares it until its manifest is written"""
+        try:
+            os.utime(self.blob_path(key, output_format))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def get_or_create(self, key, synthesize, output_format="mp3"):
+        """Return ``(audio, cached)``, calling ``synthesize()`` only on a miss.
+
+        Concurrent requests for the same key wait for the first one instead
+        of synthesizing the same line twice.
+        """
+        with self._key_lock(key):
+            audio = self.get(key, output_format)
+            if audio is not None:
+                self.touch(key, output_format)
+                return audio, True
+            audio = synthesize()
+            self.put(key, audio, output_format)
+            return audio, False
+
+    def manifest_path(self, debate_id):
+        return os.path.join(self.manifest_dir, f"{debate_id}.json")
+
+    def write_manifest(self, debate_id, clips, **metadata):
+        """Record which blobs a debate uses; clips need ``key`` and ``output_format``"""
+        manifest = {"debate_id": debate_id, "created": datetime.now().isoformat(), **metadata, "clips": clips}
+        path = self.manifest_path(debate_id)
+        os.makedirs(self.manifest_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.manifest_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(manifest, f, indent=2, default=str)
+        os.replace(tmp_path, path)
+        return path
+
+    def load_manifest(self, debate_id):
+        with open(self.manifest_path(debate_id), "r") as f:
+            return json.load(f)
+
+    def manifests(self):
+        if not os.path.isdir(self.manifest_dir):
+            return
+        for name in sorted(os.listdir(self.manifest_dir)):
+            if name.endswith(".json"):
+                with open(os.path.join(self.manifest_dir, name), "r") as f:
+                    yield json.load(f)
+
+    def refcounts(self):
+        """Number of manifest references per blob path"""
+        counts = Counter()
+        for manifest in self.manifests():
+            for clip in manifest.get("clips", []):
+                if clip.get("key"):
+                    counts[self.blob_path(clip["key"], clip.get("output_format"))] += 1
+        return counts
+
+    def blobs(self):
+        for directory, _, names in os.walk(self.blob_dir):
+            for name in names:
+                if not name.endswith(".tmp"):
+                    yield os.path.join(directory, name)
+
+    def delete_manifest(self, debate_id):
+        """Drop a debate's references; its blobs go at the next ``gc``"""
+        os.remove(self.manifest_path(debate_id))
+
+    def gc(self, grace_seconds=GC_GRACE_SECONDS, dry_run=False):
+        """Delete blobs no manifest references. Returns (blobs removed, bytes freed)"""
+        referenced = self.refcounts()
+        cutoff = time.time() - grace_seconds
+        removed, freed = 0, 0
+        for path in self.blobs():
+            if referenced[path] or os.path.getmtime(path) > cutoff:
+                continue
+            freed += os.path.getsize(path)
+            removed += 1
+            if not dry_run:
+                os.remove(path)
+        return removed, freed
+
+    def verify(self):
+        """Check every manifest reference: blob present and content digest unchanged"""
+        report = {"ok": 0, "missing": [], "corrupt": [], "unreferenced": []}
+        referenced = set()
+        for manifest in self.manifests():
+            for clip in manifest.get("clips", []):
+                if not clip.get("key"):
+                    continue
+                path = self.blob_path(clip["key"], clip.get("output_format"))
+                referenced.add(path)
+                if not os.path.exists(path):
+                    report["missing"].append((manifest["debate_id"], path))
+                    continue
+                expected = clip.get("sha256")
+                if expected:
+                    with open(path, "rb") as f:
+                        if hashlib.sha256(f.read()).hexdigest() != expected:
+                            report["corrupt"].append((manifest["debate_id"], path))
+                            continue
+                report["ok"] += 1
+        report["unreferenced"] = [path for path in self.blobs() if path not in referenced]
+        return report
+
+    def usage(self):
+        """(blob count, bytes on disk, bytes referenced by manifests)"""
+        sizes = {path: os.path.getsize(path) for path in self.blobs()}
+        logical = sum(sizes.get(path, 0) * count for path, count in self.refcounts().items())
+        return len(sizes), sum(sizes.values()), logical
+
+def main():
+    commands = ["stats", "verify", "gc"]
+    if len(sys.argv) < 2 or sys.argv[1] not in commands:
+        print(f"Usage: python audio_store.py {{{'|'.join(commands)}}} [store_dir]")
+        sys.exit(1)
+    store = AudioStore(sys.argv[2] if len(sys.argv) > 2 else STORE_DIR)
+
+    if sys.argv[1] == "stats":
+        blobs, stored, logical = store.usage()
+        print(f"🎵 {blobs} blobs, {stored / 1e6:.1f} MB on disk, {logical / 1e6:.1f} MB referenced "
+              f"({logical / stored if stored else 1:.1f}x deduplication)")
+    elif sys.argv[1] == "verify":
+        report = store.verify()
+        print(f"✅ {report['ok']} references verified")
+        for debate_id, path in report["missing"]:
+            print(f"❌ Missing: {path} (debate {debate_id})")
+        for debate_id, path in report["corrupt"]:
+            print(f"❌ Corrupt: {path} (debate {debate_id})")
+        if report["unreferenced"]:
+            print(f"🗑️ {len(report['unreferenced'])} unreferenced blobs (run gc)")
+        sys.exit(1 if report["missing"] or report["corrupt"] else 0)
+    else:
+        removed, freed = store.gc()
+        print(f"🗑️ Removed {removed} unreferenced blobs, freed {freed / 1e6:.1f} MB")
+
+if __name__ == "__main__":
+    main()
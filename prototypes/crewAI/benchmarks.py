@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Debate System Benchmarks
+Measures orchestration overhead of the debate systems without real API calls
+"""
+
+import argparse
+import os
+import subprocess
+import tempfile
+import threading
+import time
+import tracemalloc
+from crewai import BaseLLM, Task, Crew
+from crew_audio_debate_system import CrewAudioDebateSystem
+from event_store import DebateEventStore, load_shared_memory
+from conversation_context import ConversationContext, estimate_tokens
+from audio_playback import PlaybackWorker, PipeSink, SpeechScheduler
+from audio_store import AudioStore
+from audio_profiles import AUDIO_PROFILES, TransferStats, bytes_per_second, get_profile
+import audio_debate_system
+from tts_backends import TTSBackend
+
+class FakeLLM(BaseLLM):
+    """Instant LLM stand-in so only CrewAI orchestration cost is measured"""
+
+    def __init__(self, reply="I hear you, but the evidence says otherwise."):
+        super().__init__(model="fake-llm")
+        self.reply = reply
+        self.calls = 0
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs):
+        self.calls += 1
+        return f"Thought: I now can give a great answer\nFinal Answer: {self.reply}"
+
+    def supports_function_calling(self):
+        return False
+
+class SlowFakeLLM(FakeLLM):
+    """Fake LLM with a fixed per-call latency, to expose sequential vs parallel work"""
+
+    def __init__(self, seconds=0.5):
+        super().__init__()
+        self.seconds = seconds
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs):
+        time.sleep(self.seconds)
+        return super().call(messages, tools, callbacks, available_functions, **kwargs)
+
+def create_benchmark_system(turns):
+    """Create a text-only conversational debate system backed by the fake LLM"""
+    system = CrewAudioDebateSystem(llm=FakeLLM())
+    system.audio_enabled = False
+    system.max_turns_per_agent = turns
+    system.debate_topic = "Should remote work be the standard?"
+    system.create_structured_debate_agents()
+    return system
+
+def run_legacy_turn(system, turn_number):
+    """Previous behaviour: build fresh tasks and a fresh crew for every call"""
+    for agent in (system.agent_pro, system.agent_con):
+        task = Task(
+            description=f"Respond naturally about: {system.debate_topic} (Exchange {turn_number})",
+            expected_output="A natural, conversational response of 1-2 sentences (under 30 words)",
+            agent=agent
+        )
+        crew = Crew(agents=[agent], tasks=[task], verbose=False)
+        crew.kickoff()
+
+def run_persistent_turn(system, turn_number):
+    """Current behaviour: reuse the per-debate crews with interpolated inputs"""
+    system.run_turn_crew("pro_turn", system.build_turn_inputs(turn_number, "Opening statement"))
+    system.run_turn_crew("con_turn", system.build_turn_inputs(turn_number, "Opening statement"))
+
+def benchmark_turn_overhead(turns=20):
+    """Compare per-turn orchestration overhead of fresh vs persistent crews"""
+    print(f"\n⏱️ TURN ORCHESTRATION OVERHEAD ({turns} exchanges, fake LLM)")
+    print("="*50)
+
+    system = create_benchmark_system(turns)
+    try:
+        start = time.perf_counter()
+        for turn in range(1, turns + 1):
+            run_legacy_turn(system, turn)
+        legacy = (time.perf_counter() - start) / turns
+    finally:
+        system.close()
+
+    system = create_benchmark_system(turns)
+    try:
+        start = time.perf_counter()
+        system.create_structured_debate_crews()
+        for turn in range(1, turns + 1):
+            run_persistent_turn(system, turn)
+        persistent = (time.perf_counter() - start) / turns
+    finally:
+        system.close()
+
+    print(f"🆕 Fresh crew per call:  {legacy * 1000:8.2f} ms/exchange")
+    print(f"♻️ Persistent crews:     {persistent * 1000:8.2f} ms/exchange")
+    if persistent > 0:
+        print(f"📉 Speedup: {legacy / persistent:.2f}x")
+    return {"legacy_ms": legacy * 1000, "persistent_ms": persistent * 1000}
+
+def benchmark_playback_worker(utterances=2000, clip_bytes=32000):
+    """Check thread count and memory stay flat over a long playback session"""
+    print(f"\n🔊 PLAYBACK WORKER FOOTPRINT ({utterances} utterances)")
+    print("="*50)
+
+    worker = PlaybackWorker(max_pending=2)
+    tracemalloc.start()
+    samples = []
+    for i in range(utterances):
+        worker.submit(lambda audio_bytes, role: len(audio_bytes), bytes(clip_bytes), "Pro Debater")
+        if i % (utterances // 4) == 0:
+            samples.append((i, threading.active_count(), tracemalloc.get_traced_memory()[0]))
+    worker.join()
+    samples.append((utterances, threading.active_count(), tracemalloc.get_traced_memory()[0]))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    worker.close()
+
+    for i, threads, current in samples:
+        print(f"   after {i:5d} utterances: {threads} threads, {current / 1024:8.1f} KiB traced")
+    print(f"📈 Peak traced memory: {peak / 1024:.1f} KiB")
+    return {"samples": samples, "peak_bytes": peak}
+
+def benchmark_playback_start(utterances=50, clip_bytes=32000):
+    """Compare per-utterance start latency: temp file + spawn vs long-lived pipe"""
+    print(f"\n🚀 PLAYBACK START LATENCY ({utterances} utterances, `cat` as player)")
+    print("="*50)
+    audio_bytes = bytes(clip_bytes)
+
+    # Previous behaviour: write a temp file, then start a player process for it
+    start = time.perf_counter()
+    for _ in range(utterances):
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False, mode='wb') as temp_file:
+            temp_file.write(audio_bytes)
+            temp_file_path = temp_file.name
+        process = subprocess.Popen(["cat", temp_file_path], stdout=subprocess.DEVNULL)
+        process.wait()
+        os.unlink(temp_file_path)
+    legacy = (time.perf_counter() - start) / utterances
+
+    # Current behaviour: bytes written into one already-running player
+    sink = PipeSink(["cat"], bytes_per_second=0)
+    sink.play(b"")  # player started before the first utterance
+    start = time.perf_counter()
+    for _ in range(utterances):
+        sink.play(audio_bytes)
+    piped = (time.perf_counter() - start) / utterances
+    sink.close()
+
+    print(f"📄 Temp file + spawn: {legacy * 1000:8.3f} ms/utterance")
+    print(f"🚰 Long-lived pipe:   {piped * 1000:8.3f} ms/utterance")
+    return {"legacy_ms": legacy * 1000, "pipe_ms": piped * 1000}
+
+def measure_speaker_gaps(lookahead, utterances, synth_seconds, play_seconds):
+    """Return the silent gaps between consecutive utterances for one lookahead"""
+    spans = []
+
+    def synthesize(text, label):
+        time.sleep(synth_seconds)
+        return text.encode()
+
+    def play(audio_bytes, label):
+        start = time.perf_counter()
+        time.sleep(play_seconds)
+        spans.append((start, time.perf_counter()))
+
+    scheduler = SpeechScheduler(synthesize, play, lookahead=lookahead)
+    for i in range(utterances):
+        scheduler.say(f"utterance {i}", "Pro Debater" if i % 2 == 0 else "Con Debater")
+    scheduler.join()
+    scheduler.close()
+    return [spans[i + 1][0] - spans[i][1] for i in range(len(spans) - 1)]
+
+def benchmark_prefetch(utterances=8, synth_seconds=0.2, play_seconds=0.3):
+    """Silent gaps between speakers with and without TTS prefetching"""
+    print(f"\n🎧 SPEAKER GAPS (synthesis {synth_seconds}s, playback {play_seconds}s)")
+    print("="*50)
+    results = {}
+    for lookahead in (0, 1, 2):
+        gaps = measure_speaker_gaps(lookahead, utterances, synth_seconds, play_seconds)
+        results[lookahead] = max(gaps)
+        print(f"   lookahead={lookahead}: max gap {max(gaps) * 1000:7.1f} ms, "
+              f"mean gap {sum(gaps) / len(gaps) * 1000:7.1f} ms")
+    return results
+
+class FakeTTS(TTSBackend):
+    """TTS backend stand-in whose synthesis time grows with the text length"""
+
+    name = "fake"
+    model_id = "fake-tts"
+
+    def __init__(self, seconds_per_char=0.001):
+        self.seconds_per_char = seconds_per_char
+
+    def voice_id(self, voice):
+        return voice
+
+    def stream(self, text, voice, output_format=None):
+        time.sleep(len(text) * self.seconds_per_char)
+        yield text.encode()
+
+def benchmark_recorded_tts(seconds_per_char=0.001):
+    """Wall time of recorded-mode clip generation vs the longest single clip"""
+    print(f"\n💾 RECORDED-MODE TTS ({seconds_per_char * 1000:.1f} ms per character)")
+    print("="*50)
+    clips = [
+        ("pro_debater", "pro_argument", "P" * 1500),
+        ("con_debater", "con_argument", "C" * 1400),
+        ("judge", "judge_evaluation", "J" * 1100),
+    ]
+    audio_debate_system.play_clip = lambda audio, output_format=None: None
+
+    with tempfile.TemporaryDirectory() as store_dir:
+        system = audio_debate_system.AudioDebateSystem(mode="individual", streaming=False, tts=FakeTTS(seconds_per_char))
+        system.audio_store = AudioStore(store_dir)
+        start = time.perf_counter()
+        for agent_type, name, text in clips:
+            system.queue_recorded_speech(text, agent_type, name)
+        system.finish_recorded_speech()
+        wall = time.perf_counter() - start
+
+    longest = max(len(text) for _, _, text in clips) * seconds_per_char
+    total = sum(len(text) for _, _, text in clips) * seconds_per_char
+    print(f"⏱️ Wall time:       {wall:6.2f} s")
+    print(f"📏 Longest clip:    {longest:6.2f} s")
+    print(f"➕ Sequential sum:  {total:6.2f} s")
+    print(f"📋 Manifest order:  {[entry['agent_type'] for entry in system.shared_memory['audio_files']]}")
+    return {"wall_s": wall, "longest_s": longest, "sequential_s": total}
+
+def benchmark_audio_store(debates=10, unique_lines=3):
+    """Disk usage of repeated recorded debates with the content-addressed store"""
+    print(f"\n🗂️ AUDIO STORE DEDUPLICATION ({debates} debates)")
+    print("="*50)
+    # Every debate repeats the same narrator lines; only a few lines are new
+    shared_lines = [("judge", "intro", "Welcome to today's debate. " * 40),
+                    ("judge", "outro", "Thank you for listening. " * 40)]
+    audio_debate_system.play_clip = lambda audio, output_format=None: None
+
+    with tempfile.TemporaryDirectory() as store_dir:
+        logical = 0
+        start = time.perf_counter()
+        for n in range(debates):
+            system = audio_debate_system.AudioDebateSystem(mode="individual", streaming=False, tts=FakeTTS(0))
+            system.audio_store = AudioStore(store_dir)
+            clips = shared_lines + [("pro_debater", f"line_{i}", f"Argument {n}.{i} " * 60) for i in range(unique_lines)]
+            for agent_type, label, text in clips:
+                system.queue_recorded_speech(text, agent_type, label)
+            system.finish_recorded_speech()
+            system.write_audio_manifest()
+            logical += sum(entry["bytes"] for entry in system.shared_memory["audio_files"])
+        wall = time.perf_counter() - start
+
+        store = AudioStore(store_dir)
+        blobs, stored, referenced = store.usage()
+        report = store.verify()
+        store.delete_manifest(system.debate_id)
+        removed, freed = store.gc(grace_seconds=0)
+
+    print(f"💾 Per-run copies would use: {logical / 1e3:8.1f} KB")
+    print(f"🗂️ Store uses:               {stored / 1e3:8.1f} KB in {blobs} blobs ({referenced / stored:.1f}x dedup)")
+    print(f"✅ Integrity check:          {report['ok']} ok, {len(report['missing'])} missing, {len(report['corrupt'])} corrupt")
+    print(f"🗑️ GC after dropping one debate: {removed} blobs, {freed / 1e3:.1f} KB freed")
+    print(f"⏱️ Wall time:                {wall:6.2f} s")
+    return {"logical_bytes": logical, "stored_bytes": stored, "gc_removed": removed}
+
+def fake_tts_stream(text, profile, link_bytes_per_second, server_seconds=0.05, chunk_bytes=4096):
+    """Audio chunks sized for the profile's bitrate, delivered over a link of fixed bandwidth"""
+    audio_seconds = len(text) / 15  # ~15 spoken characters per second
+    remaining = int(audio_seconds * bytes_per_second(profile))
+    time.sleep(server_seconds)
+    while remaining > 0:
+        chunk = min(chunk_bytes, remaining)
+        time.sleep(chunk / link_bytes_per_second)
+        remaining -= chunk
+        yield b"\0" * chunk
+
+def benchmark_audio_profiles(utterances=6, chars=120, link_mbps=8):
+    """Bytes per debate and time-to-first-byte for each output-format profile"""
+    print(f"\n📶 AUDIO PROFILES ({utterances} utterances x {chars} chars, {link_mbps} Mbit/s link)")
+    print("="*50)
+    link = link_mbps * 1_000_000 / 8
+    stats = TransferStats()
+    results = {}
+    for name in AUDIO_PROFILES:
+        profile = get_profile(name)
+        start_debate = time.perf_counter()
+        for _ in range(utterances):
+            start = time.perf_counter()
+            for _ in stats.measure(fake_tts_stream("x" * chars, profile, link), name, start):
+                pass
+        results[name] = dict(stats.summary()[name], transfer_s=time.perf_counter() - start_debate)
+        print(f"   {name:<9} {profile['output_format']:<14} {results[name]['bytes'] / 1024:8.1f} KB per debate, "
+              f"TTFB avg {results[name]['ttfb_ms_avg']:6.1f} ms, transfer {results[name]['transfer_s']:5.2f} s")
+    return results
+
+def benchmark_context_growth(turns=40, token_budget=1200):
+    """Per-turn context tokens and build time: full re-render vs incremental budget"""
+    print(f"\n🧮 CONVERSATION CONTEXT ({turns} exchanges, budget {token_budget} tokens)")
+    print("="*50)
+    line = "I hear you, but the evidence on productivity points the other way entirely."
+    history = []
+    context = ConversationContext(token_budget=token_budget)
+    full_tokens, budget_tokens = [], []
+    full_time = budget_time = 0.0
+
+    for turn in range(1, turns + 1):
+        history.append({"pro": line, "con": line})
+
+        start = time.perf_counter()
+        for _ in range(2):  # previously rebuilt for both the pro and con task
+            text = "\n\nCONVERSATION SO FAR:\n"
+            for i, exchange in enumerate(history, 1):
+                text += f"\nExchange {i}:\n"
+                text += f"Pro: {exchange['pro']}\n"
+                text += f"Con: {exchange['con']}\n"
+        full_time += time.perf_counter() - start
+        full_tokens.append(estimate_tokens(text))
+
+        start = time.perf_counter()
+        context.add_exchange(turn, line, line)
+        for _ in range(2):
+            text = context.render()
+        budget_time += time.perf_counter() - start
+        budget_tokens.append(context.tokens())
+
+    for turn in (1, turns // 4, turns // 2, turns):
+        print(f"   exchange {turn:3d}: full ~{full_tokens[turn - 1]:6d} tokens, budgeted ~{budget_tokens[turn - 1]:5d} tokens")
+    print(f"⏱️ Build time: full {full_time * 1000:.2f} ms, incremental {budget_time * 1000:.2f} ms")
+    return {"full_tokens": full_tokens, "budget_tokens": budget_tokens}
+
+def benchmark_research_phase(seconds=0.5):
+    """Research phase + first debater task with sequential vs concurrent research"""
+    print(f"\n🔬 RESEARCH PHASE ({seconds}s per fake LLM call)")
+    print("="*50)
+    audio_debate_system.mistral_llm = SlowFakeLLM(seconds)
+    results = {}
+    for concurrent in (False, True):
+        system = audio_debate_system.AudioDebateSystem(mode="individual", streaming=True)
+        system.debate_topic = "Should remote work be the standard?"
+        system.create_agents()
+        system.create_tasks()
+        system.task_research_pro.async_execution = concurrent
+        system.task_research_con.async_execution = concurrent
+        crew = Crew(
+            agents=[system.research_agent_pro, system.research_agent_con, system.agent_pro],
+            tasks=[system.task_research_pro, system.task_research_con, system.task_pro],
+            verbose=False
+        )
+        start = time.perf_counter()
+        crew.kickoff()
+        results[concurrent] = time.perf_counter() - start
+        label = "Concurrent research" if concurrent else "Sequential research"
+        print(f"   {label}: {results[concurrent]:.2f} s")
+    return results
+
+def benchmark_event_store(events=5000):
+    """Per-event write latency of the debate event log for several fsync batch sizes"""
+    print(f"\n🧾 EVENT STORE WRITE LATENCY ({events} events)")
+    print("="*50)
+    task_data = {
+        "agent_role": "Pro Debater",
+        "timestamp": "2025-01-01T00:00:00",
+        "output": "I hear you, but the evidence on productivity points the other way entirely. " * 10
+    }
+    results = {}
+    with tempfile.TemporaryDirectory() as log_dir:
+        for fsync_every in (1, 16, 128):
+            path = os.path.join(log_dir, f"events_{fsync_every}.jsonl")
+            store = DebateEventStore(path, fsync_every=fsync_every)
+            store.append("init", shared_memory={"pro_debater_argument": [], "timestamp": ""})
+            latencies = []
+            for _ in range(events):
+                start = time.perf_counter()
+                store.append("task_output", task_name="argument_pro", key="pro_debater_argument", data=task_data)
+                latencies.append(time.perf_counter() - start)
+            store.close()
+            latencies.sort()
+            mean = sum(latencies) / len(latencies)
+            p99 = latencies[int(len(latencies) * 0.99)]
+            results[fsync_every] = {"mean_us": mean * 1e6, "p99_us": p99 * 1e6}
+            print(f"   fsync every {fsync_every:3d}: mean {mean * 1e6:8.1f} µs, p99 {p99 * 1e6:8.1f} µs")
+
+        start = time.perf_counter()
+        snapshot = load_shared_memory(path)
+        print(f"🔁 Snapshot rebuild: {len(snapshot['pro_debater_argument'])} entries in "
+              f"{(time.perf_counter() - start) * 1000:.1f} ms")
+    return results
+
+BENCHMARKS = {
+    "turns": benchmark_turn_overhead,
+    "playback": benchmark_playback_worker,
+    "playback-start": benchmark_playback_start,
+    "prefetch": benchmark_prefetch,
+    "recorded-tts": benchmark_recorded_tts,
+    "audio-store": benchmark_audio_store,
+    "profiles": benchmark_audio_profiles,
+    "context": benchmark_context_growth,
+    "research": benchmark_research_phase,
+    "events": benchmark_event_store,
+}
+
+def main():
+    """Run one or all benchmarks"""
+    parser = argparse.ArgumentParser(description="Debate System Benchmarks")
+    parser.add_argument("benchmark", nargs="?", choices=list(BENCHMARKS) + ["all"], default="all")
+    args = parser.parse_args()
+
+    names = list(BENCHMARKS) if args.benchmark == "all" else [args.benchmark]
+    for name in names:
+        BENCHMARKS[name]()
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ import os
 import json
 from datetime import datetime
 
+from log_catalog import LogCatalog
+
 def compare_systems():
     """Compare original text system with audio-enhanced system"""
     
@@ -109,37 +111,23 @@ def analyze_recent_logs():
     print("\n📋 RECENT DEBATE LOGS:")
     print("-"*40)
     
-    # Find text logs
-    text_logs = [f for f in os.listdir('.') if f.startswith('debate_log_') and f.endswith('.json')]
-    audio_logs = [f for f in os.listdir('.') if f.startswith('audio_debate_log_') and f.endswith('.json')]
-    
-    print(f"📄 Text-based logs: {len(text_logs)}")
-    for log in sorted(text_logs, reverse=True)[:3]:
-        try:
-            mtime = os.path.getmtime(log)
-            formatted_time = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
-            print(f"   {log} ({formatted_time})")
-        except:
-            print(f"   {log}")
-    
-    print(f"\n🎙️ Audio-enhanced logs: {len(audio_logs)}")
-    for log in sorted(audio_logs, reverse=True)[:3]:
-        try:
-            mtime = os.path.getmtime(log)
-            formatted_time = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
-            print(f"   {log} ({formatted_time})")
-        except:
-            print(f"   {log}")
-    
-    # Find audio directories
-    audio_dirs = [d for d in os.listdir('.') if d.startswith('audio_debate_') and os.path.isdir(d)]
-    print(f"\n🎵 Audio directories: {len(audio_dirs)}")
-    for audio_dir in sorted(audio_dirs, reverse=True)[:3]:
-        try:
-            audio_files = [f for f in os.listdir(audio_dir) if f.endswith('.mp3')]
-            print(f"   {audio_dir}/ ({len(audio_files)} audio files)")
-        except:
-            print(f"   {audio_dir}/")
+    catalog = LogCatalog()
+    catalog.ingest()
+    counts = {row["grp"]: row["debates"] for row in catalog.aggregate("kind")}
+    
+    for kind, label in [("text", "📄 Text-based logs"), ("audio", "🎙️ Audio-enhanced logs")]:
+        print(f"{label}: {counts.get(kind, 0)}")
+        for row in catalog.list_logs(kind=kind, limit=3):
+            formatted_time = datetime.fromtimestamp(row["mtime"]).strftime("%Y-%m-%d %H:%M:%S")
+            print(f"   {os.path.basename(row['path'])} ({formatted_time})")
+        print()
+    
+    # Audio manifests (or legacy audio directories) referenced by the audio logs
+    audio_rows = [row for row in catalog.list_logs(kind="audio") if row["audio_directory"]]
+    catalog.close()
+    print(f"🎵 Audio manifests: {len(audio_rows)}")
+    for row in audio_rows[:3]:
+        print(f"   {row['audio_directory']} ({len(json.loads(row['audio_files']))} audio files)")
 
 def show_setup_requirements():
     """Show setup requirements for audio system"""
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Conversation Context Builder
+Incrementally rendered debate history kept within a prompt token budget
+"""
+
+from collections import deque
+
+def estimate_tokens(text):
+    """Rough token count (~4 characters per token for English text)"""
+    return max(1, len(text) // 4) if text else 0
+
+class ConversationContext:
+    """Cached rendering of the exchanges so far, bounded by a token budget.
+
+    New exchanges are appended to the cached text instead of re-rendering
+    the whole history. Once the budget is exceeded the oldest exchanges are
+    dropped; an optional ``summarize(dropped_exchanges, previous_summary)``
+    callable can fold them into a short summary line instead.
+    """
+
+    def __init__(self, token_budget=1200, summarize=None, header="\n\nCONVERSATION SO FAR:\n"):
+        self.token_budget = token_budget
+        self.summarize = summarize
+        self.header = header
+        self.blocks = deque()  # (exchange_number, pro, con, rendered_block, tokens)
+        self.block_tokens = 0
+        self.dropped = 0
+        self.summary = ""
+        self._rendered = ""
+
+    def add_exchange(self, number, pro, con):
+        """Append one exchange, evicting the oldest ones if over budget"""
+        block = f"\nExchange {number}:\nPro: {pro}\nCon: {con}\n"
+        tokens = estimate_tokens(block)
+        self.blocks.append((number, pro, con, block, tokens))
+        self.block_tokens += tokens
+
+        evicted = []
+        while len(self.blocks) > 1 and self.block_tokens > self.token_budget:
+            oldest = self.blocks.popleft()
+            self.block_tokens -= oldest[4]
+            evicted.append({"turn": oldest[0], "pro": oldest[1], "con": oldest[2]})
+
+        if evicted:
+            self.dropped += len(evicted)
+            if self.summarize is not None:
+                self.summary = self.summarize(evicted, self.summary)
+            self._rendered = self._render_all()
+        else:
+            self._rendered = (self._rendered or self._render_header()) + block
+
+    def _render_header(self):
+        text = self.header
+        if self.dropped:
+            if self.summary:
+                text += f"\nEarlier exchanges (summary): {self.summary}\n"
+            else:
+                text += f"\n({self.dropped} earlier exchanges omitted)\n"
+        return text
+
+    def _render_all(self):
+        return self._render_header() + "".join(block[3] for block in self.blocks)
+
+    def render(self):
+        """Return the cached context text ("" before the first exchange)"""
+        return self._rendered
+
+    def tokens(self):
+        """Estimated prompt tokens taken by the rendered context"""
+        return estimate_tokens(self._rendered)
@@ -6,36 +6,32 @@ Uses specialized CrewAI agents for audio generation and playback
 
 import os
 import sys
-import threading
 import time
-import subprocess
-import platform
 import json
-import tempfile
 from datetime import datetime
 from debate_system import DebatingSystem, mistral_llm
+from audio_playback import SpeechScheduler, create_audio_sink
+from conversation_context import ConversationContext, estimate_tokens
 from crewai import Agent, Task, Crew
-from elevenlabs.client import ElevenLabs
-from elevenlabs import play
+
+# Shared TTS backends and audio profiles (prototypes/TTS); TTS_BACKEND=local speaks offline with espeak-ng
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "TTS"))
+from audio_profiles import TransferStats, get_profile
+from tts_backends import concatenable, get_backend, join_wav
 
 class CrewAudioDebateSystem(DebatingSystem):
-    def __init__(self):
+    def __init__(self, llm=None, audio_sink=None, lookahead=1, max_turns_per_agent=3, context_token_budget=1200,
+                 audio_profile=None, tts=None):
         super().__init__()
         
-        # Initialize ElevenLabs client
-        try:
-            self.elevenlabs_client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
-            self.audio_enabled = True
-        except:
-            self.audio_enabled = False
-            print("⚠️ Audio disabled - ElevenLabs not available")
-        
-        # Voice mapping for different roles
-        self.voice_ids = {
-            "Pro Debater": "21m00Tcm4TlvDq8ikWAM",  # Rachel
-            "Con Debater": "awJYCdDwxfD901AaAI0b",  # Drew  
-            "Debate Judge": "2EiwWnXFnvU5JabPnv8n"  # Clyde
-        }
+        # LLM shared by all conversation agents (injectable for benchmarks)
+        self.llm = llm or mistral_llm
+        
+        # Speech backend (TTS_BACKEND: elevenlabs, local or auto); voices per role come from its registry
+        self.tts = tts or get_backend().with_model("eleven_turbo_v2")  # Faster model for real-time
+        self.audio_enabled = self.tts.available()
+        if not self.audio_enabled:
+            print(f"⚠️ Audio disabled - {self.tts.name} TTS not available")
         
         # Audio storage
         self.audio_outputs = {}
@@ -43,12 +39,29 @@ class CrewAudioDebateSystem(DebatingSystem):
         # Structured debate tracking
         self.conversation_history = []
         self.current_turn = 0
-        self.max_turns_per_agent = 3
+        self.max_turns_per_agent = max_turns_per_agent
+        
+        # Incremental prompt context, capped so long debates stay cheap
+        self.context = ConversationContext(token_budget=context_token_budget)
+        self.prompt_tokens = []
+        self.last_prompt_tokens = 0
+        
+        # Live speech uses the low-bandwidth profile unless DEBATE_STREAM_PROFILE says otherwise
+        self.audio_profile = get_profile(audio_profile, "DEBATE_STREAM_PROFILE", default="stream")
+        self.transfer_stats = TransferStats()
+        
+        # Long-lived audio sink ("auto", "null", "ffplay", "clip", ... or a sink object);
+        # clips that can't be appended into one stream (local WAV) get a player each
+        if audio_sink is None or isinstance(audio_sink, str):
+            output_format = self.tts.output_format(self.audio_profile["output_format"])
+            self.audio_sink = create_audio_sink(audio_sink, self.tts.bytes_per_second(self.audio_profile["kbps"]),
+                                                per_clip=not concatenable(output_format))
+        else:
+            self.audio_sink = audio_sink
         
-        # Threading for audio and response generation
-        self.audio_threads = []
-        self.response_ready = threading.Event()
-        self.audio_complete = threading.Event()
+        # Ordered playback with `lookahead` utterances synthesized ahead of
+        # the one playing; a full queue pauses generation
+        self.speech = SpeechScheduler(self.synthesize_audio, self.play_audio, lookahead=lookahead)
         
     def create_topic_generator_agent(self):
         """Create agent to generate debate topics"""
@@ -58,7 +71,7 @@ class CrewAudioDebateSystem(DebatingSystem):
             backstory="""You are an experienced debate moderator who creates thought-provoking 
             topics that inspire meaningful discussion. Your topics are clear, controversial enough 
             to have strong arguments on both sides, and relevant to current issues.""",
-            llm=mistral_llm,
+            llm=self.llm,
             verbose=True
         )
     
@@ -84,7 +97,7 @@ class CrewAudioDebateSystem(DebatingSystem):
             - Keep your argument compelling and well-evidenced
             
             """,
-            llm=mistral_llm,
+            llm=self.llm,
             verbose=False
         )
         
@@ -106,7 +119,7 @@ class CrewAudioDebateSystem(DebatingSystem):
              - Keep your argument compelling and well-evidenced
              - Specific statistics, case studies, and expert opinions from your research
             """,
-            llm=mistral_llm,
+            llm=self.llm,
             verbose=False
         )
         
@@ -119,7 +132,7 @@ class CrewAudioDebateSystem(DebatingSystem):
             arguments, and maintained a coherent position throughout the discussion. You value 
             natural flow, direct responses, and overall persuasiveness in conversational debate.
             Keep your evaluation concise - 2-3 sentences maximum for quick audio.""",
-            llm=mistral_llm,
+            llm=self.llm,
             verbose=False
         )
     
@@ -144,36 +157,36 @@ class CrewAudioDebateSystem(DebatingSystem):
             agent=self.topic_generator
         )
     
-    def create_turn_based_tasks(self, topic, turn_number, previous_exchange=None):
-        """Create tasks for natural conversational debate turns"""
-        
-        # Build conversation context
-        context_text = ""
-        if self.conversation_history:
-            context_text = "\n\nCONVERSATION SO FAR:\n"
-            for i, exchange in enumerate(self.conversation_history, 1):
-                context_text += f"\nExchange {i}:\n"
-                context_text += f"Pro: {exchange['pro']}\n"
-                context_text += f"Con: {exchange['con']}\n"
-        
-        # Pro Debater Task - Natural conversation style
-        if turn_number == 1:
-            pro_description = f"""Start the conversation by arguing FOR: {topic}
+    def create_turn_based_tasks(self):
+        """Create reusable conversation task templates.
+
+        Per-turn values ({topic}, {turn_number}, {opponent_last}, ...) are filled
+        in by CrewAI's input interpolation on every kickoff, so the tasks are
+        built once per debate instead of once per exchange.
+        """
+        
+        # Pro Debater opening - Natural conversation style
+        self.task_pro_opening = Task(
+            description="""Start the conversation by arguing FOR: {topic}
             
-            This is your opening statement (Exchange 1 of 3). Speak naturally like you're having 
+            This is your opening statement (Exchange 1 of {total_turns}). Speak naturally like you're having 
             a real conversation with someone. Use 1-3 short, clear sentences. Be direct and 
             engaging, not formal or academic.
             
             Example style: "I really think [topic] because [main reason]. It just makes sense when you consider [supporting point]."
             
             Keep it conversational and under 30 words.
-            """
-        else:
-            last_con_response = self.conversation_history[-1]['con'] if self.conversation_history else ""
-            pro_description = f"""Respond naturally to what your opponent just said about: {topic}
+            """,
+            expected_output="A natural, conversational response of 1-2 sentences (under 30 words)",
+            agent=self.agent_pro
+        )
+        
+        # Pro Debater rebuttal - Natural conversation style
+        self.task_pro_turn = Task(
+            description="""Respond naturally to what your opponent just said about: {topic}
             
-            This is Exchange {turn_number} of 3. Your opponent just said:
-            "{last_con_response}"
+            This is Exchange {turn_number} of {total_turns}. Your opponent just said:
+            "{opponent_last}"
             
             Respond directly to their point first, then make your own. Use 1-2 short sentences 
             like you're having a real conversation. Be natural and conversational.
@@ -183,34 +196,35 @@ class CrewAudioDebateSystem(DebatingSystem):
             {context_text}
             
             Keep it conversational and under 30 words.
-            """
-        
-        self.task_pro_turn = Task(
-            description=pro_description,
+            """,
             expected_output="A natural, conversational response of 1-2 sentences (under 30 words)",
             agent=self.agent_pro
         )
         
-        # Con Debater Task - Natural conversation style
-        if turn_number == 1:
-            con_description = f"""Respond naturally to the Pro debater's opening statement about: {topic}
+        # Con Debater opening reply - Natural conversation style
+        self.task_con_opening = Task(
+            description="""Respond naturally to the Pro debater's opening statement about: {topic}
             
-            This is Exchange 1 of 3. The Pro debater just made their opening point. Respond 
+            This is Exchange 1 of {total_turns}. The Pro debater just made their opening point. Respond 
             directly to what they said, then make your counter-argument. Use 1-3 short, clear 
             sentences like you're having a real conversation.
             
-            The Pro debater said: "{previous_exchange if previous_exchange else 'Opening statement'}"
+            The Pro debater said: "{opponent_last}"
             
             Example style: "I disagree with that because [reason]. Actually, [your counter-point]."
             
             Keep it conversational and under 30 words.
-            """
-        else:
-            last_pro_response = self.conversation_history[-1]['pro'] if self.conversation_history else ""
-            con_description = f"""Respond naturally to what your opponent just said about: {topic}
+            """,
+            expected_output="A natural, conversational response of 1-2 sentences (under 30 words)",
+            agent=self.agent_con
+        )
+        
+        # Con Debater rebuttal - Natural conversation style
+        self.task_con_turn = Task(
+            description="""Respond naturally to what your opponent just said about: {topic}
             
-            This is Exchange {turn_number} of 3. Your opponent just said:
-            "{last_pro_response}"
+            This is Exchange {turn_number} of {total_turns}. Your opponent just said:
+            "{opponent_last}"
             
             Respond directly to their point first, then make your own. Use 1-2 short sentences 
             like you're having a real conversation. Be natural and conversational.
@@ -220,15 +234,46 @@ class CrewAudioDebateSystem(DebatingSystem):
             {context_text}
             
             Keep it conversational and under 30 words.
-            """
-        
-        self.task_con_turn = Task(
-            description=con_description,
+            """,
             expected_output="A natural, conversational response of 1-2 sentences (under 30 words)",
-            agent=self.agent_con,
-            context=[self.task_pro_turn] if turn_number == 1 else []
+            agent=self.agent_con
         )
     
+    def create_structured_debate_crews(self):
+        """Create the persistent single-task crews reused for every exchange"""
+        self.create_turn_based_tasks()
+        
+        self.turn_crews = {}
+        for name, agent, task in [
+            ("pro_opening", self.agent_pro, self.task_pro_opening),
+            ("pro_turn", self.agent_pro, self.task_pro_turn),
+            ("con_opening", self.agent_con, self.task_con_opening),
+            ("con_turn", self.agent_con, self.task_con_turn),
+        ]:
+            self.turn_crews[name] = Crew(
+                agents=[agent],
+                tasks=[task],
+                verbose=False
+            )
+    
+    def build_turn_inputs(self, turn_number, opponent_last=""):
+        """Build the interpolation inputs for one side of an exchange"""
+        return {
+            "topic": self.debate_topic,
+            "turn_number": str(turn_number),
+            "total_turns": str(self.max_turns_per_agent),
+            "opponent_last": opponent_last or "Opening statement",
+            "context_text": self.context.render()
+        }
+    
+    def run_turn_crew(self, name, inputs):
+        """Kick off one of the persistent turn crews and return its text output"""
+        crew = self.turn_crews[name]
+        result = crew.kickoff(inputs=inputs)
+        # kickoff leaves the interpolated prompt in the task description
+        self.last_prompt_tokens = estimate_tokens(crew.tasks[0].description)
+        return str(result).strip()
+    
     def create_final_judgment_task(self):
         """Create task for evaluating the natural conversation"""
         
@@ -258,7 +303,11 @@ class CrewAudioDebateSystem(DebatingSystem):
         )
     
     def generate_and_play_audio(self, text, agent_role):
-        """Generate and play audio with proper threading"""
+        """Queue an utterance for prefetched synthesis and ordered playback.
+
+        Returns a future that completes when the utterance has been played,
+        or None when audio is disabled.
+        """
         role_emoji = {
             "Pro Debater": "👤",
             "Con Debater": "👥", 
@@ -270,191 +319,81 @@ class CrewAudioDebateSystem(DebatingSystem):
         
         if not self.audio_enabled:
             print("📝 (Text-only mode)\n")
-            return
-            
+            return None
+        
+        # Synthesis starts now and overlaps whatever is currently playing
+        return self.speech.say(text, agent_role)
+    
+    def synthesize_audio(self, text, agent_role):
+        """Generate audio bytes for one utterance (runs on the prefetch pool)"""
         try:
             print(f"🎙️ Generating audio for {agent_role}...")
             
-            # Generate audio using ElevenLabs
-            voice_id = self.voice_ids.get(agent_role, self.voice_ids["Pro Debater"])
-            
-            # Use the stream method and collect all bytes
-            audio_stream = self.elevenlabs_client.text_to_speech.convert(
-                text=text,
-                voice_id=voice_id,
-                model_id="eleven_turbo_v2"  # Faster model for real-time
-            )
+            voice = agent_role if agent_role in ("Pro Debater", "Con Debater", "Debate Judge") else "Pro Debater"
             
-            # Convert generator to bytes if needed
-            if hasattr(audio_stream, '__iter__') and not isinstance(audio_stream, (bytes, bytearray)):
-                audio_bytes = b''.join(audio_stream)
-            else:
-                audio_bytes = audio_stream
+            # Measured while streaming, so the time to first byte is the backend's, not the whole synthesis
+            start = time.perf_counter()
+            audio_stream = self.tts.stream(text, voice, self.audio_profile["output_format"])
+            audio_bytes = b''.join(self.transfer_stats.measure(audio_stream, self.audio_profile["name"], start))
+            if not concatenable(self.tts.output_format(self.audio_profile["output_format"])):
+                # Streamed WAV has a placeholder length in its header
+                audio_bytes = join_wav([audio_bytes])
             
             # Store audio for potential reuse
             self.audio_outputs[agent_role] = audio_bytes
-            
-            # Play audio in background thread
-            audio_thread = threading.Thread(
-                target=self.play_audio_async,
-                args=(audio_bytes, agent_role)
-            )
-            audio_thread.daemon = True
-            audio_thread.start()
-            self.audio_threads.append(audio_thread)
+            return audio_bytes
             
         except Exception as e:
             print(f"⚠️ Audio error for {agent_role}: {e}")
             print("📝 Continuing with text-only...\n")
+            return None
     
-    def play_audio_async(self, audio_bytes, agent_role):
-        """Play audio asynchronously without blocking the main thread"""
+    def play_audio(self, audio_bytes, agent_role):
+        """Play audio by writing the bytes straight into the long-lived audio sink"""
         try:
             print(f"🔊 Playing audio for {agent_role}...")
-            
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False, mode='wb') as temp_file:
-                temp_file.write(audio_bytes)
-                temp_file_path = temp_file.name
-            
-            # Try platform-specific players
-            playback_success = False
-            
-            if platform.system() == "Darwin":  # macOS
-                try:
-                    subprocess.run(
-                        ["afplay", temp_file_path], 
-                        check=True, 
-                        capture_output=True, 
-                        timeout=30
-                    )
-                    playback_success = True
-                except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError) as e:
-                    print(f"⚠️ afplay failed: {e}")
-            
-            # Fallback to ElevenLabs play
-            if not playback_success:
-                try:
-                    play(audio_bytes)
-                    playback_success = True
-                except Exception as play_error:
-                    print(f"⚠️ ElevenLabs play failed: {play_error}")
-            
-            if playback_success:
-                print(f"✅ {agent_role} finished speaking\n")
-            else:
-                print(f"⚠️ Could not play audio for {agent_role}\n")
-                
-            # Clean up
-            try:
-                os.unlink(temp_file_path)
-            except:
-                pass
-                
+            self.audio_sink.play(audio_bytes)
+            print(f"✅ {agent_role} finished speaking\n")
         except Exception as e:
-            print(f"⚠️ Audio playback error: {e}")
-        finally:
-            # Signal that audio is complete
-            self.audio_complete.set()
+            print(f"⚠️ Audio playback error for {agent_role}: {e}")
     
+    def close_audio(self):
+        """Let queued audio finish, then stop the speech scheduler and sink"""
+        self.speech.close()
+        self.audio_sink.close()
     
-    def play_audio(self, audio_bytes, agent_role):
-        """Play audio using the best available method"""
-        try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False, mode='wb') as temp_file:
-                temp_file.write(audio_bytes)
-                temp_file_path = temp_file.name
-            
-            print(f"🔊 Playing audio for {agent_role}...")
-            
-            # Try platform-specific players
-            playback_success = False
-            
-            if platform.system() == "Darwin":  # macOS
-                try:
-                    subprocess.run(
-                        ["afplay", temp_file_path], 
-                        check=True, 
-                        capture_output=True, 
-                        timeout=60
-                    )
-                    playback_success = True
-                except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
-                    print(f"⚠️ afplay failed: {e}")
-            
-            # Fallback to ElevenLabs play
-            if not playback_success:
-                print("🔄 Using ElevenLabs play function...")
-                try:
-                    play(audio_bytes)
-                    playback_success = True
-                except Exception as play_error:
-                    print(f"⚠️ ElevenLabs play failed: {play_error}")
-            
-            if playback_success:
-                print(f"✅ {agent_role} finished speaking\n")
-            else:
-                print(f"⚠️ Could not play audio for {agent_role}\n")
-                
-            # Clean up
-            try:
-                os.unlink(temp_file_path)
-            except:
-                pass
-                
-        except Exception as e:
-            print(f"⚠️ Audio playback error: {e}")
+    def close(self):
+        """Stop the audio, then close the event log"""
+        self.close_audio()
+        super().close()
     
     def execute_debate_turn(self, turn_number):
         """Execute a single exchange with concurrent audio and response generation"""
         print(f"📝 === Exchange {turn_number} ===")
         
-        # Get previous exchange for context if not the first turn
-        previous_exchange = None
-        if turn_number == 1 and len(self.conversation_history) == 0:
-            previous_exchange = None
-        elif len(self.conversation_history) > 0:
-            previous_exchange = self.conversation_history[-1]['pro']
-        
-        # Create tasks for this exchange
-        self.create_turn_based_tasks(self.debate_topic, turn_number, previous_exchange)
-        
-        # Execute Pro argument
+        # Pro opens the first exchange and rebuts Con's last point afterwards
         print("🤖 Pro generating response...")
-        pro_crew = Crew(
-            agents=[self.agent_pro],
-            tasks=[self.task_pro_turn],
-            verbose=False
-        )
-        pro_crew.kickoff()
-        pro_response = str(self.task_pro_turn.output).strip()
+        if turn_number == 1 or not self.conversation_history:
+            pro_inputs = self.build_turn_inputs(turn_number)
+            pro_response = self.run_turn_crew("pro_opening", pro_inputs)
+        else:
+            pro_inputs = self.build_turn_inputs(turn_number, self.conversation_history[-1]['con'])
+            pro_response = self.run_turn_crew("pro_turn", pro_inputs)
+        pro_tokens = self.last_prompt_tokens
         
         # Start Pro audio generation and playback
         self.generate_and_play_audio(pro_response, "Pro Debater")
         
-        # While Pro audio is playing, prepare Con's response
-        # Update Pro's response in the tasks for Con to use as context
-        self.create_turn_based_tasks(self.debate_topic, turn_number, pro_response)
-        
+        # While Pro audio is playing, generate Con's reply to what Pro just said
         print("🤖 Con generating response...")
-        con_crew = Crew(
-            agents=[self.agent_con],
-            tasks=[self.task_con_turn],
-            verbose=False
-        )
-        
-        # Start Con response generation while Pro audio might still be playing
-        con_crew.kickoff()
-        con_response = str(self.task_con_turn.output).strip()
-        
-        # Wait for Pro audio to finish before starting Con audio
-        if self.audio_enabled and self.audio_threads:
-            for thread in self.audio_threads:
-                if thread.is_alive():
-                    thread.join(timeout=15)  # Max 15 second wait
+        con_inputs = self.build_turn_inputs(turn_number, pro_response)
+        if turn_number == 1:
+            con_response = self.run_turn_crew("con_opening", con_inputs)
+        else:
+            con_response = self.run_turn_crew("con_turn", con_inputs)
+        con_tokens = self.last_prompt_tokens
         
-        # Start Con audio generation and playback
+        # Con audio is queued behind Pro's, so playback order is preserved
         self.generate_and_play_audio(con_response, "Con Debater")
         
         # Store this exchange in conversation history
@@ -462,15 +401,16 @@ class CrewAudioDebateSystem(DebatingSystem):
             "turn": turn_number,
             "pro": pro_response,
             "con": con_response,
+            "prompt_tokens": {"pro": pro_tokens, "con": con_tokens},
             "timestamp": datetime.now().isoformat()
         }
         self.conversation_history.append(exchange)
+        self.event_store.append("exchange", exchange=exchange)
+        self.context.add_exchange(turn_number, pro_response, con_response)
+        self.prompt_tokens.append(pro_tokens + con_tokens)
         
-        # Wait for Con audio to finish before next exchange
-        if self.audio_enabled and self.audio_threads:
-            for thread in self.audio_threads:
-                if thread.is_alive():
-                    thread.join(timeout=15)  # Max 15 second wait
+        print(f"🧮 Prompt tokens: Pro ~{pro_tokens}, Con ~{con_tokens} "
+              f"(context ~{self.context.tokens()}, {self.context.dropped} exchanges trimmed)")
         
         print(f"✅ Exchange {turn_number} complete\n")
         return exchange
@@ -485,8 +425,10 @@ class CrewAudioDebateSystem(DebatingSystem):
             "final_judgment": str(final_judgment),
             "total_turns": len(self.conversation_history),
             "audio_enabled": self.audio_enabled,
+            "audio_transfer": self.transfer_stats.summary(),
             "debate_type": "structured_turn_based_debate"
         }
+        self.transfer_stats.print_report()
         
         # Ensure logs directory exists
         logs_dir = "/Users/A200303816/Documents/EuroTech-2/logs"
@@ -495,6 +437,9 @@ class CrewAudioDebateSystem(DebatingSystem):
         filename = f"structured_debate_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         filepath = os.path.join(logs_dir, filename)
         
+        self.event_store.append("final_result", final_result=str(final_judgment))
+        self.event_store.sync()
+        
         try:
             with open(filepath, 'w') as f:
                 json.dump(log_data, f, indent=2, default=str)
@@ -507,7 +452,7 @@ class CrewAudioDebateSystem(DebatingSystem):
         
         print(f"\n{'='*60}")
         print(f"💬 NATURAL CONVERSATIONAL DEBATE")
-        print(f"📋 Format: 3 exchanges (6 short responses total)")
+        print(f"📋 Format: {self.max_turns_per_agent} exchanges ({self.max_turns_per_agent * 2} short responses total)")
         print(f"🎙️ Real-time Audio | 🗣️ Natural dialogue style")
         print(f"{'='*60}\n")
         
@@ -537,13 +482,14 @@ class CrewAudioDebateSystem(DebatingSystem):
                 
                 print(f"💭 GENERATED TOPIC: {self.debate_topic}\n")
             
-            self.shared_memory["debate_context"] = f"Natural Conversation on: {self.debate_topic}"
+            self.update_shared_memory("debate_context", f"Natural Conversation on: {self.debate_topic}")
             
-            # Step 2: Create conversation agents
+            # Step 2: Create conversation agents and their reusable crews
             print("🤖 Preparing conversation participants...")
             self.create_structured_debate_agents()
+            self.create_structured_debate_crews()
             
-            # Step 3: Have natural conversation (3 exchanges)
+            # Step 3: Have natural conversation (max_turns_per_agent exchanges)
             print("🗣️ Starting conversation...\n")
             print("="*60)
             
@@ -566,8 +512,9 @@ class CrewAudioDebateSystem(DebatingSystem):
             judge_crew.kickoff()
             final_judgment = str(self.task_final_judgment.output)
             
-            # Display judge's evaluation
+            # Display judge's evaluation and let queued audio finish
             self.generate_and_play_audio(final_judgment, "Debate Judge")
+            self.speech.join()
             
             # Step 5: Summary
             print("="*60)
@@ -615,6 +562,7 @@ def main():
             topic = input("Enter conversation topic: ").strip()
             if not topic:
                 print("❌ Please provide a conversation topic!")
+                crew_audio_system.close()
                 return
     
     try:
@@ -661,6 +609,8 @@ def main():
         print(f"❌ Error: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        crew_audio_system.close()
 
 if __name__ == "__main__":
     main()
@@ -5,6 +5,7 @@ from crewai.llm import LLM
 import sys
 import json
 from datetime import datetime
+from event_store import DebateEventStore, apply_shared_memory_update
 
 # Load environment variables
 load_dotenv()
@@ -30,6 +31,21 @@ class DebatingSystem:
             "timestamp": datetime.now().isoformat()
         }
         
+        # Append-only event log: every shared-memory change is on disk right away
+        self.event_log_path = os.path.join("debate_events", f"debate_events_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.jsonl")
+        self.event_store = DebateEventStore(self.event_log_path)
+        self.event_store.append("init", shared_memory=self.shared_memory)
+    
+    def close(self):
+        """Close the event log (flushed and fsynced)"""
+        self.event_store.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+        
     def create_agents(self):
         """Create the debating agents, research agents, and judge"""
         
@@ -108,7 +124,8 @@ class DebatingSystem:
         #     Store your findings in a structured format that can be used by the Pro Debater.
         #     """,
         #     expected_output="Comprehensive research findings with sources, statistics, and evidence supporting the pro position",
-        #     agent=self.research_agent_pro
+        #     agent=self.research_agent_pro,
+        #     async_execution=True  # runs concurrently with the con research
         # )
         
         # # Research task for Con side
@@ -125,7 +142,8 @@ class DebatingSystem:
         #     Store your findings in a structured format that can be used by the Con Debater.
         #     """,
         #     expected_output="Comprehensive research findings with sources, statistics, and evidence supporting the con position",
-        #     agent=self.research_agent_con
+        #     agent=self.research_agent_con,
+        #     async_execution=True  # runs concurrently with the pro research
         # )
 
 
@@ -148,7 +166,7 @@ class DebatingSystem:
         #     """,
         #     expected_output="A persuasive pro argument with clear reasoning and strong research-based evidence",
         #     agent=self.agent_pro,
-        #     context=[self.task_research_pro]
+        #     context=[self.task_research_pro, self.task_research_con]
         # )
         
         # # Con argument task (Enhanced with research context)
@@ -166,7 +184,7 @@ class DebatingSystem:
         #     """,
         #     expected_output="A persuasive con argument with clear reasoning and strong research-based evidence",
         #     agent=self.agent_con,
-        #     context=[self.task_research_con]
+        #     context=[self.task_research_con, self.task_research_pro]
         # )
         
         # # Judge evaluation task (Enhanced to consider research quality)
@@ -243,33 +261,33 @@ class DebatingSystem:
     
     def update_shared_memory(self, key, data):
         """Update shared memory with new information"""
-        if key in self.shared_memory:
-            if isinstance(self.shared_memory[key], list):
-                self.shared_memory[key].append(data)
-            else:
-                self.shared_memory[key] = data
-        else:
-            self.shared_memory[key] = data
-        self.shared_memory["timestamp"] = datetime.now().isoformat()
+        # One timestamp for the live update and the logged event, so replay gives back the same state
+        ts = datetime.now().isoformat()
+        apply_shared_memory_update(self.shared_memory, key, data, ts)
+        self.event_store.append("update", ts=ts, key=key, data=data)
     
     def capture_task_output(self, task_name, agent_role, output):
         """Capture and store task outputs in shared memory"""
+        ts = datetime.now().isoformat()
         task_data = {
             "agent_role": agent_role,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": ts,
             "output": str(output)
         }
         
-        if task_name == "research_pro":
-            self.update_shared_memory("research_pro", task_data)
-        elif task_name == "research_con":
-            self.update_shared_memory("research_con", task_data)
-        elif task_name == "argument_pro":
-            self.update_shared_memory("pro_debater_argument", task_data)
-        elif task_name == "argument_con":
-            self.update_shared_memory("con_debater_argument", task_data)
-        elif task_name == "judge_evaluation":
-            self.update_shared_memory("judge_evaluation", task_data)
+        memory_keys = {
+            "research_pro": "research_pro",
+            "research_con": "research_con",
+            "argument_pro": "pro_debater_argument",
+            "argument_con": "con_debater_argument",
+            "judge_evaluation": "judge_evaluation"
+        }
+        key = memory_keys.get(task_name)
+        if key is None:
+            return
+        
+        apply_shared_memory_update(self.shared_memory, key, task_data, ts)
+        self.event_store.append("task_output", ts=ts, task_name=task_name, key=key, data=task_data)
     
     def save_debate_log(self, result):
         """Save the complete debate session to a log file"""
@@ -281,17 +299,20 @@ class DebatingSystem:
         }
         
         filename = f"debate_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        self.event_store.append("final_result", final_result=str(result))
+        self.event_store.sync()
         try:
             with open(filename, 'w') as f:
                 json.dump(log_data, f, indent=2, default=str)
             print(f"📁 Debate log saved to: {filename}")
         except Exception as e:
             print(f"⚠️ Could not save debate log: {e}")
+        print(f"🧾 Event log: {self.event_log_path}")
 
     def run_debate(self, topic):
         """Run the complete enhanced debate process with research and shared memory"""
         self.debate_topic = topic
-        self.shared_memory["debate_context"] = f"Debate on: {topic}"
+        self.update_shared_memory("debate_context", f"Debate on: {topic}")
         
         print(f"\n{'='*60}")
         print(f"🎭 SIMPLIFIED AI DEBATE SYSTEM")
@@ -410,36 +431,35 @@ class DebatingSystem:
 
 def main():
     """Main function to run the debating system"""
-    debating_system = DebatingSystem()
-    
-    if len(sys.argv) > 1:
-        # Topic provided as command line argument
-        topic = " ".join(sys.argv[1:])
-    else:
-        # Ask for topic input
-        topic = input("Enter the debate topic: ").strip()
-    
-    if not topic:
-        print("❌ Please provide a debate topic!")
-        return
-    
-    try:
-        result = debating_system.run_debate(topic)
-        print("\n" + "="*60)
-        print("📋 FINAL JUDGMENT:")
-        print("="*60)
-        print(result)
-        print("\n" + "="*60)
-        print("✨ Enhanced features used:")
-        # Comment out research agents line since we're not using them
-        # print("🔬 Research Agents - Gathered evidence for both sides")
-        print("🗣️ Direct Debate - Pro and Con arguments")
-        print("🧠 Shared Memory - Maintained context throughout debate") 
-        print("📁 Debate Logging - Session saved for review")
-        print("="*60)
-    except Exception as e:
-        print(f"❌ Error running enhanced debate: {str(e)}")
-        print("Please check your API key and internet connection.")
+    with DebatingSystem() as debating_system:
+        if len(sys.argv) > 1:
+            # Topic provided as command line argument
+            topic = " ".join(sys.argv[1:])
+        else:
+            # Ask for topic input
+            topic = input("Enter the debate topic: ").strip()
+        
+        if not topic:
+            print("❌ Please provide a debate topic!")
+            return
+        
+        try:
+            result = debating_system.run_debate(topic)
+            print("\n" + "="*60)
+            print("📋 FINAL JUDGMENT:")
+            print("="*60)
+            print(result)
+            print("\n" + "="*60)
+            print("✨ Enhanced features used:")
+            # Comment out research agents line since we're not using them
+            # print("🔬 Research Agents - Gathered evidence for both sides")
+            print("🗣️ Direct Debate - Pro and Con arguments")
+            print("🧠 Shared Memory - Maintained context throughout debate") 
+            print("📁 Debate Logging - Session saved for review")
+            print("="*60)
+        except Exception as e:
+            print(f"❌ Error running enhanced debate: {str(e)}")
+            print("Please check your API key and internet connection.")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Debate Event Store
+Append-only JSONL log of shared-memory updates, replayable into a snapshot
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+def apply_shared_memory_update(memory, key, data, timestamp=None):
+    """Apply one update with DebatingSystem semantics (lists append, others replace)"""
+    if key in memory and isinstance(memory[key], list):
+        memory[key].append(data)
+    else:
+        memory[key] = data
+    memory["timestamp"] = timestamp or datetime.now().isoformat()
+
+class DebateEventStore:
+    """Append-only event log with batched fsync.
+
+    Every event is written and flushed as one JSON line as soon as it
+    happens, so a crash loses at most the events since the last fsync
+    (``fsync_every`` events or ``fsync_interval`` seconds, whichever comes
+    first) and never the whole debate.
+    """
+
+    def __init__(self, path, fsync_every=16, fsync_interval=1.0):
+        self.path = path
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.lock = threading.Lock()
+        self.seq = 0
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = open(path, "a", encoding="utf-8")
+
+    def append(self, event_type, ts=None, **fields):
+        """Write one event record and return it; ``ts`` should be the timestamp the change was applied with"""
+        with self.lock:
+            self.seq += 1
+            record = {"seq": self.seq, "ts": ts or datetime.now().isoformat(), "type": event_type}
+            record.update(fields)
+            self.file.write(json.dumps(record, default=str) + "\n")
+            self.file.flush()
+            self.unsynced += 1
+            if self.unsynced >= self.fsync_every or time.monotonic() - self.last_sync >= self.fsync_interval:
+                self._sync()
+            return record
+
+    def _sync(self):
+        os.fsync(self.file.fileno())
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    def sync(self):
+        """Force buffered events to disk"""
+        with self.lock:
+            if self.unsynced:
+                self._sync()
+
+    def close(self):
+        """Flush and fsync whatever is left, so the tail of a stopped debate is on disk"""
+        with self.lock:
+            if self.file.closed:
+                return
+            self.file.flush()
+            self._sync()
+            self.file.close()
+
+def read_events(path):
+    """Yield event records in order, ignoring a torn final line from a crash"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                break
+
+def load_shared_memory(path):
+    """Rebuild the current shared_memory snapshot by replaying the event log"""
+    memory = {}
+    for event in read_events(path):
+        if event["type"] == "init":
+            memory = event["shared_memory"]
+        elif event["type"] in ("update", "task_output"):
+            apply_shared_memory_update(memory, event["key"], event["data"], event["ts"])
+    return memory
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python event_store.py <debate_events_*.jsonl>")
+        sys.exit(1)
+    print(json.dumps(load_shared_memory(sys.argv[1]), indent=2))
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Debate Log Catalog
+Incrementally indexes debate log files into SQLite for fast list/filter/aggregate queries
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+
+CATALOG_FILE = "debate_catalog.db"
+
+# Bump when the schema or extracted fields change; older catalogs are rebuilt
+SCHEMA_VERSION = 3
+
+# (directory, filename prefix, kind) for every log family the systems write
+LOG_SOURCES = [
+    (".", "debate_log_", "text"),
+    (".", "audio_debate_log_", "audio"),
+    ("logs", "structured_debate_log_", "structured"),
+]
+
+# shared_memory sections that hold per-agent entries
+MEMORY_SECTIONS = [
+    "research_pro",
+    "research_con",
+    "pro_debater_argument",
+    "con_debater_argument",
+    "judge_evaluation",
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS logs (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    kind TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    topic TEXT,
+    timestamp TEXT,
+    mode TEXT,
+    winner TEXT,
+    audio_enabled INTEGER,
+    total_turns INTEGER,
+    research_entries INTEGER,
+    pro_entries INTEGER,
+    con_entries INTEGER,
+    judge_entries INTEGER,
+    audio_directory TEXT,
+    audio_files TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON logs(timestamp);
+CREATE INDEX IF NOT EXISTS idx_logs_topic ON logs(topic);
+CREATE INDEX IF NOT EXISTS idx_logs_kind ON logs(kind);
+CREATE INDEX IF NOT EXISTS idx_logs_winner ON logs(winner);
+CREATE TABLE IF NOT EXISTS entries (
+    log_id INTEGER NOT NULL REFERENCES logs(id) ON DELETE CASCADE,
+    section TEXT NOT NULL,
+    agent_role TEXT,
+    timestamp TEXT,
+    output_chars INTEGER,
+    audio_generated INTEGER  -- NULL where the log doesn't track audio per entry
+);
+CREATE INDEX IF NOT EXISTS idx_entries_log ON entries(log_id);
+"""
+
+WINNER_PATTERNS = [
+    (re.compile(r"winner\s*[:\-]\s*\[?\s*(side_a|pro)\b", re.I), "pro"),
+    (re.compile(r"winner\s*[:\-]\s*\[?\s*(side_b|con)\b", re.I), "con"),
+    (re.compile(r"winner\s+(?:is|goes to)\s+(?:the\s+)?(pro|affirmative)\b", re.I), "pro"),
+    (re.compile(r"winner\s+(?:is|goes to)\s+(?:the\s+)?(con|opposition|negative)\b", re.I), "con"),
+    (re.compile(r"\b(pro|affirmative)(?:\s+(?:side|debater|team))?\s+wins\b", re.I), "pro"),
+    (re.compile(r"\b(con|opposition|negative)(?:\s+(?:side|debater|team))?\s+wins\b", re.I), "con"),
+]
+
+def extract_winner(judgment):
+    """Best-effort winner ('pro'/'con') from a judge's free-text verdict"""
+    if not judgment:
+        return None
+    for pattern, side in WINNER_PATTERNS:
+        if pattern.search(judgment):
+            return side
+    return None
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def summarize_log(data):
+    """Extract the catalog columns and entry rows from a loaded debate log"""
+    shared_memory = data.get("shared_memory", {}) or {}
+    entries = []
+    for section in MEMORY_SECTIONS:
+        for entry in shared_memory.get(section, []) or []:
+            if not isinstance(entry, dict):
+                continue
+            entries.append((
+                section,
+                entry.get("agent_role"),
+                entry.get("timestamp"),
+                len(str(entry.get("output", ""))),
+                1 if entry.get("audio_generated") else 0,
+            ))
+
+    judgment = data.get("final_judgment")
+    if not judgment:
+        judge_entries = shared_memory.get("judge_evaluation") or []
+        judgment = judge_entries[-1].get("output") if judge_entries and isinstance(judge_entries[-1], dict) else None
+    if not judgment:
+        judgment = data.get("final_result")
+
+    history = data.get("conversation_history") or []
+    for exchange in history:
+        if isinstance(exchange, dict):
+            entries.append((
+                "conversation_history",
+                None,
+                exchange.get("timestamp"),
+                len(str(exchange.get("pro", ""))) + len(str(exchange.get("con", ""))),
+                None,  # exchanges don't record audio, so they stay out of the audio rate
+            ))
+    audio_files = [item.get("filename") for item in shared_memory.get("audio_files", []) or [] if isinstance(item, dict)]
+    counts = {section: sum(1 for entry in entries if entry[0] == section) for section in MEMORY_SECTIONS}
+
+    return {
+        "topic": data.get("topic"),
+        "timestamp": data.get("timestamp"),
+        "mode": data.get("mode") or data.get("debate_type"),
+        "winner": extract_winner(str(judgment) if judgment else None),
+        "audio_enabled": 1 if data.get("audio_enabled") else 0,
+        "total_turns": data.get("total_turns", len(history)),
+        "research_entries": counts["research_pro"] + counts["research_con"],
+        "pro_entries": counts["pro_debater_argument"] + len(history),
+        "con_entries": counts["con_debater_argument"] + len(history),
+        "judge_entries": counts["judge_evaluation"],
+        "audio_directory": data.get("audio_manifest") or data.get("audio_directory"),
+        "audio_files": json.dumps(audio_files),
+    }, entries
+
+class LogCatalog:
+    """SQLite catalog of debate logs, refreshed incrementally by ``ingest``"""
+
+    def __init__(self, db_path=CATALOG_FILE, base_dir="."):
+        self.base_dir = base_dir
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self.conn.executescript("DROP TABLE IF EXISTS entries; DROP TABLE IF EXISTS logs;")
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.executescript(SCHEMA)
+
+    def discover(self):
+        """Yield (path, kind) for every debate log file on disk"""
+        for directory, prefix, kind in LOG_SOURCES:
+            directory = os.path.join(self.base_dir, directory)
+            if not os.path.isdir(directory):
+                continue
+            for name in os.listdir(directory):
+                if name.startswith(prefix) and name.endswith(".json"):
+                    yield os.path.join(directory, name), kind
+
+    def ingest(self):
+        """Index new or changed logs and drop deleted ones.
+
+        Unchanged files (same mtime and size) are skipped without being
+        opened; touched-but-identical files are detected by hash and only
+        their mtime is refreshed. Returns counts of what was done.
+        """
+        stats = {"indexed": 0, "unchanged": 0, "touched": 0, "removed": 0, "failed": 0}
+        known = {row["path"]: row for row in self.conn.execute("SELECT id, path, mtime, size, sha256 FROM logs")}
+        seen = set()
+
+        with self.conn:
+            for path, kind in self.discover():
+                seen.add(path)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                row = known.get(path)
+                if row is not None and row["mtime"] == stat.st_mtime and row["size"] == stat.st_size:
+                    stats["unchanged"] += 1
+                    continue
+
+                digest = file_sha256(path)
+                if row is not None and row["sha256"] == digest:
+                    self.conn.execute("UPDATE logs SET mtime = ?, size = ? WHERE id = ?", (stat.st_mtime, stat.st_size, row["id"]))
+                    stats["touched"] += 1
+                    continue
+
+                try:
+                    with open(path, "r") as f:
+                        summary, entries = summarize_log(json.load(f))
+                except (OSError, ValueError) as e:
+                    print(f"⚠️ Could not index {path}: {e}")
+                    stats["failed"] += 1
+                    continue
+
+                if row is not None:
+                    self.conn.execute("DELETE FROM logs WHERE id = ?", (row["id"],))
+                columns = ["path", "kind", "mtime", "size", "sha256"] + list(summary)
+                values = [path, kind, stat.st_mtime, stat.st_size, digest] + list(summary.values())
+                cursor = self.conn.execute(
+                    f"INSERT INTO logs ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                    values
+                )
+                self.conn.executemany(
+                    "INSERT INTO entries (log_id, section, agent_role, timestamp, output_chars, audio_generated) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(cursor.lastrowid,) + entry for entry in entries]
+                )
+                stats["indexed"] += 1
+
+            for path, row in known.items():
+                if path not in seen:
+                    self.conn.execute("DELETE FROM logs WHERE id = ?", (row["id"],))
+                    stats["removed"] += 1
+        return stats
+
+    def list_logs(self, kind=None, topic=None, winner=None, since=None, until=None, limit=None):
+        """Return catalog rows, most recent first, filtered on indexed columns"""
+        clauses, params = [], []
+        if kind:
+            clauses.append("kind = ?")
+            params.append(kind)
+        if topic:
+            clauses.append("topic LIKE ?")
+            params.append(f"%{topic}%")
+        if winner:
+            clauses.append("winner = ?")
+            params.append(winner)
+        if since:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        query = "SELECT * FROM logs"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY timestamp DESC, path DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        return self.conn.execute(query, params).fetchall()
+
+    def aggregate(self, group_by="kind"):
+        """Debate counts, winners and turn totals grouped by kind, topic, winner or date"""
+        groups = {
+            "kind": "kind",
+            "topic": "topic",
+            "winner": "winner",
+            "date": "substr(timestamp, 1, 10)",
+        }
+        if group_by not in groups:
+            raise ValueError(f"Cannot group by {group_by}")
+        expression = groups[group_by]
+        return self.conn.execute(
+            f"""SELECT {expression} AS grp,
+                       COUNT(*) AS debates,
+                       SUM(winner = 'pro') AS pro_wins,
+                       SUM(winner = 'con') AS con_wins,
+                       SUM(total_turns) AS turns,
+                       SUM(json_array_length(audio_files)) AS audio_files
+                FROM logs GROUP BY grp ORDER BY debates DESC"""
+        ).fetchall()
+
+    def close(self):
+        self.conn.close()
+
+def main():
+    """Refresh the catalog and print a listing or aggregate"""
+    parser = argparse.ArgumentParser(description="Debate Log Catalog")
+    parser.add_argument("--kind", choices=["text", "audio", "structured"])
+    parser.add_argument("--topic", help="Substring match on topic")
+    parser.add_argument("--winner", choices=["pro", "con"])
+    parser.add_argument("--since", help="ISO date/time lower bound")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--group-by", choices=["kind", "topic", "winner", "date"], help="Show aggregates instead of a listing")
+    args = parser.parse_args()
+
+    catalog = LogCatalog()
+    stats = catalog.ingest()
+    print(f"📚 Catalog refreshed: {stats['indexed']} indexed, {stats['unchanged']} unchanged, "
+          f"{stats['touched']} touched, {stats['removed']} removed")
+
+    if args.group_by:
+        print(f"\n{'Group':<40} {'Debates':>8} {'Pro':>5} {'Con':>5} {'Turns':>6} {'Audio':>6}")
+        print("-"*75)
+        for row in catalog.aggregate(args.group_by):
+            print(f"{str(row['grp'])[:40]:<40} {row['debates']:>8} {row['pro_wins'] or 0:>5} "
+                  f"{row['con_wins'] or 0:>5} {row['turns'] or 0:>6} {row['audio_files'] or 0:>6}")
+    else:
+        for row in catalog.list_logs(args.kind, args.topic, args.winner, args.since, limit=args.limit):
+            print(f"{row['timestamp'] or '?':<27} {row['kind']:<10} {row['winner'] or '-':<4} {row['topic'] or 'N/A'}")
+    catalog.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Debate Log Statistics
+Fleet-wide aggregates over the log catalog, computed on columnar NumPy arrays
+"""
+
+import argparse
+
+import numpy as np
+
+from log_catalog import LogCatalog
+
+GROUP_COLUMNS = ["all", "topic", "date", "kind"]
+
+WINNER_CODES = {"pro": 1, "con": -1}
+
+def load_columns(catalog):
+    """Load the catalog into column arrays: one set for debates, one for entries"""
+    logs = catalog.conn.execute(
+        "SELECT id, kind, topic, timestamp, winner, total_turns FROM logs ORDER BY id"
+    ).fetchall()
+    entries = catalog.conn.execute(
+        "SELECT log_id, section, timestamp, output_chars, audio_generated FROM entries ORDER BY log_id"
+    ).fetchall()
+
+    log_ids, kinds, topics, timestamps, winners, turns = zip(*logs) if logs else ([],) * 6
+    debates = {
+        "id": np.array(log_ids, dtype=np.int64),
+        "kind": np.array(kinds, dtype=str),
+        "topic": np.array([topic or "N/A" for topic in topics], dtype=str),
+        "date": np.array([(timestamp or "unknown")[:10] for timestamp in timestamps], dtype=str),
+        "winner": np.array([WINNER_CODES.get(winner, 0) for winner in winners], dtype=np.int8),
+        "turns": np.array([turn or 0 for turn in turns], dtype=np.int64),
+    }
+
+    entry_logs, sections, entry_times, chars, audio = zip(*entries) if entries else ([],) * 5
+    entry_columns = {
+        "log_id": np.array(entry_logs, dtype=np.int64),
+        "section": np.array(sections, dtype=str),
+        "time": parse_timestamps(entry_times),
+        "chars": np.array([n or 0 for n in chars], dtype=np.int64),
+        "audio": np.array([bool(flag) for flag in audio], dtype=bool),
+        "audio_tracked": np.array([flag is not None for flag in audio], dtype=bool),
+    }
+    return debates, entry_columns
+
+def parse_timestamps(values):
+    """ISO timestamps -> datetime64[ms]; missing or unparseable values become NaT"""
+    raw = np.array([(value or "NaT")[:26] for value in values], dtype=str)
+    try:
+        return raw.astype("datetime64[us]").astype("datetime64[ms]")
+    except ValueError:
+        return np.array([_parse_timestamp(value) for value in raw], dtype="datetime64[ms]")
+
+def _parse_timestamp(value):
+    try:
+        return np.datetime64(value, "ms")
+    except ValueError:
+        return np.datetime64("NaT", "ms")
+
+def group_index(debates, entries, group_by):
+    """Group labels plus a group number for every debate and every entry"""
+    if group_by == "all":
+        keys = np.zeros(len(debates["id"]), dtype=str)
+    else:
+        keys = debates[group_by]
+    labels, debate_groups = np.unique(keys, return_inverse=True)
+    if group_by == "all":
+        labels = np.array(["all"])
+    # Entries inherit the group of their debate (both are sorted by log id)
+    entry_groups = debate_groups[np.searchsorted(debates["id"], entries["log_id"])] if len(entries["log_id"]) else np.array([], dtype=np.int64)
+    return labels, debate_groups, entry_groups
+
+def turn_gaps(entries):
+    """Seconds between consecutive timestamped entries of the same debate"""
+    order = np.lexsort((entries["time"], entries["log_id"]))
+    log_ids = entries["log_id"][order]
+    times = entries["time"][order]
+    gaps = (times[1:] - times[:-1]).astype("timedelta64[ms]").astype(np.float64) / 1000.0
+    valid = (log_ids[1:] == log_ids[:-1]) & ~np.isnat(times[1:]) & ~np.isnat(times[:-1])
+    return gaps[valid], order[1:][valid]
+
+def compute_stats(debates, entries, group_by="all"):
+    """Win rates, response lengths, turn timings and audio coverage per group"""
+    if group_by not in GROUP_COLUMNS:
+        raise ValueError(f"Cannot group by {group_by}")
+    labels, debate_groups, entry_groups = group_index(debates, entries, group_by)
+    groups = len(labels)
+
+    count = np.bincount(debate_groups, minlength=groups)
+    pro_wins = np.bincount(debate_groups, weights=debates["winner"] == 1, minlength=groups)
+    con_wins = np.bincount(debate_groups, weights=debates["winner"] == -1, minlength=groups)
+    decided = pro_wins + con_wins
+    turns = np.bincount(debate_groups, weights=debates["turns"], minlength=groups)
+
+    entry_count = np.bincount(entry_groups, minlength=groups)
+    chars_total = np.bincount(entry_groups, weights=entries["chars"], minlength=groups)
+    audio_count = np.bincount(entry_groups, weights=entries["audio"], minlength=groups)
+    audio_tracked = np.bincount(entry_groups, weights=entries["audio_tracked"], minlength=groups)
+
+    gaps, gap_rows = turn_gaps(entries)
+    gap_groups = entry_groups[gap_rows]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stats = {
+            "group": labels,
+            "debates": count,
+            "pro_win_rate": np.where(decided > 0, pro_wins / decided, np.nan),
+            "con_win_rate": np.where(decided > 0, con_wins / decided, np.nan),
+            "undecided": count - decided.astype(np.int64),
+            "avg_turns": turns / np.maximum(count, 1),
+            "entries": entry_count,
+            "avg_chars": np.where(entry_count > 0, chars_total / np.maximum(entry_count, 1), np.nan),
+            "audio_rate": np.where(audio_tracked > 0, audio_count / np.maximum(audio_tracked, 1), np.nan),
+            "median_gap_s": np.full(groups, np.nan),
+        }
+
+    # Medians need sorted data per group: sort once by (group, gap) and index the middle
+    if len(gaps):
+        order = np.lexsort((gaps, gap_groups))
+        sorted_groups = gap_groups[order]
+        sorted_gaps = gaps[order]
+        starts = np.searchsorted(sorted_groups, np.arange(groups), side="left")
+        ends = np.searchsorted(sorted_groups, np.arange(groups), side="right")
+        has_gaps = ends > starts
+        lower = sorted_gaps[np.minimum((starts + ends - 1) // 2, len(sorted_gaps) - 1)]
+        upper = sorted_gaps[np.minimum((starts + ends) // 2, len(sorted_gaps) - 1)]
+        stats["median_gap_s"] = np.where(has_gaps, (lower + upper) / 2, np.nan)
+    return stats
+
+def length_distribution(entries, percentiles=(50, 90, 99)):
+    """Response-length percentiles per shared-memory section"""
+    distribution = {}
+    for section in np.unique(entries["section"]):
+        chars = entries["chars"][entries["section"] == section]
+        distribution[str(section)] = dict(zip(percentiles, np.percentile(chars, percentiles)), mean=chars.mean(), count=len(chars))
+    return distribution
+
+def print_report(debates, entries, group_by="all", limit=20):
+    """Print fleet-wide aggregates"""
+    stats = compute_stats(debates, entries, group_by)
+
+    def fmt(value, pattern):
+        return "-" if np.isnan(value) else pattern.format(value)
+
+    print(f"\n📈 DEBATE STATISTICS ({len(debates['id'])} debates, {len(entries['log_id'])} entries, by {group_by}):")
+    print(f"{'='*96}")
+    print(f"{'Group':<32} {'Debates':>8} {'Pro win':>8} {'Con win':>8} {'Undec.':>7} {'Turns':>6} "
+          f"{'Avg chars':>10} {'Audio':>6} {'Gap (s)':>8}")
+    print("-"*96)
+    order = np.argsort(-stats["debates"], kind="stable")[:limit]
+    for i in order:
+        print(f"{str(stats['group'][i])[:32]:<32} {stats['debates'][i]:>8} "
+              f"{fmt(stats['pro_win_rate'][i], '{:.0%}'):>8} {fmt(stats['con_win_rate'][i], '{:.0%}'):>8} "
+              f"{stats['undecided'][i]:>7} {stats['avg_turns'][i]:>6.1f} "
+              f"{fmt(stats['avg_chars'][i], '{:.0f}'):>10} {fmt(stats['audio_rate'][i], '{:.0%}'):>6} "
+              f"{fmt(stats['median_gap_s'][i], '{:.1f}'):>8}")
+    if len(stats["group"]) > limit:
+        print(f"... {len(stats['group']) - limit} more groups")
+
+    print(f"\n📏 RESPONSE LENGTHS (characters):")
+    print(f"{'='*40}")
+    for section, dist in length_distribution(entries).items():
+        print(f"{section:<24} n={dist['count']:<7} mean {dist['mean']:8.0f}  p50 {dist[50]:8.0f}  "
+              f"p90 {dist[90]:8.0f}  p99 {dist[99]:8.0f}")
+
+def main():
+    """Refresh the catalog and print fleet statistics"""
+    parser = argparse.ArgumentParser(description="Debate Log Statistics")
+    parser.add_argument("--group-by", choices=GROUP_COLUMNS, default="all")
+    parser.add_argument("--limit", type=int, default=20, help="Maximum groups to print")
+    args = parser.parse_args()
+
+    catalog = LogCatalog()
+    catalog.ingest()
+    debates, entries = load_columns(catalog)
+    catalog.close()
+    print_report(debates, entries, args.group_by, args.limit)
+
+if __name__ == "__main__":
+    main()
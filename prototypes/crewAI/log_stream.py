@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Streaming Debate Log Reader
+Walks a JSON debate log incrementally so memory stays flat however large the file is
+"""
+
+import json
+import re
+import sys
+
+CHUNK_SIZE = 64 * 1024
+
+# shared_memory sections that hold per-agent entries
+MEMORY_SECTIONS = [
+    "research_pro",
+    "research_con",
+    "pro_debater_argument",
+    "con_debater_argument",
+    "judge_evaluation",
+]
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+STRING_RUN = re.compile(r'[^"\\]*(?:\\(?:u[0-9a-fA-F]{4}|[^u])[^"\\]*)*')
+DELIMITER = re.compile(r"[,\]}\s]")
+LITERAL = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null")
+LITERAL_VALUES = {"true": True, "false": False, "null": None}
+
+class StreamedString(str):
+    """A possibly truncated string value; ``length`` is the full decoded length"""
+
+    def __new__(cls, text, length):
+        value = super().__new__(cls, text)
+        value.length = length
+        return value
+
+class _Scanner:
+    """Chunked character buffer that discards everything already consumed"""
+
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Skip whitespace and return the next character ("" at end of input)"""
+        while True:
+            self.pos = WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def read_string(self, limit):
+        """Read a string, keeping at most ``limit`` decoded characters"""
+        self.pos += 1  # opening quote
+        kept = []
+        kept_len = 0
+        length = 0
+        while True:
+            # Decode the longest run of complete characters/escapes in C
+            run = STRING_RUN.match(self.buf, self.pos).group()
+            self.pos += len(run)
+            if run:
+                decoded = json.loads('"' + run + '"')
+                length += len(decoded)
+                if kept_len < limit:
+                    kept.append(decoded[:limit - kept_len])
+                    kept_len += len(kept[-1])
+
+            if self.pos < len(self.buf) and self.buf[self.pos] == '"':
+                self.pos += 1
+                break
+            # End of buffer, or an escape split across chunks
+            if not self.fill():
+                raise ValueError("Unterminated string in debate log")
+
+        # Re-pair surrogates split between runs and drop any left dangling by truncation
+        text = "".join(kept).encode("utf-16", "surrogatepass").decode("utf-16", "replace")
+        return StreamedString(text, length)
+
+    def read_literal(self):
+        # Buffer up to the next delimiter so a number is never cut at a chunk edge
+        while not DELIMITER.search(self.buf, self.pos) and self.fill():
+            pass
+        match = LITERAL.match(self.buf, self.pos)
+        if not match:
+            raise ValueError(f"Invalid JSON near: {self.buf[self.pos:self.pos + 20]!r}")
+        self.pos = match.end()
+        token = match.group()
+        return LITERAL_VALUES[token] if token in LITERAL_VALUES else json.loads(token)
+
+def iter_events(f, max_string=None, chunk_size=CHUNK_SIZE):
+    """Yield ``(path, event, value)`` for every JSON token in ``f``.
+
+    ``path`` is the tuple of keys/indices leading to the value. Events are
+    start_map, map_key, end_map, start_array, end_array, string and literal.
+    Strings longer than ``max_string`` are truncated (see ``StreamedString``),
+    so no single value is ever held in full.
+    """
+    scanner = _Scanner(f, chunk_size)
+    limit = sys.maxsize if max_string is None else max_string
+    stack = []  # current key (maps) or index (arrays) at each depth
+    kinds = []
+    expect_key = False
+
+    while True:
+        ch = scanner.peek()
+        if ch == "":
+            if stack:
+                raise ValueError("Unexpected end of debate log")
+            return
+        if ch == ",":
+            scanner.pos += 1
+            if kinds[-1] == "map":
+                expect_key = True
+            else:
+                stack[-1] += 1
+            continue
+        if ch == ":":
+            scanner.pos += 1
+            continue
+        if ch in "}]":
+            scanner.pos += 1
+            kinds.pop()
+            stack.pop()
+            expect_key = False
+            yield tuple(stack), "end_map" if ch == "}" else "end_array", None
+            continue
+        if expect_key:
+            key = scanner.read_string(sys.maxsize)
+            stack[-1] = str(key)
+            expect_key = False
+            yield tuple(stack[:-1]), "map_key", stack[-1]
+            continue
+
+        path = tuple(stack)
+        if ch == "{":
+            scanner.pos += 1
+            yield path, "start_map", None
+            kinds.append("map")
+            stack.append(None)
+            expect_key = True
+        elif ch == "[":
+            scanner.pos += 1
+            yield path, "start_array", None
+            kinds.append("array")
+            stack.append(0)
+        elif ch == '"':
+            yield path, "string", scanner.read_string(limit)
+        else:
+            yield path, "literal", scanner.read_literal()
+
+def _preview(value, preview_chars):
+    text = value if isinstance(value, str) else json.dumps(value)
+    length = getattr(value, "length", len(text))
+    return text[:preview_chars] + "..." if length > preview_chars else text[:preview_chars], length
+
+def summarize_debate_log(path, preview_chars=100, max_listed=20):
+    """Counts and previews for a debate log, computed in one streaming pass.
+
+    Only the first ``max_listed`` entries of each section keep a preview;
+    the rest are counted. Entry outputs are never read past
+    ``preview_chars``, so memory does not grow with the file.
+    """
+    summary = {
+        "topic": None,
+        "timestamp": None,
+        "final_result": None,
+        "final_judgment": None,
+        "sections": {name: {"count": 0, "entries": []} for name in MEMORY_SECTIONS},
+        "conversation": {"count": 0, "entries": []},
+    }
+    top_level_previews = {"topic": 200, "timestamp": 200, "final_result": 200, "final_judgment": 200}
+    current = None
+
+    with open(path, "r", encoding="utf-8") as f:
+        for prefix, event, value in iter_events(f, max_string=max(preview_chars, 200) + 1):
+            depth = len(prefix)
+            if event in ("start_map", "end_map", "start_array", "end_array", "map_key"):
+                if event == "start_map" and depth == 3 and prefix[0] == "shared_memory" and prefix[1] in MEMORY_SECTIONS:
+                    section = summary["sections"][prefix[1]]
+                    section["count"] += 1
+                    current = {} if len(section["entries"]) < max_listed else None
+                    if current is not None:
+                        section["entries"].append(current)
+                elif event == "start_map" and depth == 2 and prefix[0] == "conversation_history":
+                    conversation = summary["conversation"]
+                    conversation["count"] += 1
+                    current = {} if len(conversation["entries"]) < max_listed else None
+                    if current is not None:
+                        conversation["entries"].append(current)
+                continue
+
+            if depth == 1 and prefix[0] in top_level_previews:
+                summary[prefix[0]] = _preview(value, top_level_previews[prefix[0]])[0]
+            elif current is None:
+                continue
+            elif depth == 4 and prefix[0] == "shared_memory" and prefix[1] in MEMORY_SECTIONS:
+                if prefix[3] == "output":
+                    current["preview"], current["length"] = _preview(value, preview_chars)
+                elif prefix[3] in ("agent_role", "timestamp"):
+                    current[prefix[3]] = value
+            elif depth == 3 and prefix[0] == "conversation_history":
+                if prefix[2] in ("pro", "con"):
+                    current[prefix[2]], current[prefix[2] + "_length"] = _preview(value, preview_chars)
+                elif prefix[2] in ("turn", "timestamp"):
+                    current[prefix[2]] = value
+    return summary
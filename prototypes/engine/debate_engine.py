@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Debate Engine
+One interface over every prototype backend: start a debate, stream its turns, get the verdict
+"""
+
+import argparse
+import importlib.util
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+PROTOTYPES_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_BACKEND = "langgraph"
+
+SPEAKERS = ["side_a", "side_b", "judge"]
+
+@dataclass
+class Turn:
+    speaker: str  # side_a, side_b or judge
+    text: str
+    index: int
+    elapsed: float  # seconds since the debate started
+
+@dataclass
+class Transcript:
+    backend: str
+    topic: str
+    side_a_point: str
+    side_b_point: str
+    rounds: int
+    turns: List[Turn] = field(default_factory=list)
+    verdict: str = ""
+    winner: Optional[str] = None  # side_a, side_b or None if the verdict has no WINNER line
+    started_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    duration: float = 0.0
+
+    def arguments(self):
+        return [turn for turn in self.turns if turn.speaker != "judge"]
+
+    def messages(self):
+        """``side_a: ...`` / ``side_b: ...`` / ``VERDICT: ...`` lines, as the API and frontend use them"""
+        lines = [f"{turn.speaker}: {turn.text}" for turn in self.arguments()]
+        if self.verdict:
+            lines.append(self.verdict if self.verdict.startswith("VERDICT:") else f"VERDICT: {self.verdict}")
+        return lines
+
+    def to_dict(self):
+        return asdict(self)
+
+# The judge prompt asks for an exact "WINNER: side_a" or "WINNER: side_b" line (markdown bold tolerated)
+WINNER_LINE = re.compile(r"^[\s*#>]*winner[\s*]*:[\s*`]*(side_[ab])\b", re.IGNORECASE | re.MULTILINE)
+
+def parse_winner(verdict):
+    """side_a, side_b or None (no WINNER line, or WINNER lines that disagree)"""
+    found = {label.lower() for label in WINNER_LINE.findall(verdict or "")}
+    return found.pop() if len(found) == 1 else None
+
+def load_prototype(folder, filename):
+    """Import a prototype script by path under a unique module name.
+
+    Its folder goes on ``sys.path`` so the script's own flat imports
+    (e.g. crewAI's ``event_store``) keep working.
+    """
+    name = f"{folder.lower()}_{os.path.splitext(filename)[0]}"
+    if name in sys.modules:
+        return sys.modules[name]
+    directory = os.path.join(PROTOTYPES_DIR, folder)
+    if directory not in sys.path:
+        sys.path.append(directory)
+    spec = importlib.util.spec_from_file_location(name, os.path.join(directory, filename))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+class DebateEngine:
+    """Common protocol for debate backends.
+
+    ``start`` sets up a debate, ``stream_turns`` runs it and yields each
+    ``Turn`` as the backend produces it (the judge's turn last), and
+    ``verdict`` returns the judge's text, running whatever is left first.
+    Adapters only implement ``_generate``, which yields (speaker, text).
+    """
+
+    name = None
+    streams_live = True  # False when the backend only returns turns after the whole debate
+
+    def __init__(self):
+        self.transcript = None
+        self._ran = False
+        self._start_time = None
+
+    def start(self, topic, side_a_point, side_b_point, rounds=2):
+        self.transcript = Transcript(self.name, topic, side_a_point, side_b_point, rounds)
+        self._ran = False
+        self._start_time = time.perf_counter()
+        return self.transcript
+
+    def _generate(self, transcript):
+        raise NotImplementedError
+
+    def stream_turns(self) -> Iterator[Turn]:
+        if self.transcript is None:
+            raise RuntimeError("Call start() before stream_turns()")
+        if self._ran:
+            raise RuntimeError("This debate has already been run")
+        self._ran = True
+        transcript = self.transcript
+        for speaker, text in self._generate(transcript):
+            turn = Turn(speaker, str(text).strip(), len(transcript.turns), time.perf_counter() - self._start_time)
+            transcript.turns.append(turn)
+            if speaker == "judge":
+                transcript.verdict = turn.text
+                transcript.winner = parse_winner(turn.text)
+            yield turn
+        transcript.duration = time.perf_counter() - self._start_time
+
+    def verdict(self):
+        if not self._ran:
+            for _ in self.stream_turns():
+                pass
+        return self.transcript.verdict
+
+    def run(self, topic, side_a_point, side_b_point, rounds=2):
+        """Run a whole debate and return its transcript"""
+        self.start(topic, side_a_point, side_b_point, rounds)
+        self.verdict()
+        return self.transcript
+
+class LangGraphEngine(DebateEngine):
+    name = "langgraph"
+
+    def _generate(self, transcript):
+        module = load_prototype("langgraph", "langgraph_for_api.py")
+        system = module.LangGraphDebateSystem(transcript.topic, transcript.side_a_point, transcript.side_b_point, transcript.rounds)
+        state = module.DebateState(
+            history=[f"Topic: {transcript.topic}",
+                     f"Position A: {transcript.side_a_point}",
+                     f"Position B: {transcript.side_b_point}"],
+            round=0,
+            max_rounds=transcript.rounds
+        )
+        for update in system.workflow.stream(state, stream_mode="updates"):
+            for node, value in update.items():
+                history = value["history"] if isinstance(value, dict) else value.history
+                message = history[-1]
+                if node == "judge":
+                    yield "judge", message
+                else:
+                    yield node, message[len(node) + 1:]
+
+class LangChainEngine(DebateEngine):
+    name = "langchain"
+
+    def _generate(self, transcript):
+        module = load_prototype("langchain", "main.py")
+        system = module.LangChainDebateSystem(transcript.topic, transcript.side_a_point, transcript.side_b_point, transcript.rounds)
+        history = []
+        for side in system.turn_order():
+            msg = system.argument_chain.run(**system.argument_inputs(side, history))
+            history.append(f"{side}: {msg}\n")
+            yield side, msg
+        yield "judge", system.judge_chain.run(**system.judge_inputs(history))
+
+class CrewAIEngine(DebateEngine):
+    """Single pro/con exchange; the crew decides the sides from the topic"""
+
+    name = "crewai"
+    streams_live = False
+
+    def _generate(self, transcript):
+        module = load_prototype("crewAI", "debate_system.py")
+        with module.DebatingSystem() as system:
+            result = system.run_debate(transcript.topic)
+        memory = system.shared_memory
+        for section, speaker in (("pro_debater_argument", "side_a"), ("con_debater_argument", "side_b")):
+            for entry in memory.get(section, []):
+                yield speaker, entry["output"]
+        judgments = memory.get("judge_evaluation", [])
+        yield "judge", judgments[-1]["output"] if judgments else result
+
+class AG2Engine(DebateEngine):
+    name = "ag2"
+    streams_live = False
+
+    def _generate(self, transcript):
+        module = load_prototype("ag2", "main.py")
+        system = module.DebateSystem(transcript.topic, transcript.side_a_point, transcript.side_b_point)
+        result = system.run_debate(rounds=transcript.rounds)
+        yield from result["turns"]
+        yield "judge", result["verdict"]
+
+class AgnoEngine(DebateEngine):
+    name = "agno"
+
+    def _generate(self, transcript):
+        module = load_prototype("Agno", "agent.py")
+        session_id = f"debate_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        yield from module.debate_turns(transcript.topic, transcript.side_a_point, transcript.side_b_point,
+                                       transcript.rounds, session_id=session_id)
+
+class AgentsSDKEngine(DebateEngine):
+    name = "agents_sdk"
+
+    def _generate(self, transcript):
+        module = load_prototype("AgentsSDK", "agent.py")
+        yield from module.debate_turns(transcript.topic, transcript.side_a_point, transcript.side_b_point, transcript.rounds)
+
+BACKENDS = {
+    engine.name: engine
+    for engine in (LangGraphEngine, LangChainEngine, CrewAIEngine, AG2Engine, AgnoEngine, AgentsSDKEngine)
+}
+
+def get_engine(name=None, workload=None):
+    """New engine by name, else ``DEBATE_BACKEND_<WORKLOAD>``, else ``DEBATE_BACKEND``, else langgraph.
+
+    Setting e.g. ``DEBATE_BACKEND_API=langchain`` and
+    ``DEBATE_BACKEND_BATCH=langgraph`` picks a backend per workload.
+    """
+    if not name and workload:
+        name = os.getenv(f"DEBATE_BACKEND_{workload.upper()}")
+    name = (name or os.getenv("DEBATE_BACKEND") or DEFAULT_BACKEND).lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown debate backend: {name} (choose from {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
+
+def compare_backends(names, topic, side_a_point, side_b_point, rounds=2):
+    """Run the same debate on each backend; failures are reported, not raised"""
+    results = []
+    for name in names:
+        print(f"\n🚀 Running {name}...")
+        try:
+            transcript = get_engine(name).run(topic, side_a_point, side_b_point, rounds)
+            results.append((name, transcript, None))
+        except Exception as e:
+            print(f"❌ {name} failed: {e}")
+            results.append((name, None, e))
+
+    print(f"\n📊 BACKEND COMPARISON: {topic}")
+    print(f"{'='*72}")
+    print(f"{'Backend':<12} {'Turns':>6} {'Total (s)':>10} {'Per turn (s)':>13} {'First turn (s)':>15} {'Winner':>8}")
+    print("-"*72)
+    for name, transcript, error in results:
+        if error:
+            print(f"{name:<12} {'failed':>6}")
+            continue
+        turns = len(transcript.turns)
+        first = f"{transcript.turns[0].elapsed:.2f}" if turns else "-"
+        print(f"{name:<12} {turns:>6} {transcript.duration:>10.2f} {transcript.duration / max(turns, 1):>13.2f} "
+              f"{first:>15} {transcript.winner or '-':>8}")
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a debate on any backend")
+    parser.add_argument("--backend", help=f"One of: {', '.join(BACKENDS)} (default: $DEBATE_BACKEND or {DEFAULT_BACKEND})")
+    parser.add_argument("--compare", nargs="*", metavar="BACKEND", help="Run the same debate on several backends (all if none given)")
+    parser.add_argument("--topic", default="cats vs dogs")
+    parser.add_argument("--side-a", default="cats are better pets")
+    parser.add_argument("--side-b", default="dogs are better pets")
+    parser.add_argument("--rounds", type=int, default=2)
+    args = parser.parse_args()
+
+    if args.compare is not None:
+        compare_backends(args.compare or list(BACKENDS), args.topic, args.side_a, args.side_b, args.rounds)
+        return
+
+    engine = get_engine(args.backend)
+    engine.start(args.topic, args.side_a, args.side_b, args.rounds)
+    print(f"\n💬 Debate Topic: {args.topic} ({engine.name})\n")
+    for turn in engine.stream_turns():
+        icon = {"side_a": "🔵", "side_b": "🔴", "judge": "⚖️"}[turn.speaker] if turn.speaker in SPEAKERS else "📝"
+        print(f"{icon} [{turn.elapsed:6.2f}s] {turn.speaker}: {turn.text}\n")
+    print(f"🏆 Winner: {engine.transcript.winner or 'unclear'} ({engine.transcript.duration:.1f}s)")
+
+if __name__ == "__main__":
+    main()
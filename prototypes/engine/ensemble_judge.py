@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Ensemble Judge
+Sends one verdict prompt to K judges at once and returns as soon as a majority is settled,
+cancelling the judges still thinking
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import re
+import statistics
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+# Judges per verdict; the default of 1 is a single judge call, as before ensembles existed
+ENSEMBLE_SIZE = int(os.getenv("JUDGE_ENSEMBLE_SIZE", "1"))
+
+# Ensemble judges take a little randomness so that K judges on one model are not K copies of one vote;
+# a single judge keeps its model's default temperature
+JUDGE_TEMPERATURE = float(os.getenv("JUDGE_TEMPERATURE", "0.7"))
+
+_loop = None
+_loop_lock = threading.Lock()
+
+def _background_loop():
+    """One event loop thread shared by every ensemble's blocking calls"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="ensemble-judge", daemon=True).start()
+    return _loop
+
+def judge_models(default):
+    """Models the ensemble cycles through: ``JUDGE_MODELS`` (comma separated), else ``default``"""
+    models = [model.strip() for model in os.getenv("JUDGE_MODELS", "").split(",") if model.strip()]
+    return models or [default]
+
+@dataclass
+class Verdict:
+    winner: Optional[str]  # the label a majority (or failing that, a plurality) voted for; None if tied
+    text: str  # the first verdict given for the winner, to show as the reason
+    votes: Dict[str, int] = field(default_factory=dict)  # label -> votes; "undecided" for unparsable verdicts
+    answered: int = 0  # judges that returned before the vote was settled
+    cancelled: int = 0
+    failed: int = 0
+    latency: float = 0.0
+
+    @property
+    def content(self):
+        """The verdict text, so the ensemble can stand in for a chat model's reply"""
+        return self.text
+
+class MistralJudge:
+    """One judge on the Mistral API (async, so it can be cancelled mid-request)"""
+
+    def __init__(self, model, api_key=None, temperature=None):
+        from mistralai import Mistral
+        self.name = model
+        self.model = model
+        self.temperature = temperature
+        self.client = Mistral(api_key=api_key or os.getenv("MISTRAL_API_KEY"))
+
+    async def __call__(self, prompt):
+        options = {} if self.temperature is None else {"temperature": self.temperature}
+        response = await self.client.chat.complete_async(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            **options,
+        )
+        return response.choices[0].message.content
+
+class ChatModelJudge:
+    """One judge on any chat model with ``ainvoke`` (e.g. LangChain's ChatOpenAI)"""
+
+    def __init__(self, llm, name=None):
+        self.llm = llm
+        self.name = name or getattr(llm, "model_name", None) or type(llm).__name__
+
+    async def __call__(self, prompt):
+        return (await self.llm.ainvoke(prompt)).content
+
+def label_parser(*labels):
+    """Parse the label named on the WINNER line of a verdict (or anywhere in it), else None"""
+    patterns = [(label, re.compile(rf"\b{re.escape(label)}\b", re.IGNORECASE)) for label in labels]
+
+    def parse(text):
+        match = re.search(r"winner\s*:?(.*)", text or "", re.IGNORECASE)
+        scope = match.group(1) if match and match.group(1).strip() else (text or "")
+        found = [label for label, pattern in patterns if pattern.search(scope)]
+        return found[0] if len(found) == 1 else None
+
+    return parse
+
+class EnsembleJudge:
+    """K concurrent judges with early-exit majority voting.
+
+    Every judge gets the same prompt at once. As verdicts arrive they are
+    parsed into labels, and the vote ends as soon as the leading label
+    can't be caught: its lead is larger than the number of judges still
+    out. The judges still out are then cancelled, so latency is roughly
+    that of the ceil(K/2)-th fastest judge, not the sum of all of them.
+    """
+
+    def __init__(self, judges, parse):
+        if not judges:
+            raise ValueError("An ensemble needs at least one judge")
+        self.judges = list(judges)
+        self.parse = parse  # verdict text -> label or None
+
+    @classmethod
+    def mistral(cls, parse, size=ENSEMBLE_SIZE, default_model="mistral-tiny", api_key=None):
+        """``size`` Mistral judges, cycling through ``JUDGE_MODELS``"""
+        models = judge_models(default_model)
+        size = max(1, size)
+        temperature = JUDGE_TEMPERATURE if size > 1 else None
+        return cls([MistralJudge(models[i % len(models)], api_key, temperature) for i in range(size)], parse)
+
+    async def vote(self, prompt):
+        start = time.perf_counter()
+        tasks = {asyncio.ensure_future(judge(prompt)): judge for judge in self.judges}
+        votes = Counter()
+        texts = {}
+        failed = 0
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        text = task.result()
+                    except Exception as e:
+                        failed += 1
+                        print(f"⚠️ Judge {getattr(tasks[task], 'name', '?')} failed: {e}")
+                        continue
+                    label = self.parse(text) or "undecided"
+                    votes[label] += 1
+                    texts.setdefault(label, text)
+                if self._settled(votes, len(pending)):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        decided = [(label, count) for label, count in votes.most_common() if label != "undecided"]
+        winner = None
+        if decided and (len(decided) == 1 or decided[0][1] > decided[1][1]):
+            winner = decided[0][0]
+        if not texts and failed:
+            raise RuntimeError(f"All {failed} judges failed")
+        return Verdict(
+            winner=winner,
+            text=texts.get(winner) or next(iter(texts.values())),
+            votes=dict(votes),
+            answered=sum(votes.values()),
+            cancelled=len(pending),
+            failed=failed,
+            latency=time.perf_counter() - start,
+        )
+
+    @staticmethod
+    def _settled(votes, outstanding):
+        """True when the remaining judges can no longer change the leading label"""
+        ranked = [count for label, count in votes.most_common() if label != "undecided"]
+        if not ranked:
+            return outstanding == 0
+        runner_up = ranked[1] if len(ranked) > 1 else 0
+        return ranked[0] - runner_up > outstanding
+
+    async def ainvoke(self, prompt):
+        return await self.vote(prompt)
+
+    def invoke(self, prompt):
+        """Blocking vote for synchronous callers (Flask views, LangGraph's sync nodes).
+
+        Runs on a shared background event loop, so async clients stay bound
+        to one loop however many threads call in.
+        """
+        return asyncio.run_coroutine_threadsafe(self.vote(prompt), _background_loop()).result()
+
+def simulate(ensemble_size=3, trials=200, median_seconds=0.2, sigma=0.5, agreement=0.7):
+    """Latency of a single judge, K judges in sequence and the early-exit ensemble, with fake judges"""
+
+    class FakeJudge:
+        name = "fake"
+
+        async def __call__(self, prompt):
+            await asyncio.sleep(random.lognormvariate(0, sigma) * median_seconds)
+            return "WINNER: side_a" if random.random() < agreement else "WINNER: side_b"
+
+    ensemble = EnsembleJudge([FakeJudge() for _ in range(ensemble_size)], label_parser("side_a", "side_b"))
+
+    async def run():
+        verdicts = [await ensemble.vote("prompt") for _ in range(trials)]
+        singles = []
+        for _ in range(trials):
+            start = time.perf_counter()
+            await FakeJudge()("prompt")
+            singles.append(time.perf_counter() - start)
+        return verdicts, singles
+
+    verdicts, singles = asyncio.run(run())
+    latencies = [verdict.latency for verdict in verdicts]
+    print(f"\n⚖️ JUDGE LATENCY ({ensemble_size} judges, {trials} verdicts, {agreement:.0%} agreement):")
+    print(f"{'='*60}")
+    print(f"Single judge      p50 {statistics.median(singles) * 1000:6.0f} ms")
+    print(f"{ensemble_size} in sequence     p50 {statistics.median(singles) * ensemble_size * 1000:6.0f} ms (estimated)")
+    print(f"Ensemble          p50 {statistics.median(latencies) * 1000:6.0f} ms")
+    print(f"Cancelled judges  {sum(v.cancelled for v in verdicts) / trials:.2f} per verdict")
+    print(f"Majority for side_a in {sum(v.winner == 'side_a' for v in verdicts) / trials:.0%} of verdicts "
+          f"(single judge: {agreement:.0%})")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate the ensemble judge's latency and accuracy")
+    parser.add_argument("--judges", type=int, default=3)
+    parser.add_argument("--trials", type=int, default=200)
+    parser.add_argument("--agreement", type=float, default=0.7, help="Chance a single judge picks the better side")
+    args = parser.parse_args()
+    simulate(args.judges, args.trials, agreement=args.agreement)
@@ -1,4 +1,7 @@
 import os
+import sys
+import asyncio
+from collections import deque
 from langchain.chains import LLMChain
 from langchain.prompts import PromptTemplate
 from langchain.memory import ConversationBufferMemory
@@ -19,21 +22,11 @@ class LangChainDebateSystem:
             temperature=0.3,
         )
 
-        # Prompts
-        self.side_a_prompt = PromptTemplate(
-            input_variables=["history", "topic"],
+        # Prompts (both sides share one template; the position is an input)
+        self.argument_prompt = PromptTemplate(
+            input_variables=["history", "topic", "position"],
             template=(
-                "You are concisely arguing FOR: {side_a_point}.\n"
-                "Debate topic: {topic}\n"
-                "Conversation so far:\n{history}\n"
-                "Don't use numbered points or lists.\n"
-                "Your next point (1-2 sentences, no pleasantries):"
-            )
-        )
-        self.side_b_prompt = PromptTemplate(
-            input_variables=["history", "topic"],
-            template=(
-                "You are concisely arguing FOR: {side_b_point}.\n"
+                "You are concisely arguing FOR: {position}.\n"
                 "Debate topic: {topic}\n"
                 "Conversation so far:\n{history}\n"
                 "Don't use numbered points or lists.\n"
@@ -52,60 +45,149 @@ class LangChainDebateSystem:
             )
         )
 
-        # Chains with partials for static arguments
-        self.side_a_chain = LLMChain(
-            llm=self.llm,
-            prompt=self.side_a_prompt.partial(side_a_point=self.side_a_point, topic=self.topic)
-        )
-        self.side_b_chain = LLMChain(
-            llm=self.llm,
-            prompt=self.side_b_prompt.partial(side_b_point=self.side_b_point, topic=self.topic)
-        )
-        self.judge_chain = LLMChain(
-            llm=self.llm,
-            prompt=self.judge_prompt.partial(topic=self.topic)
-        )
+        # Chains take topic and position as inputs, so one chain can serve a batch of debates
+        self.argument_chain = LLMChain(llm=self.llm, prompt=self.argument_prompt)
+        self.judge_chain = LLMChain(llm=self.llm, prompt=self.judge_prompt)
+
     def print_reply(self, agent, message):
         print(f"👨‍💻 {agent}:\n {message}\n\n")
 
+    def turn_order(self):
+        """Opening statements, debate rounds and closing statements, side A first"""
+        return ["side_a", "side_b"] * (self.rounds + 2)
+
+    def argument_inputs(self, side, history):
+        position = self.side_a_point if side == "side_a" else self.side_b_point
+        return {"history": "".join(history), "topic": self.topic, "position": position}
+
+    def judge_inputs(self, history):
+        return {"transcript": "".join(history), "topic": self.topic}
+
+    def result(self, history, verdict):
+        return {
+            "topic": self.topic,
+            "side_a_point": self.side_a_point,
+            "side_b_point": self.side_b_point,
+            "transcript": "".join(history),
+            "turns": len(history),
+            "verdict": verdict,
+        }
+
     def run_debate(self):
-        history = ""
+        history = []
         print(f"\n\n💬 Debate Topic: {self.topic}\n\n")
-        # Opening statement by side A
-        msg_a = self.side_a_chain.run(history=history, topic=self.topic)
-        self.print_reply("side_a", msg_a)
-        history += f"side_a: {msg_a}\n"
-        msg_b = self.side_b_chain.run(history=history, topic=self.topic)
-        self.print_reply("side_b", msg_b)
-        history += f"side_b: {msg_b}\n"
-
-        # Debate rounds
-        for _ in range(self.rounds):
-            msg_a = self.side_a_chain.run(history=history, topic=self.topic)
-            self.print_reply("side_a", msg_a)
-            history += f"side_a: {msg_a}\n"
-            msg_b = self.side_b_chain.run(history=history, topic=self.topic)
-            self.print_reply("side_b", msg_b)
-            history += f"side_b: {msg_b}\n"
-
-        # Closing statements
-        msg_a = self.side_a_chain.run(history=history, topic=self.topic)
-        self.print_reply("side_a", msg_a)
-        history += f"side_a: {msg_a}\n"
-        msg_b = self.side_b_chain.run(history=history, topic=self.topic)
-        self.print_reply("side_b", msg_b)
-        history += f"side_b: {msg_b}\n"
+        for side in self.turn_order():
+            msg = self.argument_chain.run(**self.argument_inputs(side, history))
+            self.print_reply(side, msg)
+            history.append(f"{side}: {msg}\n")
 
         # Judge
-        verdict = self.judge_chain.run(transcript=history, topic=self.topic)
+        verdict = self.judge_chain.run(**self.judge_inputs(history))
         print("\nJUDGE'S VERDICT:")
         print(verdict)
+        return self.result(history, verdict)
+
+    async def arun_debate(self):
+        """Same debate as ``run_debate`` using the chains' async API"""
+        history = []
+        print(f"\n\n💬 Debate Topic: {self.topic}\n\n")
+        for side in self.turn_order():
+            msg = (await self.argument_chain.ainvoke(self.argument_inputs(side, history)))["text"]
+            self.print_reply(side, msg)
+            history.append(f"{side}: {msg}\n")
+
+        verdict = (await self.judge_chain.ainvoke(self.judge_inputs(history)))["text"]
+        print("\nJUDGE'S VERDICT:")
+        print(verdict)
+        return self.result(history, verdict)
+
+    @staticmethod
+    async def batch_run(debates, max_concurrency=8, max_active=32):
+        """Run many debates interleaved, yielding each result as its debate finishes.
+
+        Every step sends the next turn of all active debates to the model in
+        one ``abatch`` call (and all pending verdicts in another), with at most
+        ``max_concurrency`` requests in flight per call. At most ``max_active``
+        debates are in progress; a finished debate's slot goes to the next one
+        in the queue. A debate whose request fails is yielded with an
+        ``error`` instead of stopping the batch. The first debate's chains are
+        used for all of them, so they share its model settings.
+        """
+        if not debates:
+            return
+        argument_chain = debates[0].argument_chain
+        judge_chain = debates[0].judge_chain
+        config = {"max_concurrency": max_concurrency}
+        queue = deque(debates)
+        active = []
+
+        while queue or active:
+            while queue and len(active) < max_active:
+                debate = queue.popleft()
+                active.append({"debate": debate, "turns": deque(debate.turn_order()), "history": []})
+
+            arguing = [state for state in active if state["turns"]]
+            judging = [state for state in active if not state["turns"]]
+
+            if arguing:
+                inputs = [state["debate"].argument_inputs(state["turns"][0], state["history"]) for state in arguing]
+                outputs = await argument_chain.abatch(inputs, config=config, return_exceptions=True)
+                for state, output in zip(arguing, outputs):
+                    if isinstance(output, Exception):
+                        state["error"] = output
+                        continue
+                    side = state["turns"].popleft()
+                    state["history"].append(f"{side}: {output['text']}\n")
+
+            if judging:
+                inputs = [state["debate"].judge_inputs(state["history"]) for state in judging]
+                outputs = await judge_chain.abatch(inputs, config=config, return_exceptions=True)
+                for state, output in zip(judging, outputs):
+                    if isinstance(output, Exception):
+                        state["error"] = output
+                    else:
+                        state["verdict"] = output["text"]
+
+            still_active = []
+            for state in active:
+                if "verdict" in state or "error" in state:
+                    result = state["debate"].result(state["history"], state.get("verdict"))
+                    if "error" in state:
+                        result["error"] = str(state["error"])
+                    yield result
+                else:
+                    still_active.append(state)
+            active = still_active
+
+async def run_batch(debates, max_concurrency=8):
+    """Print batch results in the order the debates finish"""
+    finished = 0
+    async for result in LangChainDebateSystem.batch_run(debates, max_concurrency=max_concurrency):
+        finished += 1
+        print(f"\n🏁 [{finished}/{len(debates)}] {result['topic']} ({result['turns']} turns)")
+        if "error" in result:
+            print(f"❌ Failed: {result['error']}")
+        else:
+            print(result["verdict"])
 
 if __name__ == "__main__":
-    debate = LangChainDebateSystem(
-        topic="cats vs dogs",
-        side_a_point="cats are better pets",
-        side_b_point="dogs are better pets",
-        rounds=2
-    )
-    debate.run_debate()
+    if "--batch" in sys.argv:
+        # Several debates interleaved, same-stage calls batched together
+        matchups = [
+            ("cats vs dogs", "cats are better pets", "dogs are better pets"),
+            ("remote vs office work", "remote work is more productive", "office work is more productive"),
+            ("city vs countryside", "city life is better", "countryside life is better"),
+        ]
+        debates = [LangChainDebateSystem(topic, a, b, rounds=2) for topic, a, b in matchups]
+        asyncio.run(run_batch(debates))
+    else:
+        debate = LangChainDebateSystem(
+            topic="cats vs dogs",
+            side_a_point="cats are better pets",
+            side_b_point="dogs are better pets",
+            rounds=2
+        )
+        if "--async" in sys.argv:
+            asyncio.run(debate.arun_debate())
+        else:
+            debate.run_debate()
@@ -1,28 +1,51 @@
-from langgraph_for_api import LangGraphDebateSystem, DebateState
 from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
-from elevenlabs.client import ElevenLabs
-from elevenlabs import play, stream
 from dotenv import load_dotenv
-from langgraph.graph import StateGraph, END
-from langchain.chat_models import ChatOpenAI
-from mistralai import Mistral
 import requests
 from utils import fetch_transcript, extract_json
+from collections import defaultdict
+import threading
+import hashlib
+import json
+import time
+import sys
+import re
 import os
 
+# Shared debate engine interface (prototypes/engine); the backend is picked per request or by configuration
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "engine"))
+from debate_engine import get_engine
+from ensemble_judge import EnsembleJudge
+
+# Shared TTS backends and audio profiles (prototypes/TTS); TTS_BACKEND=local speaks offline with espeak-ng
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "TTS"))
+from audio_profiles import AUDIO_PROFILES, get_profile
+from tts_backends import get_backend
+
 load_dotenv()
 app = Flask(__name__)
+
+# Ensemble judges for /get_llm_verdict, one per (model, hash of the API key) so no key is kept as a dict key
+verdict_judges = {}
 CORS(app, resources={r"/*": {"origins": "*"}})
-client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+tts = get_backend()
 
-# Voice IDs for different speakers
-VOICES = {
-    "side_a": "JBFqnCBsd6RMkjVDRZzb",  # Josh
-    "side_b": "ThT5KcBeYPX3keUQqHPh",   # Arnold
-    "judge": "VR6AewLTigWG4xSOukaG",    # Rachel
-    "narrator": "ErXwobaYiN019PkySvjV"   # Bella
-}
+# Output-format profile for /stream_message (?profile=...); low bandwidth by default.
+# The local backend produces WAV whatever the profile.
+DEFAULT_AUDIO_PROFILE = os.getenv("STREAM_AUDIO_PROFILE", "stream")
+
+# Bytes sent and time-to-first-byte per profile and per debate (?debate_id=...)
+audio_stats_lock = threading.Lock()
+audio_stats = defaultdict(lambda: {"requests": 0, "bytes": 0, "ttfb_ms": []})
+
+def record_audio_transfer(profile_name, debate_id, sent_bytes, ttfb_ms):
+    with audio_stats_lock:
+        for key in (f"profile:{profile_name}", f"debate:{debate_id}:{profile_name}" if debate_id else None):
+            if key:
+                audio_stats[key]["requests"] += 1
+                audio_stats[key]["bytes"] += sent_bytes
+                if ttfb_ms is not None:
+                    audio_stats[key]["ttfb_ms"].append(ttfb_ms)
 
 @app.route('/')
 def index():
@@ -149,58 +172,91 @@ def start_debate():
     side_b_point = request.args.get('side_b_point', 'dogs are better pets')
     rounds = int(request.args.get('rounds', 2))
 
-    # Create and run debate
-    debate = LangGraphDebateSystem(
-        topic=topic,
-        side_a_point=side_a_point,
-        side_b_point=side_b_point,
-        rounds=rounds
-    )
-
-    # Initialize state
-    state = DebateState(
-        history=[f"Welcome to today's debate on {topic}.",
-                f"Agent Alpha will argue that {side_a_point}",
-                f"Agent Beta will argue that {side_b_point}"],
-        round=0,
-        max_rounds=rounds
-    )
-
-    # Run debate
-    final_state = debate.workflow.invoke(state)
+    # ?backend= overrides DEBATE_BACKEND_API / DEBATE_BACKEND (default langgraph)
+    try:
+        engine = get_engine(request.args.get('backend'), workload="api")
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    transcript = engine.run(topic, side_a_point, side_b_point, rounds)
 
     return jsonify({
-        'messages': final_state['history']
+        'messages': [f"Welcome to today's debate on {topic}.",
+                     f"Agent Alpha will argue that {side_a_point}",
+                     f"Agent Beta will argue that {side_b_point}"] + transcript.messages(),
+        'backend': engine.name,
+        'winner': transcript.winner,
+        'duration': round(transcript.duration, 2)
     })
 
 @app.route('/stream_message')
 def stream_message():
     message = request.args.get('message', '')
+    profile_name = request.args.get('profile', DEFAULT_AUDIO_PROFILE)
+    debate_id = request.args.get('debate_id')
+    try:
+        profile = get_profile(profile_name)
+    except ValueError:
+        return jsonify({'error': f"Unknown profile '{profile_name}'", 'profiles': list(AUDIO_PROFILES)}), 400
+    output_format = tts.output_format(profile["output_format"])
 
     # Determine which voice to use based on the message prefix
-    voice_id = VOICES['narrator']  # default voice
+    voice = 'narrator'  # default voice
     if message.startswith('side_a:'):
-        voice_id = VOICES['side_a']
+        voice = 'side_a'
         message = message[7:].strip()  # Remove prefix
     elif message.startswith('side_b:'):
-        voice_id = VOICES['side_b']
+        voice = 'side_b'
         message = message[7:].strip()  # Remove prefix
     elif message.startswith('VERDICT:'):
-        voice_id = VOICES['judge']
+        voice = 'judge'
         message = message[8:].strip()  # Remove prefix
 
     def generate():
-        audio_stream = client.text_to_speech.stream(
-            text=message,
-            voice_id=voice_id,
-            model_id="eleven_multilingual_v2"
-        )
-
-        for chunk in audio_stream:
-            if isinstance(chunk, bytes):
+        start = time.perf_counter()
+        ttfb_ms = None
+        sent_bytes = 0
+        audio_stream = tts.stream(text=message, voice=voice, output_format=output_format)
+
+        try:
+            for chunk in audio_stream:
+                if ttfb_ms is None:
+                    ttfb_ms = (time.perf_counter() - start) * 1000
+                sent_bytes += len(chunk)
                 yield chunk
-
-    return Response(generate(), mimetype='audio/mpeg')
+        finally:
+            record_audio_transfer(profile["name"], debate_id, sent_bytes, ttfb_ms)
+            print(f"Audio [{tts.name}/{profile['name']}]: {sent_bytes} bytes, TTFB {ttfb_ms or 0:.0f} ms")
+
+    return Response(generate(), mimetype=tts.mimetype(output_format))
+
+@app.route('/audio_stats')
+def get_audio_stats():
+    """Bytes sent and TTFB per profile, and per debate when ?debate_id= was passed"""
+    with audio_stats_lock:
+        report = {}
+        for key, stats in audio_stats.items():
+            ttfb = sorted(stats["ttfb_ms"])
+            report[key] = {
+                "requests": stats["requests"],
+                "bytes": stats["bytes"],
+                "ttfb_ms_avg": round(sum(ttfb) / len(ttfb), 1) if ttfb else None,
+                "ttfb_ms_p50": round(ttfb[len(ttfb) // 2], 1) if ttfb else None,
+            }
+    return jsonify(report)
+
+VERDICT_WINNERS = {"user": "User", "agent smith": "Agent Smith", "ai agent smith": "Agent Smith"}
+
+def parse_verdict_winner(text):
+    """The ``winner`` field of the judge's JSON reply, or None if it isn't one of the participants"""
+    match = re.search(r'\{.*\}', text or "", re.DOTALL)
+    if not match:
+        return None
+    try:
+        winner = json.loads(match.group(0)).get("winner")
+    except (json.JSONDecodeError, AttributeError):
+        return None
+    return VERDICT_WINNERS.get(str(winner).strip().lower())
 
 @app.route('/get_llm_verdict', methods=['GET'])
 def get_llm_verdict():
@@ -213,7 +269,6 @@ def get_llm_verdict():
 
     print('Transcript:', transcript)
 
-    client = Mistral(api_key=mistral_api_key)
     topic = ""
     prompt = f"""You are judging the debate on: {topic}.
             Debate transcript: \n{transcript}.
@@ -225,19 +280,18 @@ def get_llm_verdict():
                 "reason": "one clear sentence explaining why the winner's argument was better"
             }}
             """
-    chat_response = client.chat.complete(
-        model = model,
-        messages = [
-            {
-                "role": "user",
-                "content": prompt,
-            },
-        ]
-    )
-
-    print('LLM response', chat_response)
-
-    result = extract_json(chat_response.choices[0].message.content)
+    # JUDGE_ENSEMBLE_SIZE judges vote concurrently; the reply comes once a majority is settled
+    judge_key = (model, hashlib.sha256((mistral_api_key or "").encode("utf-8")).hexdigest())
+    if judge_key not in verdict_judges:
+        verdict_judges[judge_key] = EnsembleJudge.mistral(
+            parse_verdict_winner, default_model=model, api_key=mistral_api_key
+        )
+    verdict = verdict_judges[judge_key].invoke(prompt)
+
+    print('LLM response', verdict)
+
+    result = extract_json(verdict.text) or {"winner": "", "reason": ""}
+    result["votes"] = verdict.votes
     print("LLM Verdict:", result)
     return  jsonify(result), 200
 
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Debate Coach
+Rewrites the losing side's prompt into a population of candidates and finds the best one
+with successive halving: every candidate gets a few debates against the champion, and only
+the most promising half goes on to more
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import os
+import re
+import sqlite3
+import sys
+import time
+
+from dotenv import load_dotenv
+from langchain.prompts import PromptTemplate
+from langchain_core.messages import AIMessage
+from langgraph_for_api import LangGraphDebateSystem, create_judge, create_llm
+from tournament import TOPICS, matchup_games
+
+# Verdicts are parsed with the shared debate engine's parser (prototypes/engine)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "engine"))
+from debate_engine import parse_winner
+
+JUDGE_CACHE_FILE = "coach_judge_cache.db"
+COACHED_PROMPTS_FILE = "coached_prompts.json"
+
+PROMPT_VARIABLES = {"point", "topic", "history"}
+
+# One direction per candidate, so the population doesn't collapse into near-copies
+REWRITE_FOCUSES = [
+    "back every claim with a concrete fact, number or example",
+    "rebut the opponent's strongest point before making your own",
+    "be shorter and sharper",
+    "appeal to what the judge values: clarity, evidence and logic",
+    "anticipate the opponent's next argument and pre-empt it",
+    "use a vivid comparison or analogy",
+    "stay strictly on the debate topic and avoid generalities",
+    "end with a one-line summary of why your side wins",
+]
+
+COACH_PROMPT = PromptTemplate.from_template(
+    "You are a debate coach. This debater prompt lost a debate:\n"
+    "---\n{prompt}\n---\n"
+    "The debate:\n{transcript}\n"
+    "The judge said: {verdict}\n\n"
+    "Rewrite the prompt so the debater wins next time. Focus: {focus}.\n"
+    "Keep the placeholders {{point}}, {{topic}} and {{history}} exactly as written. "
+    "Reply with the new prompt only."
+)
+
+class JudgeCache:
+    """Judge wrapper (an LLM or an ensemble) that answers a transcript it has already judged from SQLite.
+
+    The key is the full judge prompt (topic plus transcript), so a repeated
+    transcript is never judged twice, across runs too. Identical transcripts
+    judged at the same time share one request.
+    """
+
+    def __init__(self, judge, path=JUDGE_CACHE_FILE):
+        self.judge = judge
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("CREATE TABLE IF NOT EXISTS verdicts (key TEXT PRIMARY KEY, verdict TEXT NOT NULL)")
+        self.db.commit()
+        self.in_flight = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(prompt):
+        return hashlib.sha256(str(prompt).encode("utf-8")).hexdigest()
+
+    def _lookup(self, key):
+        row = self.db.execute("SELECT verdict FROM verdicts WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _store(self, key, verdict):
+        self.db.execute("INSERT OR REPLACE INTO verdicts (key, verdict) VALUES (?, ?)", (key, verdict))
+        self.db.commit()
+
+    def invoke(self, prompt):
+        key = self.key(prompt)
+        verdict = self._lookup(key)
+        if verdict is None:
+            self.misses += 1
+            verdict = self.judge.invoke(prompt).content
+            self._store(key, verdict)
+        else:
+            self.hits += 1
+        return AIMessage(content=verdict)
+
+    async def ainvoke(self, prompt):
+        key = self.key(prompt)
+        verdict = self._lookup(key)
+        if verdict is not None:
+            self.hits += 1
+            return AIMessage(content=verdict)
+        if key in self.in_flight:
+            self.hits += 1
+            return AIMessage(content=await asyncio.shield(self.in_flight[key]))
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self.in_flight[key] = future
+        try:
+            verdict = (await self.judge.ainvoke(prompt)).content
+            self._store(key, verdict)
+            future.set_result(verdict)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            del self.in_flight[key]
+        return AIMessage(content=verdict)
+
+    def close(self):
+        self.db.close()
+
+def valid_prompt(prompt):
+    """A rewrite is usable only if it keeps exactly the debater placeholders"""
+    try:
+        return set(PromptTemplate.from_template(prompt).input_variables) == PROMPT_VARIABLES
+    except Exception:
+        return False
+
+def clean_rewrite(text):
+    text = text.strip()
+    fenced = re.match(r"^```\w*\n(.*?)\n```$", text, re.DOTALL)
+    return fenced.group(1).strip() if fenced else text
+
+class Coach:
+    def __init__(self, topics=None, rounds=1, population=8, eta=2, base_games=2, concurrency=16,
+                 min_win_rate=0.55, judge_cache_file=JUDGE_CACHE_FILE):
+        self.topics = list(topics or TOPICS)
+        self.rounds = rounds
+        self.population = population
+        self.eta = eta  # keep the best 1/eta of the candidates at each rung
+        self.base_games = base_games  # debates per candidate at the first rung; multiplied by eta each rung
+        self.concurrency = concurrency
+        self.min_win_rate = min_win_rate  # a candidate must beat the champion this often to replace it
+        self.llm = create_llm()
+        self.rewrite_llm = create_llm(temperature=1.0)
+        # The configured judge (an ensemble when JUDGE_ENSEMBLE_SIZE > 1), behind the verdict cache
+        self.judge = JudgeCache(create_judge(self.llm), judge_cache_file)
+        self.semaphore = None
+        self.debates = 0
+
+    async def debate(self, game, prompts):
+        async with self.semaphore:
+            system = LangGraphDebateSystem(
+                game.topic, game.side_a_point, game.side_b_point, self.rounds,
+                llm=self.llm, judge_llm=self.judge,
+                prompts={"side_a": prompts[game.side_a_variant], "side_b": prompts[game.side_b_variant]}
+            )
+            try:
+                state = await system.arun_debate()
+            except Exception as e:
+                print(f"❌ Debate failed ({game.game_id}): {e}")
+                return None
+            self.debates += 1
+            history = state["history"] if isinstance(state, dict) else state.history
+            verdict = state["verdict"] if isinstance(state, dict) else state.verdict
+            winner = parse_winner(verdict)
+            return {
+                "game": game,
+                "history": history,
+                "verdict": verdict,
+                "winner_variant": {"side_a": game.side_a_variant, "side_b": game.side_b_variant}.get(winner),
+            }
+
+    async def find_loser(self):
+        """Debate with the default prompts until one debate has a winner; returns the loser's prompt and that debate"""
+        topic, side_a_point, side_b_point = self.topics[0]
+        system = LangGraphDebateSystem(topic, side_a_point, side_b_point, self.rounds, llm=self.llm, judge_llm=self.judge)
+        prompts = {side: system.prompts[side].template for side in ("side_a", "side_b")}
+        for game in matchup_games("opening", "side_a", "side_b", self.topics)[::2]:
+            result = await self.debate(game, prompts)
+            if result is None or result["winner_variant"] is None:
+                print(f"⚠️ Opening debate on {game.topic!r} had no winner; trying the next topic")
+                continue
+            loser = "side_b" if result["winner_variant"] == "side_a" else "side_a"
+            print(f"📉 {loser} lost the opening debate; coaching its prompt")
+            return prompts[loser], result
+        raise RuntimeError("No opening debate had a winner")
+
+    async def rewrite(self, prompt, lost_debate, focus):
+        message = COACH_PROMPT.format(
+            prompt=prompt,
+            transcript="\n".join(lost_debate["history"]),
+            verdict=lost_debate["verdict"],
+            focus=focus,
+        )
+        async with self.semaphore:
+            try:
+                response = await self.rewrite_llm.ainvoke(message)
+            except Exception as e:
+                print(f"⚠️ Rewrite failed: {e}")
+                return None
+        candidate = clean_rewrite(response.content)
+        return candidate if valid_prompt(candidate) else None
+
+    async def candidates(self, prompt, lost_debate):
+        """N rewrites generated concurrently; rewrites that lost a placeholder are dropped"""
+        focuses = [REWRITE_FOCUSES[i % len(REWRITE_FOCUSES)] for i in range(self.population)]
+        rewrites = await asyncio.gather(*(self.rewrite(prompt, lost_debate, focus) for focus in focuses))
+        unique = list(dict.fromkeys(rewrite for rewrite in rewrites if rewrite and rewrite != prompt))
+        print(f"✍️ {len(unique)}/{self.population} usable rewrites")
+        return {f"candidate_{i + 1}": rewrite for i, rewrite in enumerate(unique)}
+
+    async def successive_halving(self, champion, candidates):
+        """Debate candidates against the champion, halving the field each rung.
+
+        Results carry over between rungs: a survivor only plays the games
+        it hasn't played yet. A failed debate is dropped from the schedule
+        and the candidate's next game takes its place. Returns (best
+        candidate, its score, its results).
+        """
+        prompts = dict(candidates, champion=champion)
+        rungs = self.rung_count(len(candidates))
+        max_games = self.base_games * self.eta ** (rungs - 1)
+        repeats = math.ceil(max_games / (2 * len(self.topics)))
+        schedules = {name: matchup_games(f"coach_{name}", name, "champion", self.topics, repeats) for name in candidates}
+        results = {name: [] for name in candidates}
+        played = {name: 0 for name in candidates}  # schedule position, failed games included
+        alive = list(candidates)
+
+        for rung in range(rungs):
+            games = self.base_games * self.eta ** rung
+            print(f"\n🪜 Rung {rung + 1}/{rungs}: {len(alive)} candidates x {games} debates")
+            while True:
+                todo = []
+                for name in alive:
+                    needed = max(0, games - len(results[name]))
+                    batch = schedules[name][played[name]:played[name] + needed]
+                    played[name] += len(batch)
+                    todo += [(name, game) for game in batch]
+                if not todo:
+                    break
+                finished = await asyncio.gather(*(self.debate(game, prompts) for _, game in todo))
+                for (name, _), result in zip(todo, finished):
+                    if result is not None:
+                        results[name].append(result)
+
+            scores = {name: self.score(name, results[name]) for name in alive}
+            for name in sorted(alive, key=lambda n: -scores[n]):
+                decided = sum(r["winner_variant"] is not None for r in results[name])
+                print(f"   {name:<13} {scores[name]:.0%} vs champion over {decided}/{len(results[name])} decided debates")
+            keep = max(1, len(alive) // self.eta) if rung < rungs - 1 else 1
+            alive = sorted(alive, key=lambda n: -scores[n])[:keep]
+
+        best = alive[0]
+        return best, self.score(best, results[best]), results[best]
+
+    def rung_count(self, candidates):
+        """Rungs until one candidate is left when each keeps the best 1/eta"""
+        rungs = 0
+        while candidates > 1:
+            candidates = max(1, candidates // self.eta)
+            rungs += 1
+        return max(1, rungs)
+
+    @staticmethod
+    def score(name, results):
+        """Win rate against the champion over decided debates; an undecided verdict is neither a win nor a loss"""
+        decided = [r for r in results if r["winner_variant"] is not None]
+        if not decided:
+            return 0.0
+        return sum(r["winner_variant"] == name for r in decided) / len(decided)
+
+    async def run(self, generations=1, prompt=None):
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        start = time.perf_counter()
+        if prompt is None:
+            champion, lost_debate = await self.find_loser()
+        else:
+            champion = prompt
+            probe = matchup_games("opening", "champion", "champion", self.topics[:1])[0]
+            lost_debate = await self.debate(probe, {"champion": champion})
+            if lost_debate is None:
+                raise RuntimeError("The opening debate failed")
+        original = champion
+        exhaustive = 0
+
+        for generation in range(1, generations + 1):
+            print(f"\n🧬 GENERATION {generation}")
+            print(f"{'='*60}")
+            candidates = await self.candidates(champion, lost_debate)
+            if not candidates:
+                print("⚠️ No usable rewrites this generation")
+                continue
+            best, score, best_results = await self.successive_halving(champion, candidates)
+            exhaustive += len(candidates) * self.base_games * self.eta ** (self.rung_count(len(candidates)) - 1)
+
+            if score >= self.min_win_rate:
+                print(f"🏅 {best} beats the champion {score:.0%} of the time and becomes the new champion")
+                champion = candidates[best]
+                # Coach the new champion on a debate it lost, or its closest one
+                lost = [r for r in best_results if r["winner_variant"] not in (best, None)]
+                lost_debate = (lost or best_results)[0]
+            else:
+                print(f"🤝 Best candidate {best} only reached {score:.0%}; the champion stays")
+
+        wall = time.perf_counter() - start
+        print(f"\n📊 COACHING SUMMARY:")
+        print(f"{'='*60}")
+        print(f"🎙️ Debates run:       {self.debates} (evaluating every candidate fully: {exhaustive})")
+        print(f"⚖️ Judge calls:        {self.judge.misses} made, {self.judge.hits} answered from the cache")
+        print(f"⏱️ Wall time:          {wall:.1f}s")
+        print(f"\n🧠 Coached prompt{' (unchanged)' if champion == original else ''}:\n{champion}")
+        return {"original": original, "coached": champion, "debates": self.debates, "exhaustive_debates": exhaustive}
+
+def main():
+    parser = argparse.ArgumentParser(description="Coach the losing debater's prompt with successive halving")
+    parser.add_argument("--population", type=int, default=8, help="Candidate rewrites per generation")
+    parser.add_argument("--generations", type=int, default=1)
+    parser.add_argument("--eta", type=int, default=2, help="Keep 1/eta of the candidates per rung")
+    parser.add_argument("--base-games", type=int, default=2, help="Debates per candidate at the first rung")
+    parser.add_argument("--rounds", type=int, default=1, help="Debate rounds per game")
+    parser.add_argument("--concurrency", type=int, default=16, help="LLM requests in flight")
+    parser.add_argument("--min-win-rate", type=float, default=0.55)
+    parser.add_argument("--prompt", help="File with the prompt to coach (default: the loser of an opening debate)")
+    parser.add_argument("--topics", help="JSON file of [topic, side_a_point, side_b_point] lists")
+    parser.add_argument("--output", default=COACHED_PROMPTS_FILE,
+                        help="Where to write the original and coached prompts (usable as tournament --variants)")
+    args = parser.parse_args()
+
+    load_dotenv()
+    topics = None
+    if args.topics:
+        with open(args.topics, "r", encoding="utf-8") as f:
+            topics = json.load(f)
+    prompt = None
+    if args.prompt:
+        with open(args.prompt, "r", encoding="utf-8") as f:
+            prompt = f.read().strip()
+        if not valid_prompt(prompt):
+            parser.error("the prompt must use exactly the {point}, {topic} and {history} placeholders")
+
+    coach = Coach(topics, args.rounds, args.population, args.eta, args.base_games, args.concurrency, args.min_win_rate)
+    try:
+        result = asyncio.run(coach.run(args.generations, prompt))
+    finally:
+        coach.judge.close()
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"original": result["original"], "coached": result["coached"]}, f, indent=2, ensure_ascii=False)
+    print(f"💾 Prompts saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
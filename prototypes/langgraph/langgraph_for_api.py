@@ -1,30 +1,62 @@
 import os
+import sys
 from langchain.chat_models import ChatOpenAI
 from langchain.prompts import PromptTemplate
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, END
 from typing import Literal, List
 from pydantic import BaseModel, Field
 
+# Shared debate engine helpers (prototypes/engine): verdict parsing and the ensemble judge
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "engine"))
+from debate_engine import parse_winner
+from ensemble_judge import ENSEMBLE_SIZE, JUDGE_TEMPERATURE, ChatModelJudge, EnsembleJudge, judge_models
+
 class DebateState(BaseModel):
     history: List[str] = Field(default_factory=list)
     round: int = 0
     max_rounds: int = 2
     verdict: str = ""
 
+def create_llm(temperature=0.7, model="mistral-tiny"):
+    return ChatOpenAI(
+        openai_api_base=os.getenv("MISTRAL_OPENAI_API_BASE", "https://api.mistral.ai/v1"),
+        openai_api_key=os.getenv("MISTRAL_API_KEY"),
+        model=model,
+        temperature=temperature,
+    )
+
+_judge_llms = []
+
+def create_judge(llm):
+    """The debate's judge: ``llm`` itself unless JUDGE_ENSEMBLE_SIZE > 1 opts into an early-exit ensemble.
+
+    Ensemble members (one per JUDGE_MODELS entry, cycled) are created once
+    and shared by every debate in the process.
+    """
+    if ENSEMBLE_SIZE <= 1:
+        return llm
+    if not _judge_llms:
+        models = judge_models("mistral-tiny")
+        _judge_llms.extend(create_llm(JUDGE_TEMPERATURE, models[i % len(models)]) for i in range(ENSEMBLE_SIZE))
+    return EnsembleJudge(
+        [ChatModelJudge(judge_llm) for judge_llm in _judge_llms],
+        parse=parse_winner,
+    )
+
 class LangGraphDebateSystem:
-    def __init__(self, topic, side_a_point, side_b_point, rounds=2):
+    def __init__(self, topic, side_a_point, side_b_point, rounds=2, llm=None, prompts=None, judge_llm=None):
+        """``llm`` lets many debates share one client and ``judge_llm`` gives the
+        judge its own (by default ``create_judge``); ``prompts`` overrides the
+        side_a/side_b/judge templates (a string or a PromptTemplate)."""
         self.topic = topic
         self.side_a_point = side_a_point
         self.side_b_point = side_b_point
         self.rounds = rounds
 
         # Initialize LLM
-        self.llm = ChatOpenAI(
-            openai_api_base=os.getenv("MISTRAL_OPENAI_API_BASE", "https://api.mistral.ai/v1"),
-            openai_api_key=os.getenv("MISTRAL_API_KEY"),
-            model="mistral-tiny",
-            temperature=0.7,
-        )
+        self.llm = llm or create_llm()
+        self.judge_llm = judge_llm or create_judge(self.llm)
 
         # Define prompts
         self.prompts = {
@@ -52,27 +84,39 @@ class LangGraphDebateSystem:
                 "You are judging a debate on: {topic}.\n"
                 "Debate transcript:\n{transcript}\n"
                 "Provide your verdict in exactly this format:\n"
-                "VERDICT: The [winning side] argument is more convincing because [one clear reason]"
+                "VERDICT: The [winning side] argument is more convincing because [one clear reason]\n"
+                "WINNER: [side_a or side_b]\n"
+                "The WINNER line must be exactly side_a (Position A) or side_b (Position B)."
             )
         }
+        for name, prompt in (prompts or {}).items():
+            self.prompts[name] = PromptTemplate.from_template(prompt) if isinstance(prompt, str) else prompt
 
         # Build workflow graph
         self._build_workflow()
 
-    def _generate_response(self, state: DebateState, side: str) -> DebateState:
-        """Generate debate response for either side A or B"""
+    def _response_prompt(self, state: DebateState, side: str) -> str:
         history_str = "\n".join(state.history)
         point = self.side_a_point if side == "side_a" else self.side_b_point
 
-        msg = self.prompts[side].format(
+        return self.prompts[side].format(
             point=point,
             topic=self.topic,
             history=history_str
         )
-        response = self.llm.invoke(msg)
 
+    def _generate_response(self, state: DebateState, side: str) -> DebateState:
+        """Generate debate response for either side A or B"""
+        response = self.llm.invoke(self._response_prompt(state, side))
+        return self._add_response(state, side, response.content)
+
+    async def _agenerate_response(self, state: DebateState, side: str) -> DebateState:
+        response = await self.llm.ainvoke(self._response_prompt(state, side))
+        return self._add_response(state, side, response.content)
+
+    def _add_response(self, state: DebateState, side: str, content: str) -> DebateState:
         # Update state
-        new_history = state.history + [f"{side}: {response.content.strip()}"]
+        new_history = state.history + [f"{side}: {content.strip()}"]
         new_round = state.round + (1 if side == "side_b" else 0)
 
         return DebateState(
@@ -82,15 +126,24 @@ class LangGraphDebateSystem:
             verdict=state.verdict
         )
 
-    def _generate_verdict(self, state: DebateState) -> DebateState:
-        """Generate judge's verdict"""
+    def _verdict_prompt(self, state: DebateState) -> str:
         transcript = "\n".join(state.history)
-        msg = self.prompts["judge"].format(
+        return self.prompts["judge"].format(
             topic=self.topic,
             transcript=transcript
         )
-        verdict = self.llm.invoke(msg).content.strip()
 
+    def _generate_verdict(self, state: DebateState) -> DebateState:
+        """Generate judge's verdict"""
+        verdict = self.judge_llm.invoke(self._verdict_prompt(state)).content
+        return self._add_verdict(state, verdict)
+
+    async def _agenerate_verdict(self, state: DebateState) -> DebateState:
+        verdict = (await self.judge_llm.ainvoke(self._verdict_prompt(state))).content
+        return self._add_verdict(state, verdict)
+
+    def _add_verdict(self, state: DebateState, verdict: str) -> DebateState:
+        verdict = verdict.strip()
         return DebateState(
             history=state.history + [verdict],
             round=state.round,
@@ -99,10 +152,12 @@ class LangGraphDebateSystem:
         )
 
     def _build_workflow(self):
-        # Create node functions
-        def side_a_node(state): return self._generate_response(state, "side_a")
-        def side_b_node(state): return self._generate_response(state, "side_b")
-        def judge_node(state): return self._generate_verdict(state)
+        # Create node functions; each has an async twin so the graph also runs with ainvoke
+        side_a_node = RunnableLambda(lambda state: self._generate_response(state, "side_a"),
+                                     afunc=lambda state: self._agenerate_response(state, "side_a"))
+        side_b_node = RunnableLambda(lambda state: self._generate_response(state, "side_b"),
+                                     afunc=lambda state: self._agenerate_response(state, "side_b"))
+        judge_node = RunnableLambda(self._generate_verdict, afunc=self._agenerate_verdict)
 
         # Define round completion condition
         def should_continue_debate(state: DebateState) -> Literal["continue", "end"]:
@@ -126,8 +181,8 @@ class LangGraphDebateSystem:
 
         self.workflow = builder.compile()
 
-    def run_debate(self):
-        state = DebateState(
+    def initial_state(self):
+        return DebateState(
             history=[
                 f"Topic: {self.topic}",
                 f"Position A: {self.side_a_point}",
@@ -137,7 +192,13 @@ class LangGraphDebateSystem:
             max_rounds=self.rounds
         )
 
-        final_state = self.workflow.invoke(state)
+    def run_debate(self):
+        final_state = self.workflow.invoke(self.initial_state())
+        return final_state
+
+    async def arun_debate(self):
+        """Same as run_debate, without blocking the event loop while the LLM responds"""
+        final_state = await self.workflow.ainvoke(self.initial_state())
         return final_state
 
 if __name__ == "__main__":
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Debate Tournament
+Self-play round-robin and elimination brackets between debater prompt variants,
+with async debates inside each process and a process pool across cores
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from itertools import combinations
+
+from dotenv import load_dotenv
+from langgraph_for_api import LangGraphDebateSystem, create_llm
+
+# Verdicts are parsed with the shared debate engine's parser (prototypes/engine)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "engine"))
+from debate_engine import parse_winner
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Debater prompt variants; each needs {point}, {topic} and {history}
+VARIANTS = {
+    "baseline": (
+        "You are a passionate but professional debater arguing FOR: {point}.\n"
+        "Debate topic: {topic}\n"
+        "Context so far:\n{history}\n"
+        "Provide one clear, concise argument. Keep it under 2 sentences. Be persuasive but professional."
+        "Your argument:"
+    ),
+    "evidence": (
+        "You are a debater arguing FOR: {point}.\n"
+        "Debate topic: {topic}\n"
+        "Context so far:\n{history}\n"
+        "Give one argument built on a concrete fact, number or example. Keep it under 2 sentences."
+        "Your argument:"
+    ),
+    "rebuttal": (
+        "You are a debater arguing FOR: {point}.\n"
+        "Debate topic: {topic}\n"
+        "Context so far:\n{history}\n"
+        "Name the weakest point your opponent made and take it apart, then state why your side wins. "
+        "Keep it under 2 sentences."
+        "Your argument:"
+    ),
+    "concise": (
+        "Argue FOR: {point}. Topic: {topic}.\n"
+        "Context so far:\n{history}\n"
+        "Reply with a single sharp sentence."
+    ),
+}
+
+TOPICS = [
+    ("Should remote work be the standard?", "Remote work should be the standard employment model",
+     "Traditional office work should remain the standard"),
+    ("cats vs dogs", "cats are better pets", "dogs are better pets"),
+    ("bikes vs cars", "bikes are the best way to get around a city", "cars are the best way to get around a city"),
+]
+
+RESULTS_FILE = "tournament_results.parquet"
+
+@dataclass(frozen=True)
+class Game:
+    """One debate; the id is stable so a resumed tournament can skip finished games"""
+    game_id: str
+    stage: str
+    side_a_variant: str
+    side_b_variant: str
+    topic: str
+    side_a_point: str
+    side_b_point: str
+
+def matchup_games(stage, a, b, topics, repeats=1):
+    """Every topic with each variant on each side, so side bias cancels out"""
+    games = []
+    for repeat in range(repeats):
+        for index, (topic, side_a_point, side_b_point) in enumerate(topics):
+            for first, second in ((a, b), (b, a)):
+                games.append(Game(f"{stage}:{index}:{first}:{second}:{repeat}", stage,
+                                  first, second, topic, side_a_point, side_b_point))
+    return games
+
+def round_robin_games(variants, topics, repeats=1):
+    games = []
+    for a, b in combinations(variants, 2):
+        games.extend(matchup_games("round_robin", a, b, topics, repeats))
+    return games
+
+# Worker process state: one LLM client and one event loop, reused by every batch the process runs
+_variants = None
+_llm = None
+_loop = None
+
+def init_worker(variants):
+    global _variants, _llm, _loop
+    load_dotenv()
+    _variants = variants
+    _llm = create_llm()
+    _loop = asyncio.new_event_loop()
+
+async def play_game(game, rounds, semaphore):
+    async with semaphore:
+        start = time.perf_counter()
+        row = asdict(game)
+        row.update({"rounds": rounds, "pid": os.getpid()})
+        try:
+            system = LangGraphDebateSystem(
+                game.topic, game.side_a_point, game.side_b_point, rounds, llm=_llm,
+                prompts={"side_a": _variants[game.side_a_variant], "side_b": _variants[game.side_b_variant]}
+            )
+            state = await system.arun_debate()
+            verdict = state["verdict"] if isinstance(state, dict) else state.verdict
+            winner = parse_winner(verdict)
+            row.update({
+                "verdict": verdict,
+                "winner_side": winner,
+                "winner_variant": {"side_a": game.side_a_variant, "side_b": game.side_b_variant}.get(winner),
+                "error": None,
+            })
+        except Exception as e:
+            row.update({"verdict": None, "winner_side": None, "winner_variant": None, "error": f"{type(e).__name__}: {e}"})
+        row.update({"latency": time.perf_counter() - start, "finished_at": datetime.now().isoformat()})
+        return row
+
+def play_batch(games, rounds, concurrency):
+    """Run a batch of games concurrently on this process's event loop"""
+    async def run():
+        semaphore = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(*(play_game(game, rounds, semaphore) for game in games))
+    return _loop.run_until_complete(run())
+
+class Checkpoint:
+    """Append-only JSONL of finished games. Failed games are not kept, so they run again on resume"""
+
+    def __init__(self, path):
+        self.path = path
+        self.rows = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        row = json.loads(line)
+                        if not row.get("error"):
+                            self.rows[row["game_id"]] = row
+
+    def record(self, rows):
+        with open(self.path, "a", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+                if not row.get("error"):
+                    self.rows[row["game_id"]] = row
+            f.flush()
+            os.fsync(f.fileno())
+
+class Tournament:
+    def __init__(self, variants=None, topics=None, rounds=1, workers=None, concurrency=8,
+                 checkpoint_file="tournament_checkpoint.jsonl", results_file=RESULTS_FILE):
+        self.variants = dict(variants or VARIANTS)
+        self.topics = list(topics or TOPICS)
+        self.rounds = rounds
+        self.workers = os.cpu_count() if workers is None else workers  # 0 runs everything in this process
+        self.concurrency = concurrency  # debates in flight per process
+        self.checkpoint = Checkpoint(checkpoint_file)
+        self.results_file = results_file
+        self.pool = None
+        self.stats = []  # (stage, games played, skipped, seconds)
+
+    def __enter__(self):
+        if self.workers:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker, initargs=(self.variants,))
+        else:
+            init_worker(self.variants)
+        return self
+
+    def __exit__(self, *exc):
+        if self.pool:
+            self.pool.shutdown(wait=True)
+        self.write_results()
+
+    def play(self, games):
+        """Play the games not already in the checkpoint; returns the rows of all of them"""
+        stage = games[0].stage if games else ""
+        pending = [game for game in games if game.game_id not in self.checkpoint.rows]
+        skipped = len(games) - len(pending)
+        print(f"🎲 {stage}: {len(pending)} debates to play" + (f" ({skipped} restored from checkpoint)" if skipped else ""))
+        start = time.perf_counter()
+        batch_size = self.concurrency * 4
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        played = failed = 0
+        if self.pool:
+            futures = [self.pool.submit(play_batch, batch, self.rounds, self.concurrency) for batch in batches]
+            finished = (future.result() for future in as_completed(futures))
+        else:
+            finished = (play_batch(batch, self.rounds, self.concurrency) for batch in batches)
+        for rows in finished:
+            self.checkpoint.record(rows)
+            played += len(rows)
+            failed += sum(1 for row in rows if row["error"])
+            elapsed = time.perf_counter() - start
+            print(f"   {played}/{len(pending)} debates, {played / elapsed:.2f}/s" + (f", {failed} failed" if failed else ""))
+        self.stats.append((stage, played, skipped, time.perf_counter() - start))
+        return [self.checkpoint.rows[game.game_id] for game in games if game.game_id in self.checkpoint.rows]
+
+    def round_robin(self, repeats=1):
+        """Every variant against every other; returns the standings, best first"""
+        rows = self.play(round_robin_games(self.variants, self.topics, repeats))
+        standings = self.standings(rows)
+        print(f"\n🏆 ROUND ROBIN STANDINGS ({len(rows)} debates):")
+        print(f"{'='*60}")
+        for rank, (variant, record) in enumerate(standings, 1):
+            print(f"{rank}. {variant:<12} {record['wins']:>4} W {record['losses']:>4} L "
+                  f"{record['undecided']:>3} ?  win rate {record['win_rate']:.0%}")
+        decided = [row for row in rows if row["winner_side"]]
+        if decided:
+            side_a = sum(1 for row in decided if row["winner_side"] == "side_a") / len(decided)
+            print(f"⚖️ Judge picked side_a in {side_a:.0%} of decided debates")
+        return standings
+
+    def elimination(self, seeds=None, repeats=1):
+        """Single-elimination bracket; the higher seed goes through on a tie. Returns the champion"""
+        alive = list(seeds or self.variants)
+        bracket_round = 1
+        while len(alive) > 1:
+            # Top seed gets a bye when the field is odd
+            bye = alive.pop(0) if len(alive) % 2 else None
+            pairs = [(alive[i], alive[-1 - i]) for i in range(len(alive) // 2)]
+            stage = f"elimination_{bracket_round}"
+            games = [game for a, b in pairs for game in matchup_games(stage, a, b, self.topics, repeats)]
+            rows = self.play(games)
+            wins = defaultdict(int)
+            for row in rows:
+                if row["winner_variant"]:
+                    wins[row["winner_variant"]] += 1
+
+            print(f"\n🥊 ELIMINATION ROUND {bracket_round}:")
+            advancing = [bye] if bye else []
+            if bye:
+                print(f"   {bye} has a bye")
+            for a, b in pairs:
+                winner = a if wins[a] >= wins[b] else b
+                advancing.append(winner)
+                print(f"   {a} {wins[a]} - {wins[b]} {b}  ->  {winner}")
+            # Keep the seed order for the next round's pairing
+            alive = [variant for variant in (seeds or self.variants) if variant in advancing]
+            bracket_round += 1
+
+        champion = alive[0] if alive else None
+        print(f"\n👑 Champion: {champion}")
+        return champion
+
+    def standings(self, rows):
+        records = {variant: {"wins": 0, "losses": 0, "undecided": 0} for variant in self.variants}
+        for row in rows:
+            players = (row["side_a_variant"], row["side_b_variant"])
+            if not row["winner_variant"]:
+                for variant in players:
+                    records[variant]["undecided"] += 1
+                continue
+            for variant in players:
+                records[variant]["wins" if variant == row["winner_variant"] else "losses"] += 1
+        for record in records.values():
+            decided = record["wins"] + record["losses"]
+            record["win_rate"] = record["wins"] / decided if decided else 0.0
+        return sorted(records.items(), key=lambda item: (-item[1]["win_rate"], -item[1]["wins"]))
+
+    def write_results(self):
+        """Every finished debate as one row of a Parquet file (CSV without pyarrow)"""
+        rows = list(self.checkpoint.rows.values())
+        if not rows:
+            return
+        if PYARROW_AVAILABLE:
+            pq.write_table(pa.Table.from_pylist(rows), self.results_file, compression="zstd")
+            path = self.results_file
+        else:
+            import csv
+            path = os.path.splitext(self.results_file)[0] + ".csv"
+            print("⚠️ pyarrow not installed, writing CSV instead of Parquet. Run: pip install pyarrow")
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+                writer.writeheader()
+                writer.writerows(rows)
+        print(f"💾 {len(rows)} debates written to {path}")
+
+    def print_throughput(self):
+        rows = list(self.checkpoint.rows.values())
+        print(f"\n📊 THROUGHPUT ({self.workers or 1} processes x {self.concurrency} concurrent debates):")
+        print(f"{'='*60}")
+        llm_calls = 2 * self.rounds + 1
+        for stage, played, skipped, seconds in self.stats:
+            rate = played / seconds if seconds and played else 0.0
+            print(f"{stage:<15} {played:>5} debates in {seconds:7.1f}s  {rate:6.2f} debates/s  "
+                  f"{rate * llm_calls:6.1f} LLM calls/s" + (f"  ({skipped} from checkpoint)" if skipped else ""))
+        latencies = sorted(row["latency"] for row in rows)
+        if latencies:
+            p90 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.9))]
+            print(f"⏱️ Debate latency p50 {statistics.median(latencies):.1f}s, p90 {p90:.1f}s, max {latencies[-1]:.1f}s")
+
+def load_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def main():
+    parser = argparse.ArgumentParser(description="Self-play tournament between debater prompt variants")
+    parser.add_argument("--bracket", choices=["round-robin", "elimination", "both"], default="round-robin",
+                        help="both: round robin, then an elimination bracket seeded by its standings")
+    parser.add_argument("--variants", help="JSON file of {name: prompt template with {point}, {topic}, {history}}")
+    parser.add_argument("--topics", help="JSON file of [topic, side_a_point, side_b_point] lists")
+    parser.add_argument("--rounds", type=int, default=1, help="Debate rounds per game")
+    parser.add_argument("--repeats", type=int, default=1, help="Games per matchup, topic and side")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Processes (0: run in this process)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Debates in flight per process")
+    parser.add_argument("--checkpoint", default="tournament_checkpoint.jsonl")
+    parser.add_argument("--results", default=RESULTS_FILE)
+    parser.add_argument("--fresh", action="store_true", help="Ignore the checkpoint and start over")
+    args = parser.parse_args()
+
+    load_dotenv()
+    if args.fresh and os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+
+    tournament = Tournament(
+        variants=load_json(args.variants) if args.variants else None,
+        topics=load_json(args.topics) if args.topics else None,
+        rounds=args.rounds,
+        workers=args.workers,
+        concurrency=args.concurrency,
+        checkpoint_file=args.checkpoint,
+        results_file=args.results,
+    )
+    with tournament:
+        seeds = None
+        if args.bracket in ("round-robin", "both"):
+            seeds = [variant for variant, _ in tournament.round_robin(args.repeats)]
+        if args.bracket in ("elimination", "both"):
+            tournament.elimination(seeds, args.repeats)
+        tournament.print_throughput()
+
+if __name__ == "__main__":
+    main()